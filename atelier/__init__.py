@@ -1,19 +1,19 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/__init__.py                                                                #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 10:56:46 am                                                 #
-# Modified   : Thursday March 2nd 2023 10:57:06 am                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-from atelier.persistence.base import Asset
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/__init__.py                                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 10:56:46 am                                                 #
+# Modified   : Thursday March 2nd 2023 10:57:06 am                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+from atelier.persistence.base import Asset
@@ -1,82 +1,663 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/data/dataset.py                                                            #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 12:54:24 pm                                                 #
-# Modified   : Thursday March 2nd 2023 01:48:37 pm                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-from datetime import datetime
-from typing import Any
-
-from pympler.asizeof import asizeof
-
-from atelier import Asset
-
-
-# ------------------------------------------------------------------------------------------------ #
-class Dataset(Asset):
-    def __init__(self, name: str, description: str, data: Any) -> None:
-        super().__init__()
-        self._name = name
-        self._description = description
-        self._data = data
-        self._created = datetime.now()
-        self._added = None
-        self._modified = None
-        self._memory = None
-
-    @property
-    def name(self) -> str:
-        """Returns the name of the asset"""
-        return self._name
-
-    @property
-    def description(self) -> str:
-        """Returns the description of the asset"""
-        return self._description
-
-    @property
-    def created(self) -> str:
-        """Returns the datetime the asset was created."""
-        return self._created
-
-    @property
-    def added(self) -> str:
-        """Returns the datetime the asset was added to the repository."""
-        return self._added
-
-    @added.setter
-    def added(self, added: datetime) -> None:
-        """Updates the date added"""
-        self._added = added
-
-    @property
-    def modified(self) -> str:
-        """Returns the datetime the asset was modified."""
-        return self._modified
-
-    @modified.setter
-    def modified(self, modified: datetime) -> None:
-        """Updates the date modified."""
-        self._modified = modified
-
-    @property
-    def memory(self) -> int:
-        """Returns the size of memory consumed by the object."""
-        return asizeof(self)
-
-    # @memory.setter
-    # def memory(self, memory: int) -> None:
-    #     """Sets the memory consumed by object."""
-    #     self._memory = memory
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/data/dataset.py                                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 12:54:24 pm                                                 #
+# Modified   : Thursday March 2nd 2023 01:48:37 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+from __future__ import annotations
+from datetime import datetime
+import os
+from typing import Any, Callable, Iterable, Iterator
+
+import pandas as pd
+
+from atelier import Asset
+from atelier.data.dtypes import CATEGORY_RATIO, compact_dtypes
+from atelier.data.stats import can_match, column_stats, merge_stats, parquet_stats
+from atelier.utils.memory import estimate_size
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pads
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+
+# ------------------------------------------------------------------------------------------------ #
+FEATHER_EXTENSIONS = (".feather", ".arrow", ".ipc")
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Dataset(Asset):
+    """Dataset asset
+
+    Datasets obtained from a repository are lazy: their metadata is available immediately and
+    the data is loaded from the repository the first time it is accessed.
+
+    The memory a dataset consumes and the statistics of its columns are computed once, cached,
+    and stored with the dataset, so they're known without loading the data. Replacing the data
+    clears them; changes made to the data in place aren't seen.
+
+    Args:
+        name (str): The name of the dataset.
+        description (str): The description of the dataset.
+        data (Any): The payload, typically a pandas DataFrame.
+    """
+
+    def __init__(self, name: str, description: str, data: Any) -> None:
+        super().__init__()
+        self._name = name
+        self._description = description
+        self._data = data
+        self._created = datetime.now()
+        self._added = None
+        self._modified = None
+        self._memory = None
+        self._column_stats = None
+        self._loaded = True
+        self._loader = None
+
+    def __getstate__(self) -> dict:
+        """Loaders aren't pickled. A dataset pickled before its data is loaded loads it first."""
+        state = self.__dict__.copy()
+        if not self._loaded and self._loader is not None:
+            state["_data"] = self.data
+            state["_loaded"] = True
+        state["_loader"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state.setdefault("_column_stats", None)
+        state.setdefault("_loaded", True)
+        state.setdefault("_loader", None)
+        self.__dict__.update(state)
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the asset"""
+        return self._name
+
+    @property
+    def description(self) -> str:
+        """Returns the description of the asset"""
+        return self._description
+
+    @property
+    def created(self) -> str:
+        """Returns the datetime the asset was created."""
+        return self._created
+
+    @property
+    def added(self) -> str:
+        """Returns the datetime the asset was added to the repository."""
+        return self._added
+
+    @added.setter
+    def added(self, added: datetime) -> None:
+        """Updates the date added"""
+        self._added = added
+
+    @property
+    def modified(self) -> str:
+        """Returns the datetime the asset was modified."""
+        return self._modified
+
+    @modified.setter
+    def modified(self, modified: datetime) -> None:
+        """Updates the date modified."""
+        self._modified = modified
+
+    @property
+    def data(self) -> Any:
+        """Returns the data, loading it from the repository on first access."""
+        if not self._loaded and self._loader is not None:
+            self._data = self._loader()
+            self._loaded = True
+        return self._data
+
+    @data.setter
+    def data(self, data: Any) -> None:
+        """Replaces the data."""
+        self._data = data
+        self._loaded = True
+        self._memory = None
+        self._column_stats = None
+
+    @property
+    def payload(self) -> Any:
+        """Returns the data, which repositories store apart from the dataset's metadata."""
+        return self.data
+
+    @property
+    def is_loaded(self) -> bool:
+        """Returns False if the data has not been loaded from the repository."""
+        return self._loaded
+
+    @property
+    def memory(self) -> int:
+        """Returns the size of memory consumed by the object, including its data whether or not
+        the data is loaded. Estimated on first access and cached until the data is replaced."""
+        if self._memory is None:
+            excluded = ("_logger", "_loader", "_memory", "_column_stats")
+            self._memory = estimate_size(
+                {k: v for k, v in self.__dict__.items() if k not in excluded}
+            )
+        return self._memory
+
+    @property
+    def column_stats(self) -> dict:
+        """Returns the dtype, row count, null count, minimum, maximum and approximate distinct
+        count of each column of the data, computed on first access and cached until the data
+        is replaced. See atelier.data.stats. None if the data has no columns, or if it isn't
+        loaded and its statistics weren't stored with it."""
+        if self._column_stats is None and self._loaded:
+            self._column_stats = column_stats(self._data)
+        return self._column_stats
+
+    def compact(self, category_ratio: float = CATEGORY_RATIO) -> dict:
+        """Casts the columns of the data to smaller dtypes and returns the memory the dataset
+        consumed before and after, in bytes. See atelier.data.dtypes.compact_dtypes.
+
+        Args:
+            category_ratio (float): Largest ratio of distinct to non-null values of a string
+                column converted to a categorical. Defaults to CATEGORY_RATIO.
+        """
+        before = self.memory
+        data = self.data
+        compacted = compact_dtypes(data, category_ratio=category_ratio)
+        if compacted is not data:
+            self.data = compacted
+        return self._report(before)
+
+    def stub(self) -> Dataset:
+        """Returns a copy of the dataset without its data, recording the memory it consumes."""
+        stub = self.__class__.__new__(self.__class__)
+        stub.__dict__.update(self.__dict__)
+        stub._memory = self.memory
+        stub._column_stats = self.column_stats
+        stub._data = None
+        stub._loaded = self._loaded and self._data is None
+        stub._loader = None
+        return stub
+
+    def bind(self, loader: Callable[[], Any]) -> None:
+        """Binds a function that loads the data from the repository on first access."""
+        self._loader = loader
+
+    def detach(self, loader: Callable[[], Any] = None) -> None:
+        """Loads the data if it isn't loaded and unbinds the dataset from its repository, so it
+        keeps its data as datasets not obtained from a repository do. Given a loader, the
+        dataset is detached only if still bound to it."""
+        if loader is not None and self._loader is not loader:
+            return
+        self._data = self.data
+        self._loader = None
+
+    def release(self) -> None:
+        """Releases the loaded data. It is reloaded from the repository on next access.
+        Datasets not obtained from a repository keep their data."""
+        if self._loader is not None:
+            self._data = None
+            self._loaded = False
+
+    def _report(self, before: int) -> dict:
+        """Logs and returns the memory consumed before and after compaction."""
+        report = {"before": before, "after": self.memory}
+        self._logger.info(
+            f"Compacted dataset {self._name} from {report['before']} to {report['after']} bytes."
+        )
+        return report
+
+    # @memory.setter
+    # def memory(self, memory: int) -> None:
+    #     """Sets the memory consumed by object."""
+    #     self._memory = memory
+
+
+# ------------------------------------------------------------------------------------------------ #
+class PartitionedDataset(Dataset):
+    """Dataset whose data is a sequence of partitions, such as row groups or daily batches
+
+    Repositories store each partition separately. Datasets obtained from a repository load
+    partitions on demand: iter_chunks streams them one at a time and read loads only those
+    asked for. Appending a partition and updating the dataset in its repository writes the new
+    partition alone, so the dataset grows without rewriting or loading its history.
+
+    The statistics of each partition's columns are computed as it's appended, so partitions
+    that can't satisfy a filter are skipped by prune without loading them.
+
+    Partitions held in memory are pickled with the dataset; partitions only in the repository
+    are not, so a copy of a dataset obtained from a repository reads them through the
+    repository.
+
+    Args:
+        name (str): The name of the dataset.
+        description (str): The description of the dataset.
+        partitions (Iterable): The data of the initial partitions, typically pandas DataFrames,
+            in order. Partitions are named by position.
+    """
+
+    def __init__(self, name: str, description: str, partitions: Iterable = None) -> None:
+        super().__init__(name=name, description=description, data=None)
+        self._partitions = []
+        self._chunks = {}
+        self._unsaved = set()
+        self._partition_memory = {}
+        self._partition_stats = {}
+        for data in partitions or []:
+            self.append(data)
+
+    def __getstate__(self) -> dict:
+        """Loaders aren't pickled. Partitions not held in memory aren't loaded."""
+        state = self.__dict__.copy()
+        state["_loader"] = None
+        return state
+
+    @property
+    def partitions(self) -> list:
+        """Returns the names of the partitions, in order."""
+        return list(self._partitions)
+
+    @property
+    def data(self) -> Any:
+        """Returns the data of all partitions concatenated. See read."""
+        return self.read()
+
+    @data.setter
+    def data(self, data: Any) -> None:
+        """Replaces all partitions with one holding the data."""
+        self._partitions = []
+        self._chunks = {}
+        self._unsaved = set()
+        self._partition_memory = {}
+        self._partition_stats = {}
+        self._memory = None
+        self.append(data)
+
+    @property
+    def payload(self) -> Any:
+        """Partitioned datasets have no single payload; repositories store the partitions."""
+        return None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Returns False if any partition is held only in the repository."""
+        return all(partition in self._chunks for partition in self._partitions)
+
+    @property
+    def memory(self) -> int:
+        """Returns the size of memory consumed by the object, including the data of every
+        partition whether or not it is loaded. Partitions are measured as they're appended."""
+        if self._memory is None:
+            excluded = ("_logger", "_loader", "_memory", "_column_stats", "_chunks")
+            self._memory = estimate_size(
+                {k: v for k, v in self.__dict__.items() if k not in excluded}
+            ) + sum(self._partition_memory.values())
+        return self._memory
+
+    def append(self, data: Any, partition: str = None) -> str:
+        """Appends a partition and returns its name.
+
+        Args:
+            data (Any): The partition's data, typically a pandas DataFrame.
+            partition (str): The name of the partition, such as a date. Defaults to the
+                partition's position.
+        """
+        partition = partition or f"{len(self._partitions):06d}"
+        if partition in self._partition_memory:
+            msg = f"Partition {partition} already exists in dataset {self._name}."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        self._partitions.append(partition)
+        self._chunks[partition] = data
+        self._unsaved.add(partition)
+        self._partition_memory[partition] = estimate_size(data)
+        self._partition_stats[partition] = column_stats(data)
+        self._memory = None
+        return partition
+
+    @property
+    def column_stats(self) -> dict:
+        """Returns the statistics of each column over all partitions. Distinct counts are upper
+        bounds. See atelier.data.stats.merge_stats."""
+        return merge_stats(self._partition_stats[partition] for partition in self._partitions)
+
+    @property
+    def partition_stats(self) -> dict:
+        """Returns the statistics of each partition's columns, by partition name."""
+        return {partition: self._partition_stats[partition] for partition in self._partitions}
+
+    def prune(self, filters: list) -> list:
+        """Returns the names of the partitions whose statistics show they may hold rows
+        satisfying the filters, in order. See atelier.data.stats.can_match.
+
+        Example:
+            recent = events.read(partitions=events.prune([("timestamp", ">=", cutoff)]))
+        """
+        return [
+            partition
+            for partition in self._partitions
+            if can_match(self._partition_stats[partition], filters)
+        ]
+
+    def iter_chunks(self, partitions: Iterable[str] = None) -> Iterator[Any]:
+        """Yields the data of each partition in order, loading one partition at a time.
+        Partitions loaded from the repository aren't retained, so memory is bounded by the
+        chunks the caller holds on to.
+
+        Args:
+            partitions (Iterable): Names of the partitions to yield. Defaults to all.
+        """
+        for partition in self._select(partitions):
+            if partition in self._chunks:
+                yield self._chunks[partition]
+            else:
+                yield self._load(partition)
+
+    def read(self, partitions: Iterable[str] = None) -> Any:
+        """Returns the data of the named partitions, or all partitions, concatenated.
+
+        DataFrames and Series are concatenated with pandas and Arrow tables with pyarrow;
+        partitions of other types are returned as a list. Returns None if there are no
+        partitions.
+
+        Args:
+            partitions (Iterable): Names of the partitions to read. Defaults to all.
+        """
+        chunks = list(self.iter_chunks(partitions))
+        if not chunks:
+            return None
+        if all(isinstance(chunk, (pd.DataFrame, pd.Series)) for chunk in chunks):
+            return pd.concat(chunks)
+        if pa is not None and all(isinstance(chunk, pa.Table) for chunk in chunks):
+            return pa.concat_tables(chunks)
+        return chunks
+
+    def compact(self, category_ratio: float = CATEGORY_RATIO) -> dict:
+        """Casts the columns of partitions not yet stored to smaller dtypes and returns the
+        memory the dataset consumed before and after, in bytes. Stored partitions are kept as
+        stored. Partitions are compacted independently, so their dtypes may differ.
+
+        Args:
+            category_ratio (float): Largest ratio of distinct to non-null values of a string
+                column converted to a categorical. Defaults to CATEGORY_RATIO.
+        """
+        before = self.memory
+        for partition in self._unsaved:
+            data = compact_dtypes(self._chunks[partition], category_ratio=category_ratio)
+            self._chunks[partition] = data
+            self._partition_memory[partition] = estimate_size(data)
+            self._partition_stats[partition] = column_stats(data)
+        self._memory = None
+        return self._report(before)
+
+    def parts(self) -> dict:
+        """Returns the data of partitions not yet stored, by partition name."""
+        return {partition: self._chunks[partition] for partition in self._unsaved}
+
+    def stub(self) -> PartitionedDataset:
+        """Returns a copy of the dataset without its partitions' data."""
+        stub = self.__class__.__new__(self.__class__)
+        stub.__dict__.update(self.__dict__)
+        stub._memory = self.memory
+        stub._partitions = list(self._partitions)
+        stub._partition_memory = dict(self._partition_memory)
+        stub._partition_stats = dict(self._partition_stats)
+        stub._chunks = {}
+        stub._unsaved = set()
+        stub._loaded = False
+        stub._loader = None
+        return stub
+
+    def bind(self, loader: Callable[[str], Any]) -> None:
+        """Binds a function that loads a partition from the repository, given its name. The
+        partitions held are then stored in the repository."""
+        self._loader = loader
+        self._unsaved = set()
+
+    def detach(self, loader: Callable[[str], Any] = None) -> None:
+        """Loads the partitions held only in the repository and unbinds the dataset from it.
+        Every partition is then stored by the next repository the dataset is added to. Given
+        a loader, the dataset is detached only if still bound to it."""
+        if loader is not None and self._loader is not loader:
+            return
+        for partition in self._partitions:
+            if partition not in self._chunks:
+                self._chunks[partition] = self._load(partition)
+        self._unsaved = set(self._partitions)
+        self._loader = None
+
+    def release(self) -> None:
+        """Releases the data of partitions stored in the repository. They're reloaded on next
+        access. Partitions not yet stored are kept."""
+        if self._loader is not None:
+            self._chunks = {
+                partition: chunk
+                for partition, chunk in self._chunks.items()
+                if partition in self._unsaved
+            }
+
+    def _select(self, partitions: Iterable[str] = None) -> list:
+        """Returns the named partitions, or all partitions, validating the names."""
+        if partitions is None:
+            return list(self._partitions)
+        partitions = list(partitions)
+        unknown = [partition for partition in partitions if partition not in self._partition_memory]
+        if unknown:
+            msg = f"Partitions {unknown} not found in dataset {self._name}."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        return partitions
+
+    def _load(self, partition: str) -> Any:
+        """Loads a partition from the repository."""
+        if self._loader is None:
+            msg = (
+                f"Partition {partition} of dataset {self._name} isn't held in memory and the "
+                "dataset isn't bound to a repository."
+            )
+            self._logger.error(msg)
+            raise RuntimeError(msg)
+        return self._loader(partition)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class FileDataset(Dataset):
+    """Dataset backed by a Parquet or Feather file
+
+    The data stays in the file and is read through pyarrow. read loads only the columns and
+    rows asked for, so a job needing a few columns of a wide table reads only those, and a file
+    whose column statistics show no row can satisfy the filters isn't read at all. Repositories
+    store the dataset's metadata and the file's path, not its data, so the file must remain in
+    place.
+
+    The memory and column statistics of a Parquet file are taken from its footer without
+    reading the data. Feather files are scanned for them once, a record batch at a time.
+    Requires pyarrow.
+
+    Args:
+        name (str): The name of the dataset.
+        description (str): The description of the dataset.
+        filepath (str): The path of the Parquet or Feather file.
+        data (Any): Optional pandas DataFrame or Arrow table written to the file, replacing any
+            file there.
+        format (str): Either 'parquet' or 'feather'. Defaults to 'feather' for files ending in
+            '.feather', '.arrow' or '.ipc', and to 'parquet' otherwise.
+    """
+
+    def __init__(
+        self, name: str, description: str, filepath: str, data: Any = None, format: str = None
+    ) -> None:
+        super().__init__(name=name, description=description, data=None)
+        if pa is None:  # pragma: no cover
+            msg = "FileDataset requires pyarrow, which is not installed."
+            self._logger.error(msg)
+            raise ImportError(msg)
+        self._filepath = filepath
+        self._format = format or ("feather" if filepath.endswith(FEATHER_EXTENSIONS) else "parquet")
+        if self._format not in ("parquet", "feather"):
+            msg = f"File format {self._format} is not supported. Use 'parquet' or 'feather'."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        if data is not None:
+            self._write(data)
+
+    def __getstate__(self) -> dict:
+        """Data read from the file isn't pickled; it's read again on access."""
+        state = self.__dict__.copy()
+        state["_data"] = None
+        state["_loader"] = None
+        return state
+
+    @property
+    def filepath(self) -> str:
+        """Returns the path of the file holding the data."""
+        return self._filepath
+
+    @property
+    def format(self) -> str:
+        """Returns the file format, 'parquet' or 'feather'."""
+        return self._format
+
+    @property
+    def columns(self) -> list:
+        """Returns the names of the columns in the file, read from its schema."""
+        return self._dataset().schema.names
+
+    @property
+    def data(self) -> Any:
+        """Returns all the data as a DataFrame, read from the file on first access."""
+        if self._data is None:
+            self._data = self.read()
+        return self._data
+
+    @data.setter
+    def data(self, data: Any) -> None:
+        """Replaces the data, writing it to the file."""
+        self._write(data)
+
+    @property
+    def payload(self) -> Any:
+        """File datasets have no payload; repositories store the file's path."""
+        return None
+
+    @property
+    def memory(self) -> int:
+        """Returns the size of memory the data would consume once read, and the object's own,
+        measured on first access and cached until the data is replaced."""
+        if self._memory is None:
+            self._measure()
+        return self._memory
+
+    @property
+    def column_stats(self) -> dict:
+        """Returns the statistics of each column of the file, computed on first access and
+        cached until the data is replaced. See atelier.data.stats."""
+        if self._column_stats is None:
+            self._measure()
+        return self._column_stats
+
+    def read(self, columns: Iterable[str] = None, filters: list = None) -> pd.DataFrame:
+        """Reads the named columns of the rows satisfying the filters from the file.
+
+        Example:
+            features = dataset.read(columns=["age", "income"], filters=[("year", ">=", 2020)])
+
+        Args:
+            columns (Iterable): Names of the columns to read. Defaults to all.
+            filters (list): Conditions rows must satisfy, in pyarrow's form: a list of
+                (column, operator, value) conditions, all of which must hold, or a list of such
+                lists, any of which must hold. See atelier.data.stats.can_match.
+        """
+        columns = list(columns) if columns is not None else None
+        dataset = self._dataset()
+        unknown = [column for column in columns or [] if column not in dataset.schema.names]
+        if unknown:
+            msg = f"Columns {unknown} not found in dataset {self._name}."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        if filters and not can_match(self.column_stats, filters):
+            schema = (
+                dataset.schema
+                if columns is None
+                else pa.schema([dataset.schema.field(column) for column in columns])
+            )
+            return schema.empty_table().to_pandas()
+        expression = pq.filters_to_expression(filters) if filters else None
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+    def stub(self) -> FileDataset:
+        """Returns a copy of the dataset without data read from the file, recording its memory
+        and column statistics."""
+        stub = self.__class__.__new__(self.__class__)
+        stub.__dict__.update(self.__dict__)
+        stub._memory = self.memory
+        stub._column_stats = self.column_stats
+        stub._data = None
+        stub._loader = None
+        return stub
+
+    def compact(self, category_ratio: float = CATEGORY_RATIO) -> None:
+        """File datasets aren't compacted: the file is neither read nor rewritten."""
+        return None
+
+    def detach(self, loader: Callable[[], Any] = None) -> None:
+        """The data stays in the file; nothing is loaded."""
+
+    def release(self) -> None:
+        """Releases the data read from the file. It is read again on next access."""
+        self._data = None
+
+    def _dataset(self) -> Any:
+        return pads.dataset(
+            self._filepath, format="parquet" if self._format == "parquet" else "ipc"
+        )
+
+    def _write(self, data: Any) -> None:
+        """Writes the data to the file, clearing what was measured or read from it."""
+        table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data)
+        os.makedirs(os.path.dirname(os.path.abspath(self._filepath)), exist_ok=True)
+        if self._format == "parquet":
+            pq.write_table(table, self._filepath)
+        else:
+            feather.write_feather(table, self._filepath)
+        self._data = None
+        self._memory = None
+        self._column_stats = None
+
+    def _measure(self) -> None:
+        """Measures the memory and column statistics of the file. Parquet files are measured
+        from their footers, Feather files a record batch at a time."""
+        if self._format == "parquet":
+            metadata = pq.ParquetFile(self._filepath).metadata
+            nbytes = sum(
+                metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups)
+            )
+            stats = parquet_stats(self._filepath)
+        else:
+            batches, nbytes = [], 0
+            with pa.memory_map(self._filepath) as source:
+                reader = pa.ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    batch = reader.get_batch(i)
+                    batches.append(column_stats(pa.Table.from_batches([batch])))
+                    nbytes += batch.nbytes
+            stats = merge_stats(batches)
+        excluded = ("_logger", "_loader", "_memory", "_column_stats", "_data")
+        self._memory = nbytes + estimate_size(
+            {k: v for k, v in self.__dict__.items() if k not in excluded}
+        )
+        self._column_stats = stats
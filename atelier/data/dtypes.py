@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/data/dtypes.py                                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Dtype compaction for datasets"""
+from __future__ import annotations
+import logging
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+# ------------------------------------------------------------------------------------------------ #
+# String columns whose distinct values number at most CATEGORY_RATIO of their non-null values are
+# converted to categoricals; others to Arrow-backed strings.
+CATEGORY_RATIO = 0.5
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def compact_dtypes(data: Any, category_ratio: float = CATEGORY_RATIO) -> Any:
+    """Returns a pandas DataFrame or Series with its columns cast to smaller dtypes.
+
+    Integers are downcast to the smallest integer dtype of the same signedness holding their
+    values, and floats to float32 where no value changes. String columns with few distinct
+    values are converted to categoricals, and other string columns to Arrow-backed strings
+    when pyarrow is installed. Columns of other dtypes, and columns mixing strings with other
+    values, are kept. Values are unchanged, though missing strings converted to Arrow-backed
+    strings become pd.NA. Other data is returned as is.
+
+    Args:
+        data (Any): The data, typically a pandas DataFrame.
+        category_ratio (float): Largest ratio of distinct to non-null values of a string column
+            converted to a categorical. Defaults to CATEGORY_RATIO. Zero converts none.
+    """
+    if not 0 <= category_ratio <= 1:
+        msg = f"The category ratio must be between 0 and 1, not {category_ratio}."
+        logger.error(msg)
+        raise ValueError(msg)
+    if isinstance(data, pd.Series):
+        return _compact_column(data, category_ratio)
+    if isinstance(data, pd.DataFrame):
+        compacted = data.copy(deep=False)
+        for position in range(len(data.columns)):
+            column = data.iloc[:, position]
+            cast = _compact_column(column, category_ratio)
+            if cast is not column:
+                compacted.isetitem(position, cast)
+        return compacted
+    return data
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _compact_column(column: pd.Series, category_ratio: float) -> pd.Series:
+    """Returns the column cast to a smaller dtype, or the column itself if it's kept."""
+    dtype = column.dtype
+    if column.empty:
+        return column
+    if _is_string(column):
+        return _compact_strings(column, category_ratio)
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        return column
+    if dtype.kind in "iu":
+        cast = pd.to_numeric(column, downcast="integer" if dtype.kind == "i" else "unsigned")
+        return column if cast.dtype == dtype else cast
+    if dtype == np.float64:
+        with np.errstate(over="ignore"):
+            cast = column.astype(np.float32)
+        values = column.to_numpy()
+        if np.array_equal(cast.to_numpy(dtype=np.float64), values, equal_nan=True):
+            return cast
+        return column
+    return column
+
+
+def _is_string(column: pd.Series) -> bool:
+    """Returns True if the column's non-null values are all strings."""
+    if isinstance(column.dtype, pd.StringDtype):
+        return True
+    if pa is not None and isinstance(column.dtype, pd.ArrowDtype):
+        return pa.types.is_string(column.dtype.pyarrow_dtype) or pa.types.is_large_string(
+            column.dtype.pyarrow_dtype
+        )
+    return column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == "string"
+
+
+def _compact_strings(column: pd.Series, category_ratio: float) -> pd.Series:
+    """Returns a string column as a categorical if it has few distinct values, otherwise as
+    Arrow-backed strings. Columns already Arrow-backed with many distinct values are kept."""
+    values = column.count()
+    if values and column.nunique(dropna=True) <= category_ratio * values:
+        return column.astype("category")
+    if pa is None or _is_arrow(column.dtype):
+        return column
+    return column.astype(pd.StringDtype("pyarrow"))
+
+
+def _is_arrow(dtype: Any) -> bool:
+    """Returns True if the dtype holds its values in Arrow arrays."""
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage == "pyarrow"
+    return isinstance(dtype, pd.ArrowDtype)
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/data/stats.py                                                              #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Column statistics for datasets, and pruning by them"""
+from __future__ import annotations
+import logging
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+
+# ------------------------------------------------------------------------------------------------ #
+# Distinct counts are estimated with HyperLogLog using 2**PRECISION registers, a standard error of
+# about 1.04 / sqrt(2**PRECISION), or 3%. Memory is bounded by the registers however many distinct
+# values there are.
+PRECISION = 10
+# Values are hashed BLOCK_SIZE rows at a time, bounding the memory used on large columns.
+BLOCK_SIZE = 65536
+# Whether a condition may hold for some value between a column's minimum and maximum, by
+# operator, given the minimum, maximum and the condition's value.
+PREDICATES = {
+    "=": lambda low, high, value: low <= value <= high,
+    "==": lambda low, high, value: low <= value <= high,
+    "!=": lambda low, high, value: not low == high == value,
+    "<": lambda low, high, value: low < value,
+    "<=": lambda low, high, value: low <= value,
+    ">": lambda low, high, value: high > value,
+    ">=": lambda low, high, value: high >= value,
+    "in": lambda low, high, value: any(low <= item <= high for item in value),
+    "not in": lambda low, high, value: not (low == high and low in value),
+}
+OPERATORS = list(PREDICATES)
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def column_stats(data: Any) -> dict:
+    """Returns statistics for each column of a pandas DataFrame or Series, or an Arrow table.
+
+    The statistics of each column are its dtype, row count, null count, minimum, maximum, and
+    an approximate count of distinct values. The minimum and maximum are None for columns
+    without an ordering or without non-null values. The statistics of columns sharing a name
+    are combined, so no filter on the name is ruled out that either column may satisfy. Other
+    data has no columns; None is returned.
+    """
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    if isinstance(data, pd.DataFrame):
+        stats = {}
+        for position, name in enumerate(data.columns):
+            column = data.iloc[:, position]
+            _add_stats(
+                stats,
+                name,
+                {
+                    "dtype": str(column.dtype),
+                    "rows": len(data),
+                    "nulls": int(column.isna().sum()),
+                    "min": _extreme(column, "min"),
+                    "max": _extreme(column, "max"),
+                    "distinct": approx_distinct(column),
+                },
+            )
+        return stats
+    if pa is not None and isinstance(data, pa.Table):
+        stats = {}
+        for name, column in zip(data.column_names, data.columns):
+            try:
+                extremes = pc.min_max(column).as_py()
+            except (pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                extremes = {"min": None, "max": None}
+            _add_stats(
+                stats,
+                name,
+                {
+                    "dtype": str(column.type),
+                    "rows": len(column),
+                    "nulls": column.null_count,
+                    "min": extremes["min"],
+                    "max": extremes["max"],
+                    "distinct": pc.count_distinct(column).as_py(),
+                },
+            )
+        return stats
+    return None
+
+
+def parquet_stats(filepath: str) -> dict:
+    """Returns statistics for each column of a Parquet file from the statistics in its footer,
+    without reading the data. Minimums, maximums and null counts are None for columns whose row
+    groups lack them. Distinct counts are only known for single row group files that record
+    them."""
+    metadata = pq.ParquetFile(filepath).metadata
+    schema = metadata.schema.to_arrow_schema()
+    leaves = {metadata.schema.column(i).path: i for i in range(metadata.num_columns)}
+    stats = {}
+    for field in schema:
+        column = {
+            "dtype": str(field.type),
+            "rows": metadata.num_rows,
+            "nulls": None,
+            "min": None,
+            "max": None,
+            "distinct": None,
+        }
+        stats[field.name] = column
+        if field.name not in leaves:
+            continue
+        groups = [
+            metadata.row_group(r).column(leaves[field.name]).statistics
+            for r in range(metadata.num_row_groups)
+        ]
+        if not groups or any(group is None for group in groups):
+            continue
+        if all(group.has_null_count for group in groups):
+            column["nulls"] = sum(group.null_count for group in groups)
+        if all(group.has_min_max for group in groups):
+            column["min"] = min(group.min for group in groups)
+            column["max"] = max(group.max for group in groups)
+        if len(groups) == 1 and groups[0].has_distinct_count:
+            column["distinct"] = groups[0].distinct_count
+    return stats
+
+
+def approx_distinct(values: pd.Series) -> int:
+    """Estimates the number of distinct non-null values with HyperLogLog. Returns None for
+    values that can't be hashed."""
+    m = 1 << PRECISION
+    registers = np.zeros(m, dtype=np.int64)
+    count = 0
+    for start in range(0, len(values), BLOCK_SIZE):
+        block = values.iloc[start : start + BLOCK_SIZE].dropna()
+        if block.empty:
+            continue
+        try:
+            hashes = pd.util.hash_pandas_object(block, index=False).to_numpy()
+        except TypeError:
+            return None
+        index = (hashes >> np.uint64(64 - PRECISION)).astype(np.intp)
+        # The guard bit bounds the rank of hashes whose remaining bits are all zero.
+        rest = (hashes << np.uint64(PRECISION)) | np.uint64(1 << (PRECISION - 1))
+        rank = 64 - np.floor(np.log2(rest.astype(np.float64))).astype(np.int64)
+        np.maximum.at(registers, index, rank)
+        count += len(block)
+    if count == 0:
+        return 0
+    estimate = 0.7213 / (1 + 1.079 / m) * m * m / np.sum(np.exp2(-registers.astype(np.float64)))
+    zeros = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * np.log(m / zeros)
+    return int(min(round(estimate), count))
+
+
+def merge_stats(stats: Iterable[dict]) -> dict:
+    """Combines the column statistics of the parts of a dataset, such as its partitions.
+
+    Row and null counts are summed, and the minimum and maximum taken over the parts. Distinct
+    counts of parts can't be combined exactly; the sum, capped by the non-null rows, is an
+    upper bound. The dtype is that of the last part with the column.
+    """
+    merged = {}
+    for part in stats:
+        for column, column_stats in (part or {}).items():
+            if column not in merged:
+                merged[column] = dict(column_stats)
+                continue
+            current = merged[column]
+            current["dtype"] = column_stats["dtype"]
+            current["min"] = _combine(current["min"], column_stats["min"], min)
+            current["max"] = _combine(current["max"], column_stats["max"], max)
+            current["rows"] += column_stats["rows"]
+            current["nulls"] += column_stats["nulls"]
+            if current["distinct"] is None or column_stats["distinct"] is None:
+                current["distinct"] = None
+            else:
+                current["distinct"] = min(
+                    current["distinct"] + column_stats["distinct"],
+                    current["rows"] - current["nulls"],
+                )
+    return merged
+
+
+def can_match(stats: dict, filters: list) -> bool:
+    """Returns False if the column statistics show no row can satisfy the filters, True if some
+    may. Datasets and partitions that can't match may be skipped without loading them.
+
+    Filters take pyarrow's form: a list of (column, operator, value) conditions, all of which
+    must hold, or a list of such lists, any of which must hold. The operators are '=', '==',
+    '!=', '<', '<=', '>', '>=', 'in' and 'not in'. As in pyarrow, null values satisfy no
+    condition. Conditions on columns without statistics may match.
+
+    Example:
+        if can_match(repo.column_stats("sales"), [("region", "==", "EU"), ("amount", ">", 100)]):
+            sales = repo.get("sales")
+    """
+    if stats is None or not filters:
+        return True
+    groups = filters if isinstance(filters[0], list) else [filters]
+    return any(all(_may_satisfy(stats, *condition) for condition in group) for group in groups)
+
+
+def _may_satisfy(stats: dict, column: str, op: str, value: Any) -> bool:
+    if op not in OPERATORS:
+        msg = f"Unsupported filter operator {op}. Supported operators are {OPERATORS}."
+        logger.error(msg)
+        raise ValueError(msg)
+    if column not in stats:
+        return True
+    column_stats = stats[column]
+    if column_stats["rows"] == column_stats["nulls"]:
+        return False
+    low, high = column_stats["min"], column_stats["max"]
+    if low is None or high is None:
+        return True
+    try:
+        return PREDICATES[op](low, high, value)
+    except TypeError:
+        return True
+
+
+def _add_stats(stats: dict, name: Any, column: dict) -> None:
+    """Adds a column's statistics under its name, combining them with those of an earlier
+    column of the same name: the rows of either may be non-null and hold any of their values,
+    and if either has values without an ordering, the combined values have none. The distinct
+    count is an upper bound and the dtype is the last column's."""
+    if name not in stats:
+        stats[name] = column
+        return
+    current = stats[name]
+    unbounded = any(
+        part["min"] is None and part["rows"] > part["nulls"] for part in (current, column)
+    )
+    current["dtype"] = column["dtype"]
+    current["nulls"] = min(current["nulls"], column["nulls"])
+    current["min"] = None if unbounded else _combine(current["min"], column["min"], min)
+    current["max"] = None if unbounded else _combine(current["max"], column["max"], max)
+    if current["distinct"] is None or column["distinct"] is None:
+        current["distinct"] = None
+    else:
+        current["distinct"] += column["distinct"]
+
+
+def _extreme(values: pd.Series, how: str) -> Any:
+    """Returns the minimum or maximum of the values, or None if they have no ordering.
+    Unordered categoricals are compared by the values of the categories present."""
+    if isinstance(values.dtype, pd.CategoricalDtype) and not values.dtype.ordered:
+        values = pd.Series(values.cat.remove_unused_categories().cat.categories)
+    try:
+        extreme = getattr(values, how)()
+    except (TypeError, ValueError):
+        return None
+    if isinstance(extreme, np.generic):
+        extreme = extreme.item()
+    try:
+        return None if pd.isna(extreme) else extreme
+    except (TypeError, ValueError):
+        return None
+
+
+def _combine(current: Any, other: Any, how: Any) -> Any:
+    if current is None:
+        return other
+    if other is None:
+        return current
+    try:
+        return how(current, other)
+    except TypeError:
+        return None
@@ -1,41 +1,41 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/operator/base.py                                                           #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday December 29th 2022 09:17:54 pm                                             #
-# Modified   : Thursday December 29th 2022 09:19:25 pm                                             #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2022 John James                                                                 #
-# ================================================================================================ #
-from abc import ABC, abstractmethod
-import logging
-
-
-# ================================================================================================ #
-#                                    OPERATOR BASE CLASS                                           #
-# ================================================================================================ #
-class Operator(ABC):
-    """Operator Base Class"""
-    def __init__(self, *args, **kwargs) -> None:
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
-
-    def __str__(self) -> str:
-        return f"Operator Name: {self.__class__.__name__}, Module: {self.__module__}"
-
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__},{self.__module__}"
-
-    @abstractmethod
-    def execute(self, *args, **kwargs) -> None:
-        """Executes the operation."""
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/operator/base.py                                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday December 29th 2022 09:17:54 pm                                             #
+# Modified   : Thursday December 29th 2022 09:19:25 pm                                             #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2022 John James                                                                 #
+# ================================================================================================ #
+from abc import ABC, abstractmethod
+import logging
+
+
+# ================================================================================================ #
+#                                    OPERATOR BASE CLASS                                           #
+# ================================================================================================ #
+class Operator(ABC):
+    """Operator Base Class"""
+    def __init__(self, *args, **kwargs) -> None:
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    def __str__(self) -> str:
+        return f"Operator Name: {self.__class__.__name__}, Module: {self.__module__}"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__},{self.__module__}"
+
+    @abstractmethod
+    def execute(self, *args, **kwargs) -> None:
+        """Executes the operation."""
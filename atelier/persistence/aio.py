@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/aio.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Asyncio Facades for Repositories, Workspaces and Studios"""
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import logging
+import threading
+from typing import Any, Iterable
+
+from atelier.persistence.base import Asset, RepoABC
+from atelier.persistence.database import BatchResult
+from atelier.persistence.repo import Repo
+from atelier.persistence.studio import Studio
+from atelier.persistence.workspace import Workspace
+
+# ------------------------------------------------------------------------------------------------ #
+# Default number of worker threads. Storage work is mostly file I/O and decompression, which
+# release the GIL, so more threads than cores pay off.
+MAX_WORKERS = 16
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      ASYNC FACADE                                                #
+# ------------------------------------------------------------------------------------------------ #
+class AsyncFacade:
+    """Runs the blocking storage work of a repository, workspace or studio on a bounded thread
+    pool, so coroutines await it without blocking the event loop.
+
+    Each worker thread uses its own clone of the wrapped object, with its own database
+    connections; many reads run at once, while writes are serialized by the databases' locks.
+    Facades may share an executor; an executor created by the facade is shut down by close.
+
+    Args:
+        target (RepoABC): The repository, workspace or studio to wrap.
+        max_workers (int): Maximum worker threads. Ignored if an executor is given.
+        executor (ThreadPoolExecutor): Executor to run storage work on.
+    """
+
+    def __init__(
+        self, target: RepoABC, max_workers: int = MAX_WORKERS, executor: ThreadPoolExecutor = None
+    ) -> None:
+        self._target = target
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"atelier-{target.name}"
+        )
+        self._local = threading.local()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def name(self) -> str:
+        return self._target.name
+
+    @property
+    def location(self) -> str:
+        return self._target.location
+
+    @property
+    def target(self) -> RepoABC:
+        """Returns the wrapped object, for synchronous use."""
+        return self._target
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        return self._executor
+
+    async def __aenter__(self) -> AsyncFacade:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the executor if the facade created it, waiting for pending work."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def add(self, item: Any) -> Any:
+        return await self._run("add", item)
+
+    async def get(self, name: str) -> Any:
+        return await self._run("get", name)
+
+    async def getall(self) -> dict:
+        return await self._run("getall")
+
+    async def update(self, item: Any) -> Any:
+        return await self._run("update", item)
+
+    async def exists(self, name: str) -> bool:
+        return await self._run("exists", name)
+
+    async def remove(self, name: str) -> None:
+        return await self._run("remove", name)
+
+    async def _run(self, method: str, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(self._call, method, *args, **kwargs)
+        )
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        """Calls the method on the worker thread's clone of the target."""
+        target = getattr(self._local, "target", None)
+        if target is None:
+            target = self._target.clone()
+            self._local.target = target
+        return getattr(target, method)(*args, **kwargs)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       ASYNC REPO                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class AsyncRepo(AsyncFacade):
+    """Asyncio facade for a Repo.
+
+    Assets are returned with their payloads loaded, so that accessing them doesn't block the
+    event loop.
+
+    Example:
+        async with AsyncRepo(repo) as arepo:
+            datasets = await asyncio.gather(*(arepo.get(name) for name in names))
+
+    Args:
+        repo (Repo): The repository to wrap.
+        max_workers (int): Maximum worker threads. Ignored if an executor is given.
+        executor (ThreadPoolExecutor): Executor to run storage work on.
+    """
+
+    def __init__(
+        self, repo: Repo, max_workers: int = MAX_WORKERS, executor: ThreadPoolExecutor = None
+    ) -> None:
+        super().__init__(target=repo, max_workers=max_workers, executor=executor)
+
+    async def add_many(self, assets: Iterable[Asset]) -> BatchResult:
+        return await self._run("add_many", list(assets))
+
+    async def get_many(self, names: Iterable[str]) -> BatchResult:
+        return await self._run("get_many", list(names))
+
+    async def remove_many(self, names: Iterable[str]) -> BatchResult:
+        return await self._run("remove_many", list(names))
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        result = super()._call(method, *args, **kwargs)
+        if isinstance(result, Asset):
+            self._load(result)
+        elif isinstance(result, BatchResult):
+            for asset in result.items.values():
+                self._load(asset)
+        elif isinstance(result, dict):
+            for asset in result.values():
+                self._load(asset)
+        return result
+
+    def _load(self, asset: Any) -> None:
+        if isinstance(asset, Asset):
+            _ = asset.payload
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    ASYNC WORKSPACE                                               #
+# ------------------------------------------------------------------------------------------------ #
+class AsyncWorkspace(AsyncFacade):
+    """Asyncio facade for a Workspace.
+
+    Args:
+        workspace (Workspace): The workspace to wrap.
+        max_workers (int): Maximum worker threads. Ignored if an executor is given.
+        executor (ThreadPoolExecutor): Executor to run storage work on.
+    """
+
+    def __init__(
+        self,
+        workspace: Workspace,
+        max_workers: int = MAX_WORKERS,
+        executor: ThreadPoolExecutor = None,
+    ) -> None:
+        super().__init__(target=workspace, max_workers=max_workers, executor=executor)
+
+    async def get_repo(self, name: str) -> AsyncRepo:
+        """Returns the named repository wrapped in an AsyncRepo sharing this executor."""
+        return AsyncRepo(repo=await self.get(name), executor=self._executor)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      ASYNC STUDIO                                                #
+# ------------------------------------------------------------------------------------------------ #
+class AsyncStudio(AsyncFacade):
+    """Asyncio facade for a Studio.
+
+    Args:
+        studio (Studio): The studio to wrap.
+        max_workers (int): Maximum worker threads. Ignored if an executor is given.
+        executor (ThreadPoolExecutor): Executor to run storage work on.
+    """
+
+    def __init__(
+        self, studio: Studio, max_workers: int = MAX_WORKERS, executor: ThreadPoolExecutor = None
+    ) -> None:
+        super().__init__(target=studio, max_workers=max_workers, executor=executor)
+
+    async def get_workspace(self, name: str) -> AsyncWorkspace:
+        """Returns the named workspace wrapped in an AsyncWorkspace sharing this executor."""
+        return AsyncWorkspace(workspace=await self.get(name), executor=self._executor)
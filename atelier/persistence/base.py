@@ -1,127 +1,275 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/persistence/base.py                                                        #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 10:26:31 am                                                 #
-# Modified   : Thursday March 2nd 2023 02:16:02 pm                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-"""Interface Definitions for the Persistence Package"""
-from abc import ABC, abstractmethod
-from datetime import datetime
-import logging
-from typing import Any
-
-
-# ------------------------------------------------------------------------------------------------ #
-class Asset(ABC):  # pragma: no cover
-    def __init__(self) -> None:
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
-
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Returns the name of the asset"""
-
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Returns the description of the asset"""
-
-    @property
-    @abstractmethod
-    def created(self) -> str:
-        """Returns the datetime the asset was created."""
-
-    @property
-    @abstractmethod
-    def added(self) -> str:
-        """Returns the datetime the asset was added to the repository."""
-
-    @added.setter
-    @abstractmethod
-    def added(self, added: datetime) -> None:
-        """Updates the date added"""
-
-    @property
-    @abstractmethod
-    def modified(self) -> str:
-        """Returns the datetime the asset was modified."""
-
-    @modified.setter
-    @abstractmethod
-    def modified(self, modified: datetime) -> None:
-        """Updates the date modified."""
-
-    @property
-    @abstractmethod
-    def memory(self) -> str:
-        """Returns the amount of memory the object consumes in bytes."""
-
-    # @memory.setter
-    # @abstractmethod
-    # def memory(self, memory: int) -> None:
-    #     """Sets the size of memory the object consumes."""
-
-
-# ------------------------------------------------------------------------------------------------ #
-class RepoABC(ABC):  # pragma: no cover
-    def __init__(self) -> None:
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
-
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Returns the name of the repository."""
-
-    @property
-    @abstractmethod
-    def location(self) -> str:
-        """Returns the location (directory) in which the repository resides."""
-
-    @property
-    @abstractmethod
-    def size(self) -> str:
-        """Returns the size of the repository."""
-
-    @abstractmethod
-    def add(self, *args, **kwargs) -> Any:
-        """Adds an asset to the repository and returns it."""
-
-    @abstractmethod
-    def get(self, *args, **kwargs) -> Any:
-        """Obtains an item from the repository."""
-
-    @abstractmethod
-    def getall(self, *args, **kwargs) -> Any:
-        """Obtains all items from the repository."""
-
-    @abstractmethod
-    def update(self, *args, **kwargs) -> Any:
-        """Updates an existing item in the repository and returns it."""
-
-    @abstractmethod
-    def remove(self, *args, **kwargs) -> None:
-        """Removes an existing item from the repository."""
-
-    @abstractmethod
-    def exists(self, *args, **kwargs) -> bool:
-        """Returns True if hte named asset exists, False otherwise."""
-
-    @abstractmethod
-    def print(self) -> None:
-        """Prints the inventory of items."""
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/base.py                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 10:26:31 am                                                 #
+# Modified   : Thursday March 2nd 2023 02:16:02 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Interface Definitions for the Persistence Package"""
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+import logging
+import pickle
+from typing import Any, Callable, Iterator
+
+from atelier.persistence.metrics import Metrics
+
+# ------------------------------------------------------------------------------------------------ #
+# Key under which a repository's running total of size is held in its metadata database.
+# Reserved; not available as an asset name.
+SIZE_KEY = "__size__"
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Asset(ABC):  # pragma: no cover
+    def __init__(self) -> None:
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Returns the name of the asset"""
+
+    @property
+    @abstractmethod
+    def description(self) -> str:
+        """Returns the description of the asset"""
+
+    @property
+    @abstractmethod
+    def created(self) -> str:
+        """Returns the datetime the asset was created."""
+
+    @property
+    @abstractmethod
+    def added(self) -> str:
+        """Returns the datetime the asset was added to the repository."""
+
+    @added.setter
+    @abstractmethod
+    def added(self, added: datetime) -> None:
+        """Updates the date added"""
+
+    @property
+    @abstractmethod
+    def modified(self) -> str:
+        """Returns the datetime the asset was modified."""
+
+    @modified.setter
+    @abstractmethod
+    def modified(self, modified: datetime) -> None:
+        """Updates the date modified."""
+
+    @property
+    @abstractmethod
+    def memory(self) -> str:
+        """Returns the amount of memory the object consumes in bytes."""
+
+    @property
+    def payload(self) -> Any:
+        """Returns the payload repositories store apart from the asset's metadata. Assets
+        without a separable payload return None and are stored whole."""
+        return None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Returns False if the payload has not been loaded from the repository."""
+        return True
+
+    @property
+    def column_stats(self) -> dict:
+        """Returns statistics for each column of the payload, recorded by repositories so they
+        can be queried without loading it. Assets without columns return None."""
+        return None
+
+    @property
+    def partitions(self) -> list:
+        """Returns the names of the partitions repositories store the payload in, in order, for
+        assets whose payload is partitioned. Assets whose payload is stored whole return None."""
+        return None
+
+    def parts(self) -> dict:
+        """Returns the partitions of the payload not yet stored, by partition name."""
+        return {}
+
+    def compact(self, **kwargs) -> dict:
+        """Casts the payload to a more compact form and returns the memory the asset consumed
+        before and after, in bytes, as 'before' and 'after'. Assets that can't be compacted
+        return None."""
+        return None
+
+    def stub(self) -> Asset:
+        """Returns the asset as stored by repositories: its metadata without the payload."""
+        return self
+
+    def bind(self, loader: Callable[..., Any]) -> None:
+        """Binds a function that loads the payload from the repository on first access. For
+        partitioned assets, the function takes the name of the partition to load."""
+
+    def detach(self, loader: Callable[..., Any] = None) -> None:
+        """Loads the payload held only in the repository and unbinds the asset from it, so the
+        asset can be added to a repository as new. Given a loader, the asset is detached only
+        if still bound to it."""
+
+    # @memory.setter
+    # @abstractmethod
+    # def memory(self, memory: int) -> None:
+    #     """Sets the size of memory the object consumes."""
+
+
+# ------------------------------------------------------------------------------------------------ #
+class RepoABC(ABC):  # pragma: no cover
+    def __init__(self) -> None:
+        self._metrics = Metrics()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    def __setstate__(self, state: dict) -> None:
+        state.setdefault("_metrics", Metrics())
+        self.__dict__.update(state)
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Returns the name of the repository."""
+
+    @property
+    @abstractmethod
+    def location(self) -> str:
+        """Returns the location (directory) in which the repository resides."""
+
+    @property
+    @abstractmethod
+    def size(self) -> str:
+        """Returns the size of the repository."""
+
+    @abstractmethod
+    def recompute_size(self) -> int:
+        """Recomputes the size from scratch, replacing the running total, and returns it."""
+
+    @property
+    def logical_size(self) -> int:
+        """Returns the bytes stored, counting every stored payload in full as if none were
+        shared."""
+        db_bytes, refs = self._storage()
+        return db_bytes + sum(ref.size for ref in refs)
+
+    @property
+    def physical_size(self) -> int:
+        """Returns the bytes on disk, counting each deduplicated blob once."""
+        db_bytes, refs = self._storage()
+        return db_bytes + sum({ref.key: ref.size for ref in refs}.values())
+
+    @abstractmethod
+    def add(self, *args, **kwargs) -> Any:
+        """Adds an asset to the repository and returns it."""
+
+    @abstractmethod
+    def get(self, *args, **kwargs) -> Any:
+        """Obtains an item from the repository."""
+
+    @abstractmethod
+    def getall(self, *args, **kwargs) -> Any:
+        """Obtains all items from the repository."""
+
+    @abstractmethod
+    def update(self, *args, **kwargs) -> Any:
+        """Updates an existing item in the repository and returns it."""
+
+    @abstractmethod
+    def remove(self, *args, **kwargs) -> None:
+        """Removes an existing item from the repository."""
+
+    @abstractmethod
+    def exists(self, *args, **kwargs) -> bool:
+        """Returns True if hte named asset exists, False otherwise."""
+
+    @abstractmethod
+    def print(self) -> None:
+        """Prints the inventory of items."""
+
+    def open_session(self) -> None:
+        """Holds the underlying database connections open across calls until closed."""
+        for db in self._databases():
+            db.open_session()
+
+    def flush(self) -> None:
+        """Writes pending changes through to disk without ending the session."""
+        for db in self._databases():
+            db.flush()
+
+    def close_session(self) -> None:
+        """Ends the session opened by open_session, closing the database connections."""
+        for db in self._databases():
+            db.close_session()
+
+    @contextmanager
+    def session(self) -> Iterator[RepoABC]:
+        """Context manager holding the database connection open for the duration of the block.
+
+        Example:
+            with repo.session():
+                for asset in assets:
+                    if not repo.exists(asset.name):
+                        repo.add(asset)
+        """
+        self.open_session()
+        try:
+            yield self
+        finally:
+            self.close_session()
+
+    def compact(self) -> int:
+        """Rewrites the databases backing the repository without the space held by updated and
+        removed items. Returns the bytes reclaimed."""
+        reclaimed = sum(db.compact() for db in self._databases())
+        self._logger.info(f"Compacted {self.name}, reclaiming {reclaimed} bytes.")
+        return reclaimed
+
+    def stats(self) -> dict:
+        """Returns the latencies of the repository's operations, the bytes read and written,
+        and the stats of each database backing it, as recorded in this process. Latencies are
+        in seconds. Report periodically with a MetricsReporter.
+
+        Example:
+            with MetricsReporter(source=repo, interval=60, filepath="stats.json"):
+                run_job(repo)
+        """
+        databases = {db.name: db.stats() for db in self._databases()}
+        counters = [stats["counters"] for stats in databases.values()]
+        return {
+            "name": self.name,
+            "operations": self._metrics.stats()["latency"],
+            "bytes_read": sum(counter.get("bytes_read", 0) for counter in counters),
+            "bytes_written": sum(counter.get("bytes_written", 0) for counter in counters),
+            "databases": databases,
+        }
+
+    def clone(self) -> RepoABC:
+        """Returns a copy of the repository with its own database connections. Database
+        connections can't be shared between threads; each thread should use its own clone."""
+        return pickle.loads(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _databases(self) -> list:
+        """Returns the databases backing the repository."""
+        return [self._db]
+
+    def _storage(self) -> tuple:
+        """Returns the bytes on disk of the databases and the blob references held."""
+        return sum(db.disk_usage for db in self._databases()), []
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/blob.py                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Blob Store Module"""
+from __future__ import annotations
+from dataclasses import dataclass
+import hashlib
+import io
+import logging
+import os
+import pickle
+import uuid
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from atelier.persistence.factory import DatabaseFactory
+from atelier.persistence.io import IOService
+from atelier.persistence.metrics import Metrics
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        BLOB REF                                                  #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass(frozen=True)
+class BlobRef:
+    """Reference to a payload stored as a file in a blob store.
+
+    Args:
+        key (str): The file name of the blob within the store.
+        format (str): The file format. One of 'pkl5', 'parquet', 'npy' or 'pkl'.
+        size (int): The size of the file in bytes.
+    """
+
+    key: str
+    format: str
+    size: int
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       BLOB STORE                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class BlobStore:
+    """Stores large payloads as content-addressed, reference-counted files in a directory.
+
+    Each payload is keyed by a hash of its content, so identical payloads are written once no
+    matter how many assets, repositories or workspaces store them. A reference count per blob
+    tracks how many stored payloads point to it, and the file is deleted when the count drops
+    to zero. Blob stores may be shared, such as by all repositories in a studio.
+
+    Numeric NumPy arrays are written as .npy, DataFrames in the frame format, and anything
+    else as a protocol 5 pickle with out-of-band buffers (.pkl5). Array data in .npy and .pkl5
+    files is written straight from memory and memory-mapped on read, so storing or loading a
+    payload doesn't need a second copy of it in RAM. Payloads that can't be written in their
+    preferred format fall back to a plain pickle.
+
+    Args:
+        location (str): The directory holding the blob files.
+        engine (str): Storage engine for the reference count database.
+        frame_format (str): Format for DataFrames. Either 'pkl5' (default) or 'parquet', which
+            is smaller on disk and readable by other tools but is copied on write and read.
+    """
+
+    def __init__(self, location: str, engine: str = "shelve", frame_format: str = "pkl5") -> None:
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+        if frame_format not in ("pkl5", "parquet"):
+            msg = f"Frame format {frame_format} is not supported."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        self._location = location
+        self._frame_format = frame_format
+        self._refcounts = DatabaseFactory.database(
+            name="refcounts", filepath=os.path.join(location, "refcounts.db"), engine=engine
+        )
+        self._metrics = Metrics()
+
+    @property
+    def location(self) -> str:
+        return self._location
+
+    def put(self, data: Any) -> BlobRef:
+        """Stores the payload, writing it only if no identical payload is stored, and returns
+        its reference."""
+        fmt = self._format(data)
+        digest = self._digest(data)
+        with self._refcounts as db:
+            ref = self._find(db, digest)
+            if ref is None:
+                ref = self._write(digest, fmt, data)
+                db.insert(key=digest, value={"ref": ref, "count": 1})
+            else:
+                record = db.select(key=digest)
+                record["count"] += 1
+                db.update(key=digest, value=record)
+        return ref
+
+    def get(self, ref: BlobRef) -> Any:
+        """Reads the payload for the reference. Arrays are memory-mapped copy-on-write."""
+        self._metrics.count("bytes_read", ref.size)
+        with self._metrics.time("read"):
+            if ref.format == "npy":
+                return IOService.read(filepath=self.filepath(ref.key), mmap_mode="c")
+            return IOService.read(filepath=self.filepath(ref.key))
+
+    def delete(self, ref: BlobRef) -> None:
+        """Releases a reference to the blob, deleting the file when no references remain."""
+        digest = self._key_digest(ref.key)
+        with self._refcounts as db:
+            if not db.exists(key=digest):
+                self._logger.warning(f"Blob {ref.key} has no references in {self._location}.")
+                return
+            record = db.select(key=digest)
+            record["count"] -= 1
+            if record["count"] > 0:
+                db.update(key=digest, value=record)
+                return
+            db.delete(key=digest)
+            self._remove(ref.key)
+
+    def exists(self, ref: BlobRef) -> bool:
+        return os.path.exists(self.filepath(ref.key))
+
+    def refcount(self, ref: BlobRef) -> int:
+        """Returns the number of stored payloads referencing the blob."""
+        with self._refcounts.reading() as db:
+            digest = self._key_digest(ref.key)
+            return db.select(key=digest)["count"] if db.exists(key=digest) else 0
+
+    def stats(self) -> dict:
+        """Returns the counters and latencies of blob reads and writes, with those of the
+        reference count database."""
+        stats = self._metrics.stats()
+        stats["refcounts"] = self._refcounts.stats()
+        return stats
+
+    def compact(self) -> int:
+        """Compacts the reference count database, returning the bytes reclaimed."""
+        return self._refcounts.compact()
+
+    def filepath(self, key: str) -> str:
+        return os.path.join(self._location, key)
+
+    def _find(self, db: Any, digest: str) -> BlobRef:
+        """Returns the reference for a stored blob with the digest, or None."""
+        if db.exists(key=digest):
+            return db.select(key=digest)["ref"]
+        return None
+
+    def _write(self, digest: str, fmt: str, data: Any) -> BlobRef:
+        """Writes the blob file, falling back to pickle if the preferred format fails. The file
+        is written under a temporary name and renamed into place once complete."""
+        try:
+            return self._write_file(digest, fmt, data)
+        except Exception as e:
+            if fmt == "pkl":
+                raise
+            self._logger.debug(f"Unable to write payload as {fmt}, falling back to pickle. {e}")
+            return self._write_file(digest, "pkl", data)
+
+    def _write_file(self, digest: str, fmt: str, data: Any) -> BlobRef:
+        key = f"{digest}.{fmt}"
+        temp = f"tmp-{uuid.uuid4().hex}.{fmt}"
+        try:
+            with self._metrics.time("write"):
+                IOService.write(filepath=self.filepath(temp), data=data)
+                os.replace(self.filepath(temp), self.filepath(key))
+        finally:
+            if os.path.exists(self.filepath(temp)):
+                os.remove(self.filepath(temp))
+        ref = BlobRef(key=key, format=fmt, size=os.path.getsize(self.filepath(key)))
+        self._metrics.count("bytes_written", ref.size)
+        return ref
+
+    def _format(self, data: Any) -> str:
+        if isinstance(data, pd.DataFrame):
+            return self._frame_format
+        if isinstance(data, np.ndarray) and data.dtype != object:
+            return "npy"
+        return "pkl5"
+
+    def _digest(self, data: Any) -> str:
+        """Returns a hash of the payload's content.
+
+        DataFrames are hashed column by column along with their index, the labels and dtypes of
+        the columns, the index dtype, the names of the index and columns, and attrs. Labels are
+        hashed with their types, so a column labelled 1 differs from one labelled "1". Numeric
+        arrays are hashed from their buffers. Anything else is hashed from its protocol 5
+        pickle, with out-of-band buffers hashed in place rather than copied into the stream.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(type(data).__name__.encode())
+        try:
+            if isinstance(data, pd.DataFrame):
+                columns = [(type(c).__qualname__, repr(c), str(t)) for c, t in data.dtypes.items()]
+                names = (list(data.index.names), list(data.columns.names))
+                h.update(repr((columns, str(data.index.dtype), names, data.attrs)).encode())
+                self._hash_values(h, data.index)
+                for _, column in data.items():
+                    self._hash_values(h, column)
+                return h.hexdigest()
+            if isinstance(data, np.ndarray) and data.dtype != object:
+                h.update(repr((data.dtype.str, data.shape)).encode())
+                h.update(np.ascontiguousarray(data).view(np.uint8))
+                return h.hexdigest()
+        except TypeError:
+            self._logger.debug("Unable to hash payload content directly; hashing its pickle.")
+            h = hashlib.blake2b(digest_size=16)
+            h.update(type(data).__name__.encode())
+        buffers = []
+        h.update(pickle.dumps(data, protocol=5, buffer_callback=buffers.append))
+        for buffer in buffers:
+            h.update(buffer)
+        return h.hexdigest()
+
+    def _hash_values(self, h: Any, values: Any) -> None:
+        """Hashes an index or column without copying numeric data. String columns are hashed
+        from their vectorized hashes and missing-value mask. Other values, such as objects and
+        categories, are hashed from their pickle, which keeps each value's type: vectorized
+        hashes hash objects by their string form, so 1 and "1" would hash alike."""
+        if isinstance(values, pd.RangeIndex):
+            h.update(repr(values).encode())
+        elif isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufcmM":
+            h.update(np.ascontiguousarray(values.to_numpy()).view(np.uint8))
+        elif isinstance(values.dtype, pd.StringDtype):
+            h.update(pd.util.hash_pandas_object(values, index=False).to_numpy())
+            h.update(values.isna().to_numpy())
+        else:
+            stream = io.BytesIO()
+            pickler = pickle.Pickler(stream, protocol=5)
+            # Without the memo, equal values pickle alike whether or not they share objects.
+            pickler.fast = True
+            pickler.dump(values if isinstance(values, pd.Index) else values.array)
+            h.update(stream.getbuffer())
+
+    def _key_digest(self, key: str) -> str:
+        return key.split(".")[0]
+
+    def _remove(self, key: str) -> None:
+        try:
+            os.remove(self.filepath(key))
+        except FileNotFoundError:
+            self._logger.warning(f"Blob {key} was not found in {self._location}.")
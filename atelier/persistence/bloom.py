@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/bloom.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Bloom Filter Module"""
+from __future__ import annotations
+import hashlib
+import logging
+import math
+import os
+import struct
+from typing import Iterable
+
+# ------------------------------------------------------------------------------------------------ #
+# Header of a filter file: magic, bit count, hash count, keys added and capacity.
+MAGIC = b"ATBLOOM1"
+HEADER = struct.Struct("<8sQIQQ")
+# Smallest capacity, in keys, for which a filter is sized, and the target false positive rate.
+MIN_CAPACITY = 1024
+ERROR_RATE = 0.01
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      BLOOM FILTER                                                #
+# ------------------------------------------------------------------------------------------------ #
+class BloomFilter:
+    """Bloom filter of a database's keys, persisted to a file next to the database.
+
+    The filter answers whether a key may be in the database. A negative answer is certain, so
+    a lookup of a missing key is answered without opening the database. The filter is sized
+    for its capacity at the target error rate; keys of deleted objects remain in it, and the
+    false positive rate climbs as more keys than its capacity are added, until it is rebuilt
+    from the live keys.
+
+    Like the key index, the filter is loaded on first use, reloaded only if its file has
+    changed, and written atomically. Before the first key is added in a connection, a
+    '.dirty' marker is created next to the file, and it is removed once the filter is saved.
+    A filter whose marker remains may be missing keys written since it was saved, by a writer
+    still connected or one that died, so it isn't loaded, and writers rebuild it.
+
+    Args:
+        filepath (str): Path to the filter file.
+        error_rate (float): Target false positive rate at capacity. Defaults to 1%.
+    """
+
+    def __init__(self, filepath: str, error_rate: float = ERROR_RATE) -> None:
+        self._filepath = filepath
+        self._error_rate = error_rate
+        self._bits = None
+        self._size = 0
+        self._hashes = 0
+        self._count = 0
+        self._capacity = 0
+        self._signature = None
+        self._dirty = False
+        self._marked = False
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def loaded(self) -> bool:
+        return self._bits is not None
+
+    @property
+    def overfull(self) -> bool:
+        """Returns True if more keys have been added than the filter was sized for."""
+        return self._count > self._capacity
+
+    @property
+    def fpr(self) -> float:
+        """Returns the expected false positive rate for the keys added."""
+        if not self.loaded:
+            return 1.0
+        return (1 - math.exp(-self._hashes * self._count / self._size)) ** self._hashes
+
+    def __getstate__(self) -> dict:
+        """The filter is reloaded from its file after unpickling."""
+        return {"_filepath": self._filepath, "_error_rate": self._error_rate}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(filepath=state["_filepath"], error_rate=state["_error_rate"])
+
+    def __contains__(self, key: str) -> bool:
+        """Returns False if the key is certainly not in the filter, True if it may be. A filter
+        not loaded may contain any key."""
+        if not self.loaded:
+            return True
+        bits = self._bits
+        return all(bits[i >> 3] & (1 << (i & 7)) for i in self._positions(key))
+
+    def load(self) -> bool:
+        """Loads the filter from its file, unless unchanged since last loaded. Returns False if
+        there is no readable filter file, discarding any filter loaded before, which may be
+        stale."""
+        signature = self._stat()
+        if signature is None or os.path.exists(self._marker):
+            self._unload()
+            return False
+        if signature == self._signature and self.loaded:
+            return True
+        try:
+            with open(self._filepath, "rb") as f:
+                data = f.read()
+            magic, size, hashes, count, capacity = HEADER.unpack_from(data)
+        except (OSError, struct.error) as e:
+            self._logger.warning(f"Unable to read Bloom filter {self._filepath}. {e}")
+            self._unload()
+            return False
+        if magic != MAGIC or len(data) != HEADER.size + (size + 7) // 8:
+            self._logger.warning(f"Bloom filter {self._filepath} is corrupt.")
+            self._unload()
+            return False
+        self._bits = bytearray(data[HEADER.size :])
+        self._size, self._hashes, self._count, self._capacity = size, hashes, count, capacity
+        self._signature = signature
+        self._dirty = False
+        return True
+
+    def rebuild(self, keys: Iterable[str], count: int) -> None:
+        """Replaces the filter with one of the keys given, sized for twice their number.
+
+        Args:
+            keys (Iterable): The database's keys.
+            count (int): The number of keys.
+        """
+        self._logger.debug(f"Rebuilding Bloom filter {self._filepath} for {count} keys.")
+        self._allocate(max(MIN_CAPACITY, 2 * count))
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: str) -> None:
+        """Adds the key. Call before writing the key to the database."""
+        if not self.loaded:
+            return
+        self._mark()
+        for i in self._positions(key):
+            self._bits[i >> 3] |= 1 << (i & 7)
+        self._count += 1
+        self._dirty = True
+
+    def clear(self) -> None:
+        self._mark()
+        self._allocate(MIN_CAPACITY)
+
+    def save(self) -> None:
+        """Writes the filter if it has changed, replacing the file atomically, and removes the
+        dirty marker."""
+        if self._dirty and self.loaded:
+            temp = f"{self._filepath}.tmp"
+            with open(temp, "wb") as f:
+                f.write(HEADER.pack(MAGIC, self._size, self._hashes, self._count, self._capacity))
+                f.write(self._bits)
+            os.replace(temp, self._filepath)
+            self._signature = self._stat()
+            self._dirty = False
+        if os.path.exists(self._marker):
+            os.remove(self._marker)
+        self._marked = False
+
+    def stats(self) -> dict:
+        """Returns the filter's size, keys added, capacity and expected false positive rate."""
+        return {
+            "bits": self._size,
+            "hashes": self._hashes,
+            "count": self._count,
+            "capacity": self._capacity,
+            "fpr": self.fpr,
+        }
+
+    @property
+    def _marker(self) -> str:
+        return f"{self._filepath}.dirty"
+
+    def _unload(self) -> None:
+        """Discards the loaded filter; until it's loaded or rebuilt, any key may be contained."""
+        self._bits = None
+        self._signature = None
+        self._dirty = False
+
+    def _mark(self) -> None:
+        """Creates the dirty marker, once per connection."""
+        if not self._marked:
+            open(self._marker, "w").close()
+            self._marked = True
+
+    def _allocate(self, capacity: int) -> None:
+        """Sizes an empty filter for the capacity at the error rate."""
+        size = math.ceil(-capacity * math.log(self._error_rate) / math.log(2) ** 2)
+        self._size = size
+        self._hashes = max(1, round(size / capacity * math.log(2)))
+        self._bits = bytearray((size + 7) // 8)
+        self._count = 0
+        self._capacity = capacity
+        self._dirty = True
+
+    def _positions(self, key: str) -> Iterable[int]:
+        """Yields the key's bit positions by double hashing one 128-bit digest."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._hashes):
+            yield (h1 + i * h2) % self._size
+
+    def _stat(self) -> tuple:
+        try:
+            stat = os.stat(self._filepath)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/cache.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Object Cache Module"""
+from __future__ import annotations
+from collections import OrderedDict
+import logging
+import threading
+from typing import Any
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      OBJECT CACHE                                                #
+# ------------------------------------------------------------------------------------------------ #
+class ObjectCache:
+    """In-process least-recently-used cache bounded by a byte budget.
+
+    Each entry is charged the size given when it is stored. When the total exceeds the
+    capacity, least recently used entries are evicted until it fits. Objects larger than the
+    capacity are not cached. Cached objects are shared with callers, not copied.
+
+    Args:
+        capacity (int): The byte budget for cached objects.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def size(self) -> int:
+        """Returns the bytes currently charged to the cache."""
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __getstate__(self) -> dict:
+        """Cached objects are process-local. A pickled cache carries its capacity only."""
+        return {"_capacity": self._capacity}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(capacity=state["_capacity"])
+
+    def get(self, key: str) -> Any:
+        """Returns the cached object, or None on a miss."""
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: str, value: Any, size: int) -> None:
+        """Caches an object, evicting least recently used entries to stay within capacity.
+
+        Args:
+            key (str): The object's key.
+            value (Any): The object to cache.
+            size (int): The bytes to charge for the object.
+        """
+        with self._lock:
+            self._discard(key)
+            if size > self._capacity:
+                self._logger.debug(
+                    f"Object {key} of {size} bytes exceeds the cache capacity of "
+                    f"{self._capacity} bytes and was not cached."
+                )
+                return
+            while self._size + size > self._capacity:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+                self._evictions += 1
+            self._entries[key] = (value, size)
+            self._size += size
+
+    def invalidate(self, key: str) -> None:
+        """Removes an object from the cache, if present."""
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        """Removes all objects from the cache. Counters are retained."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """Returns the cache counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "capacity": self._capacity,
+                "size": self._size,
+                "objects": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
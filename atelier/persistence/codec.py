@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/codec.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Compression Codecs for Stored Values"""
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import logging
+import lzma
+import pickle
+import zlib
+from typing import Any
+
+try:  # pragma: no cover
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:  # pragma: no cover
+    import lz4.frame
+except ImportError:  # pragma: no cover
+    lz4 = None
+
+# ------------------------------------------------------------------------------------------------ #
+# Encoded values begin with MAGIC, followed by a byte giving the length of the codec name and the
+# name itself. Pickles begin with the PROTO opcode (0x80), so values written without a codec,
+# including those written before codecs existed, are never mistaken for encoded values.
+MAGIC = b"ATC"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          CODEC                                                   #
+# ------------------------------------------------------------------------------------------------ #
+class Codec(ABC):
+    """Compresses and decompresses serialized values."""
+
+    name = None
+
+    @property
+    def available(self) -> bool:
+        """Returns False if the library the codec requires is not installed."""
+        return True
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Returns the compressed data."""
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Returns the decompressed data."""
+
+
+# ------------------------------------------------------------------------------------------------ #
+class NoCodec(Codec):
+    """Stores values as plain pickles."""
+
+    name = "none"
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ZlibCodec(Codec):
+    name = "zlib"
+
+    def __init__(self, level: int = 6) -> None:
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class LzmaCodec(Codec):
+    name = "lzma"
+
+    def __init__(self, preset: int = 6) -> None:
+        self._preset = preset
+
+    def compress(self, data: bytes) -> bytes:
+        return lzma.compress(data, preset=self._preset)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lzma.decompress(data)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ZstdCodec(Codec):
+    """Zstandard compression. Requires the zstandard package."""
+
+    name = "zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        self._level = level
+
+    @property
+    def available(self) -> bool:
+        return zstandard is not None
+
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=self._level).compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Lz4Codec(Codec):
+    """LZ4 frame compression. Requires the lz4 package."""
+
+    name = "lz4"
+
+    @property
+    def available(self) -> bool:
+        return lz4 is not None
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4.frame.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lz4.frame.decompress(data)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      CODEC FACTORY                                               #
+# ------------------------------------------------------------------------------------------------ #
+class CodecFactory:
+    """Returns codecs by name.
+
+    Codecs:
+        none: Plain pickles. The default.
+        zlib: Standard library zlib. Moderate ratio and speed.
+        lzma: Standard library LZMA. Highest ratio, slowest.
+        zstd: Zstandard, when the zstandard package is installed. High ratio and fast.
+        lz4: LZ4, when the lz4 package is installed. Fastest, lower ratio.
+    """
+
+    __codecs = {
+        "none": NoCodec(),
+        "zlib": ZlibCodec(),
+        "lzma": LzmaCodec(),
+        "zstd": ZstdCodec(),
+        "lz4": Lz4Codec(),
+    }
+    _logger = logging.getLogger(
+        f"{__module__}.{__name__}",
+    )
+
+    @classmethod
+    def codec(cls, name: str) -> Codec:
+        """Returns the codec, raising ValueError if it is unknown or its library isn't installed.
+
+        Args:
+            name (str): The name of the codec.
+        """
+        try:
+            codec = cls.__codecs[name]
+        except KeyError:
+            msg = f"Codec {name} is not supported."
+            cls._logger.error(msg)
+            raise ValueError(msg)
+        if not codec.available:
+            msg = f"Codec {name} requires a package that is not installed."
+            cls._logger.error(msg)
+            raise ValueError(msg)
+        return codec
+
+    @classmethod
+    def available(cls) -> list:
+        """Returns the names of the codecs that can be used in this environment."""
+        return [name for name, codec in cls.__codecs.items() if codec.available]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def encode(value: Any, codec: Codec) -> bytes:
+    """Pickles and compresses the value, recording the codec in a header."""
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if codec.name == NoCodec.name:
+        return data
+    name = codec.name.encode()
+    return MAGIC + bytes([len(name)]) + name + codec.compress(data)
+
+
+def decode(data: bytes) -> Any:
+    """Returns the value encoded by encode, using the codec recorded with it. Values without a
+    header are read as plain pickles."""
+    if data[: len(MAGIC)] != MAGIC:
+        return pickle.loads(data)
+    start = len(MAGIC) + 1
+    end = start + data[len(MAGIC)]
+    codec = CodecFactory.codec(data[start:end].decode())
+    return pickle.loads(codec.decompress(data[end:]))
@@ -1,61 +1,340 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/persistence/database.py                                                    #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 05:48:49 am                                                 #
-# Modified   : Thursday March 2nd 2023 03:35:21 pm                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-from abc import ABC, abstractmethod
-from typing import Any
-import logging
-
-
-# ------------------------------------------------------------------------------------------------ #
-#                                       DATABASE                                                  #
-# ------------------------------------------------------------------------------------------------ #
-class Database(ABC):  # pragma: no cover
-    """Abstract Base Class for Database"""
-
-    def __init__(self) -> None:
-        self._logger = logging.getLogger(
-            f"{self.__module__}.{self.__class__.__name__}",
-        )
-
-    @abstractmethod
-    def connect(self) -> None:
-        """Connects to the database."""
-
-    @abstractmethod
-    def close(self) -> None:
-        """Closes the underlying database connection."""
-
-    @abstractmethod
-    def insert(self, key: str, value: Any) -> None:
-        """Inserts a key/value pair into the database."""
-
-    @abstractmethod
-    def select(self, key: str) -> Any:
-        """Retrieves data from the database"""
-
-    @abstractmethod
-    def update(self, key: str, value: Any) -> None:
-        """Updates an existing object in the database."""
-
-    @abstractmethod
-    def delete(self, key: str) -> None:
-        """Deletes existing data."""
-
-    @abstractmethod
-    def exists(self, key: str) -> bool:
-        """Checks existence of an item in the database."""
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/database.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 05:48:49 am                                                 #
+# Modified   : Thursday March 2nd 2023 03:35:21 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator
+import logging
+import os
+
+from atelier.persistence.codec import CodecFactory, decode, encode
+from atelier.persistence.metrics import Metrics
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      BATCH RESULT                                                #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class BatchResult:
+    """Outcome of a batch operation.
+
+    Args:
+        items (dict): Keys processed successfully, mapped to their values. Values are None for
+            deletions.
+        errors (dict): Keys that failed, mapped to the exception describing the failure.
+    """
+
+    items: dict = field(default_factory=dict)
+    errors: dict = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Returns True if every key in the batch succeeded."""
+        return len(self.errors) == 0
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SCAN PAGE                                                  #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class ScanPage:
+    """A page of keys from an ordered scan.
+
+    Args:
+        keys (list): The keys in the page, in order.
+        next (str): The key to pass as 'after' to fetch the next page. None on the last page.
+    """
+
+    keys: list = field(default_factory=list)
+    next: str = None
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       DATABASE                                                  #
+# ------------------------------------------------------------------------------------------------ #
+class Database(ABC):  # pragma: no cover
+    """Abstract Base Class for Database
+
+    By default, each context block opens the connection on entry and closes it on exit. Within
+    a session, the connection is opened once and held open across context blocks until the
+    session is closed, which amortizes the open/close cost over many calls.
+
+    Context blocks using the database itself connect for reading and writing; blocks using
+    reading() connect for reads only, which lets engines that lock admit concurrent readers.
+
+    Values are pickled and compressed with the database's codec. The codec is recorded with
+    each value, so values written with other codecs, or with none, are still read correctly.
+
+    Each database object records counters and latency histograms for its connections,
+    operations, pickling and unpickling, and the bytes it reads and writes, reported by stats.
+
+    Args:
+        name (str): The name of the database.
+        filepath (str): Path to the file backing the database.
+        codec (str): Compression codec for values written. One of 'none' (default), 'zlib',
+            'lzma', or 'zstd' and 'lz4' when installed.
+    """
+
+    def __init__(self, name: str, filepath: str, codec: str = "none") -> None:
+        self._name = name
+        self._filepath = filepath
+        self._codec = CodecFactory.codec(codec)
+        self._is_connected = False
+        self._connection = None
+        self._session_depth = 0
+        self._metrics = Metrics()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def codec(self) -> str:
+        return self._codec.name
+
+    @property
+    def is_connected(self) -> bool:
+        return self._is_connected
+
+    @property
+    def in_session(self) -> bool:
+        return self._session_depth > 0
+
+    @property
+    def disk_usage(self) -> int:
+        """Returns the bytes on disk of the files backing the database, including any files
+        the engine keeps alongside the database file, such as journals."""
+        directory, basename = os.path.split(self._filepath)
+        if not os.path.isdir(directory):
+            return 0
+        return sum(
+            os.path.getsize(os.path.join(directory, filename))
+            for filename in os.listdir(directory)
+            if filename.startswith(basename)
+        )
+
+    def __enter__(self):
+        if not (self.in_session and self._is_connected):
+            self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._is_connected and not self.in_session:
+            self.close()
+        if exc_type is not None:
+            self._logger.error(f"\nExecution Type: {exc_type}")
+            self._logger.error(f"\nExecution Value: {exc_value}")
+            self._logger.error(f"\nTraceback: {traceback}")
+
+    def __getstate__(self) -> dict:
+        """Open handles can't be pickled; the connection is re-established on next use."""
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_is_connected"] = False
+        state["_session_depth"] = 0
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state.setdefault("_metrics", Metrics())
+        self.__dict__.update(state)
+
+    def stats(self) -> dict:
+        """Returns the counters and latency statistics recorded by this database object.
+        Latencies are in seconds."""
+        return self._metrics.stats()
+
+    def open_session(self) -> None:
+        """Opens a session, holding the connection open until the session is closed.
+
+        Sessions may be nested; the connection is closed when the outermost session closes.
+        """
+        if not self._is_connected:
+            self.connect()
+        self._session_depth += 1
+
+    def close_session(self) -> None:
+        """Closes the session. The connection is closed when the outermost session ends."""
+        if self._session_depth > 0:
+            self._session_depth -= 1
+        if self._session_depth == 0 and self._is_connected:
+            self.close()
+
+    @contextmanager
+    def session(self) -> Iterator[Database]:
+        """Context manager holding the connection open for the duration of the block."""
+        self.open_session()
+        try:
+            yield self
+        finally:
+            self.close_session()
+
+    def might_contain(self, key: str) -> bool:
+        """Returns False if the key is certainly not in the database, without connecting.
+        Engines without a way to rule keys out return True; check exists to be sure."""
+        return True
+
+    @contextmanager
+    def reading(self) -> Iterator[Database]:
+        """Context manager connecting for reads only for the duration of the block. Within a
+        session, the session's connection is used."""
+        if self.in_session and self._is_connected:
+            yield self
+            return
+        self.connect(readonly=True)
+        try:
+            yield self
+        finally:
+            if self._is_connected and not self.in_session:
+                self.close()
+
+    def scan(
+        self,
+        prefix: str = None,
+        start: str = None,
+        end: str = None,
+        limit: int = None,
+        after: str = None,
+    ) -> ScanPage:
+        """Returns keys in order, without reading their objects.
+
+        Args:
+            prefix (str): Only keys starting with the prefix.
+            start (str): Only keys at or after start.
+            end (str): Only keys before end.
+            limit (int): Maximum keys per page. None returns all keys in one page.
+            after (str): Only keys after this key. Pass the previous page's next to paginate.
+        """
+        lower = max([bound for bound in (prefix, start) if bound is not None], default="")
+        page = ScanPage()
+        for key in self._ordered_keys(lower=lower, after=after):
+            if (end is not None and key >= end) or (prefix and not key.startswith(prefix)):
+                break
+            if limit is not None and len(page.keys) == limit:
+                page.next = page.keys[-1]
+                break
+            page.keys.append(key)
+        return page
+
+    @abstractmethod
+    def connect(self, readonly: bool = False) -> None:
+        """Connects to the database.
+
+        Args:
+            readonly (bool): Whether the connection is used for reads only.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Writes pending changes through to storage without closing the connection."""
+
+    @abstractmethod
+    def insert(self, key: str, value: Any) -> None:
+        """Inserts a key/value pair into the database."""
+
+    @abstractmethod
+    def insert_many(self, items: dict) -> BatchResult:
+        """Inserts many key/value pairs, reporting per-key failures."""
+
+    @abstractmethod
+    def select(self, key: str) -> Any:
+        """Retrieves data from the database"""
+
+    @abstractmethod
+    def select_many(self, keys: Iterable[str]) -> BatchResult:
+        """Retrieves many objects, reporting per-key failures."""
+
+    @abstractmethod
+    def selectall(self) -> dict:
+        """Retrieves all data from the database"""
+
+    @abstractmethod
+    def iter_keys(self, where: Callable[[str], bool] = None) -> Iterator[str]:
+        """Yields the keys in the database, optionally only those for which where is True."""
+
+    @abstractmethod
+    def iter_items(self, where: Callable[[str], bool] = None) -> Iterator[tuple]:
+        """Yields (key, object) pairs one at a time, optionally only for keys for which where
+        is True. Objects are loaded as they are yielded, so only one is held at a time. The
+        connection must remain open while iterating."""
+
+    @abstractmethod
+    def update(self, key: str, value: Any) -> None:
+        """Updates an existing object in the database."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Deletes existing data."""
+
+    @abstractmethod
+    def delete_many(self, keys: Iterable[str]) -> BatchResult:
+        """Deletes many objects, reporting per-key failures."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Checks existence of an item in the database."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Deletes all objects in the database."""
+
+    @abstractmethod
+    def compact(self) -> int:
+        """Rewrites the live objects into fresh storage, discarding space left by updated and
+        deleted objects. The database must not be connected. Returns the bytes reclaimed."""
+
+    @abstractmethod
+    def garbage(self) -> int:
+        """Returns an estimate of the bytes on disk held by updated and deleted objects."""
+
+    @abstractmethod
+    def _ordered_keys(self, lower: str = "", after: str = None) -> Iterator[str]:
+        """Yields keys in order, from lower inclusive, and strictly after the key given."""
+
+    def _log_batch(self, operation: str, result: BatchResult) -> None:
+        """Logs a summary of the keys that failed in a batch operation."""
+        if not result.ok:
+            self._logger.warning(
+                f"Batch {operation} on database {self._name}: {len(result.items)} succeeded, "
+                f"{len(result.errors)} failed. Failed keys: {list(result.errors.keys())}"
+            )
+
+    def _dumps(self, value: Any) -> bytes:
+        """Serializes the value with the database's codec."""
+        with self._metrics.time("pickle"):
+            data = encode(value, self._codec)
+        self._metrics.count("bytes_written", len(data))
+        return data
+
+    def _loads(self, data: bytes) -> Any:
+        """Deserializes a value written with any codec."""
+        self._metrics.count("bytes_read", len(data))
+        with self._metrics.time("unpickle"):
+            return decode(data)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/factory.py                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Database Factory Module"""
+import logging
+
+from atelier.persistence.database import Database
+from atelier.persistence.odb import ObjectDB
+from atelier.persistence.sharded import ShardedDB
+from atelier.persistence.sqlite import SQLiteDB
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    DATABASE FACTORY                                              #
+# ------------------------------------------------------------------------------------------------ #
+class DatabaseFactory:
+    """Creates Database objects for the configured storage engine.
+
+    Engines:
+        shelve: ObjectDB, backed by a shelve file. The default.
+        sqlite: SQLiteDB, backed by SQLite in WAL mode. Supports concurrent readers while a
+            single writer ingests.
+        sharded: ShardedDB, spreading keys across several shelve files by key hash. Suits
+            repositories of many keys, as operations open only the shards they touch.
+    """
+
+    __engines = {
+        "shelve": ObjectDB,
+        "sqlite": SQLiteDB,
+        "sharded": ShardedDB,
+    }
+    _logger = logging.getLogger(
+        f"{__module__}.{__name__}",
+    )
+
+    @classmethod
+    def database(
+        cls,
+        name: str,
+        filepath: str,
+        engine: str = "shelve",
+        codec: str = "none",
+        shards: int = None,
+    ) -> Database:
+        """Returns a Database for the engine.
+
+        Args:
+            name (str): The name of the database.
+            filepath (str): Path to the file backing the database.
+            engine (str): Storage engine. One of 'shelve', 'sqlite' or 'sharded'.
+            codec (str): Compression codec for values written. See CodecFactory.
+            shards (int): Number of shards of a new 'sharded' database. Ignored by other
+                engines.
+        """
+        try:
+            database = cls.__engines[engine]
+        except KeyError:
+            msg = f"Storage engine {engine} is not supported."
+            cls._logger.error(msg)
+            raise ValueError(msg)
+        if engine == "sharded":
+            return database(name=name, filepath=filepath, codec=codec, shards=shards)
+        return database(name=name, filepath=filepath, codec=codec)
@@ -1,273 +1,369 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/persistence/io.py                                                          #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 07:47:14 pm                                                 #
-# Modified   : Thursday March 2nd 2023 07:47:29 pm                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-from abc import ABC, abstractmethod
-import os
-import logging
-import yaml
-import pickle
-import pandas as pd
-import pyarrow as pa
-import pyarrow.parquet as pq
-from typing import Any, Union, List
-
-
-# ------------------------------------------------------------------------------------------------ #
-
-
-class IO(ABC):  # pragma: no cover
-
-    _logger = logging.getLogger(
-        f"{__module__}.{__name__}",
-    )
-
-    @classmethod
-    def read(cls, filepath: str, *args, **kwargs) -> Any:
-        data = cls._read(filepath, **kwargs)
-        return data
-
-    @classmethod
-    @abstractmethod
-    def _read(cls, filepath: str, **kwargs) -> Any:
-        pass
-
-    @classmethod
-    def write(cls, filepath: str, data: Any, *args, **kwargs) -> None:
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        cls._write(filepath, data, **kwargs)
-
-    @classmethod
-    @abstractmethod
-    def _write(cls, filepath: str, data: Any, **kwargs) -> None:
-        pass
-
-
-# ------------------------------------------------------------------------------------------------ #
-#                                         EXCEL IO                                                 #
-# ------------------------------------------------------------------------------------------------ #
-
-
-class ExcelIO(IO):  # pragma: no cover
-    @classmethod
-    def _read(
-        cls,
-        filepath: str,
-        sheet_name: Union[str, int, list, None] = 0,
-        header: Union[int, None] = 0,
-        names: list = None,
-        index_col: Union[int, str] = None,
-        usecols: List[str] = None,
-        **kwargs,
-    ) -> pd.DataFrame:
-
-        return pd.read_excel(
-            filepath,
-            sheet_name=sheet_name,
-            header=header,
-            index_col=index_col,
-            usecols=usecols,
-            **kwargs,
-        )
-
-    @classmethod
-    def _write(
-        cls,
-        filepath: str,
-        data: pd.DataFrame,
-        sheet_name: str = "Sheet1",
-        columns: Union[str, list] = None,
-        header: Union[bool, list] = True,
-        index: bool = False,
-        **kwargs,
-    ) -> None:
-        data.to_excel(
-            excel_writer=filepath,
-            sheet_name=sheet_name,
-            columns=columns,
-            header=header,
-            index=index,
-            **kwargs,
-        )
-
-
-# ------------------------------------------------------------------------------------------------ #
-#                                        CSV IO                                                    #
-# ------------------------------------------------------------------------------------------------ #
-
-
-class CSVIO(IO):  # pragma: no cover
-    @classmethod
-    def _read(
-        cls,
-        filepath: str,
-        header: Union[int, None] = 0,
-        index_col: Union[int, str] = None,
-        usecols: List[str] = None,
-        low_memory: bool = False,
-        encoding: str = "utf-8",
-        **kwargs,
-    ) -> pd.DataFrame:
-
-        return pd.read_csv(
-            filepath,
-            header=header,
-            index_col=index_col,
-            usecols=usecols,
-            low_memory=low_memory,
-            encoding=encoding,
-        )
-
-    @classmethod
-    def _write(
-        cls,
-        filepath: str,
-        data: pd.DataFrame,
-        sep: str = ",",
-        index: bool = False,
-        index_label: bool = None,
-        encoding: str = "utf-8",
-        **kwargs,
-    ) -> None:
-        data.to_csv(filepath, sep=sep, index=index, index_label=index_label, encoding=encoding)
-
-
-# ------------------------------------------------------------------------------------------------ #
-#                                        YAML IO                                                   #
-# ------------------------------------------------------------------------------------------------ #
-
-
-class YamlIO(IO):  # pragma: no cover
-    @classmethod
-    def _read(cls, filepath: str, **kwargs) -> dict:
-
-        with open(filepath, "r") as f:
-            try:
-                return yaml.safe_load(f)
-            except yaml.YAMLError as e:  # pragma: no cover
-                cls._logger.error(e)
-                raise IOError(e)
-            finally:
-                f.close()
-
-    @classmethod
-    def _write(cls, filepath: str, data: Any, **kwargs) -> None:
-        with open(filepath, "w") as f:
-            try:
-                yaml.dump(data, f)
-            except yaml.YAMLError as e:  # pragma: no cover
-                cls._logger.error(e)
-                raise IOError(e)
-            finally:
-                f.close()
-
-
-# ------------------------------------------------------------------------------------------------ #
-#                                         PICKLE                                                   #
-# ------------------------------------------------------------------------------------------------ #
-
-
-class PickleIO(IO):  # pragma: no cover
-    @classmethod
-    def _read(cls, filepath: str, **kwargs) -> Any:
-
-        with open(filepath, "rb") as f:
-            try:
-                return pickle.load(f)
-            except pickle.PickleError() as e:  # pragma: no cover
-                cls._logger.error(e)
-                raise IOError(e)
-            finally:
-                f.close()
-
-    @classmethod
-    def _write(cls, filepath: str, data: Any, write_mode: str = "wb", **kwargs) -> None:
-        # Note, "a+" write_mode for append. If <TypeError: write() argument must be str, not bytes>
-        # use "ab+"
-        with open(filepath, write_mode) as f:
-            try:
-                pickle.dump(data, f)
-            except pickle.PickleError() as e:  # pragma: no cover
-                cls._logger.error(e)
-                raise (e)
-            finally:
-                f.close()
-
-
-# ------------------------------------------------------------------------------------------------ #
-#                                         PARQUET                                                  #
-# ------------------------------------------------------------------------------------------------ #
-
-
-class ParquetIO(IO):  # pragma: no cover
-    @classmethod
-    def _read(cls, filepath: str, **kwargs) -> Any:
-        """Read the pyarrow table, then convert to pandas."""
-        table = pa.parquet.read_table(filepath, memory_map=True)
-        return table.to_pandas()
-
-    @classmethod
-    def _write(cls, filepath: str, data: pd.DataFrame, **kwargs) -> None:
-        """Converts Pandas DataFrame to a pyarrow table, then persists."""
-        table = pa.Table.from_pandas(data)
-        pq.write_table(table, filepath)
-
-
-# ------------------------------------------------------------------------------------------------ #
-#                                       IO SERVICE                                                 #
-# ------------------------------------------------------------------------------------------------ #
-class IOService:  # pragma: no cover
-
-    __io = {
-        "csv": CSVIO,
-        "yaml": YamlIO,
-        "yml": YamlIO,
-        "pkl": PickleIO,
-        "pickle": PickleIO,
-        "xlsx": ExcelIO,
-        "xls": ExcelIO,
-        "parquet": ParquetIO,
-    }
-    _logger = logging.getLogger(
-        f"{__module__}.{__name__}",
-    )
-
-    @classmethod
-    def read(cls, filepath: str, **kwargs) -> Any:
-        io = cls._get_io(filepath)
-        return io.read(filepath, **kwargs)
-
-    @classmethod
-    def write(cls, filepath: str, data: Any, **kwargs) -> None:
-        io = cls._get_io(filepath)
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        io.write(filepath=filepath, data=data, **kwargs)
-
-    @classmethod
-    def _get_io(cls, filepath: str) -> IO:
-        try:
-            file_format = os.path.splitext(filepath)[1].replace(".", "")
-            return IOService.__io[file_format]
-        except TypeError:
-            if filepath is None:
-                msg = "Filepath is None"
-                cls._logger.error(msg)
-                raise ValueError(msg)
-        except KeyError:
-            msg = "File type {} is not supported.".format(file_format)
-            cls._logger.error(msg)
-            raise ValueError(msg)
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/io.py                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 07:47:14 pm                                                 #
+# Modified   : Thursday March 2nd 2023 07:47:29 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+from abc import ABC, abstractmethod
+import os
+import logging
+import mmap
+import struct
+import yaml
+import pickle
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Any, Union, List
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+
+class IO(ABC):  # pragma: no cover
+
+    _logger = logging.getLogger(
+        f"{__module__}.{__name__}",
+    )
+
+    @classmethod
+    def read(cls, filepath: str, *args, **kwargs) -> Any:
+        data = cls._read(filepath, **kwargs)
+        return data
+
+    @classmethod
+    @abstractmethod
+    def _read(cls, filepath: str, **kwargs) -> Any:
+        pass
+
+    @classmethod
+    def write(cls, filepath: str, data: Any, *args, **kwargs) -> None:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        cls._write(filepath, data, **kwargs)
+
+    @classmethod
+    @abstractmethod
+    def _write(cls, filepath: str, data: Any, **kwargs) -> None:
+        pass
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         EXCEL IO                                                 #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ExcelIO(IO):  # pragma: no cover
+    @classmethod
+    def _read(
+        cls,
+        filepath: str,
+        sheet_name: Union[str, int, list, None] = 0,
+        header: Union[int, None] = 0,
+        names: list = None,
+        index_col: Union[int, str] = None,
+        usecols: List[str] = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+
+        return pd.read_excel(
+            filepath,
+            sheet_name=sheet_name,
+            header=header,
+            index_col=index_col,
+            usecols=usecols,
+            **kwargs,
+        )
+
+    @classmethod
+    def _write(
+        cls,
+        filepath: str,
+        data: pd.DataFrame,
+        sheet_name: str = "Sheet1",
+        columns: Union[str, list] = None,
+        header: Union[bool, list] = True,
+        index: bool = False,
+        **kwargs,
+    ) -> None:
+        data.to_excel(
+            excel_writer=filepath,
+            sheet_name=sheet_name,
+            columns=columns,
+            header=header,
+            index=index,
+            **kwargs,
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        CSV IO                                                    #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class CSVIO(IO):  # pragma: no cover
+    @classmethod
+    def _read(
+        cls,
+        filepath: str,
+        header: Union[int, None] = 0,
+        index_col: Union[int, str] = None,
+        usecols: List[str] = None,
+        low_memory: bool = False,
+        encoding: str = "utf-8",
+        **kwargs,
+    ) -> pd.DataFrame:
+
+        return pd.read_csv(
+            filepath,
+            header=header,
+            index_col=index_col,
+            usecols=usecols,
+            low_memory=low_memory,
+            encoding=encoding,
+        )
+
+    @classmethod
+    def _write(
+        cls,
+        filepath: str,
+        data: pd.DataFrame,
+        sep: str = ",",
+        index: bool = False,
+        index_label: bool = None,
+        encoding: str = "utf-8",
+        **kwargs,
+    ) -> None:
+        data.to_csv(filepath, sep=sep, index=index, index_label=index_label, encoding=encoding)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        YAML IO                                                   #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class YamlIO(IO):  # pragma: no cover
+    @classmethod
+    def _read(cls, filepath: str, **kwargs) -> dict:
+
+        with open(filepath, "r") as f:
+            try:
+                return yaml.safe_load(f)
+            except yaml.YAMLError as e:  # pragma: no cover
+                cls._logger.error(e)
+                raise IOError(e)
+            finally:
+                f.close()
+
+    @classmethod
+    def _write(cls, filepath: str, data: Any, **kwargs) -> None:
+        with open(filepath, "w") as f:
+            try:
+                yaml.dump(data, f)
+            except yaml.YAMLError as e:  # pragma: no cover
+                cls._logger.error(e)
+                raise IOError(e)
+            finally:
+                f.close()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         PICKLE                                                   #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class PickleIO(IO):  # pragma: no cover
+    @classmethod
+    def _read(cls, filepath: str, **kwargs) -> Any:
+
+        with open(filepath, "rb") as f:
+            try:
+                return pickle.load(f)
+            except pickle.PickleError() as e:  # pragma: no cover
+                cls._logger.error(e)
+                raise IOError(e)
+            finally:
+                f.close()
+
+    @classmethod
+    def _write(cls, filepath: str, data: Any, write_mode: str = "wb", **kwargs) -> None:
+        # Note, "a+" write_mode for append. If <TypeError: write() argument must be str, not bytes>
+        # use "ab+"
+        with open(filepath, write_mode) as f:
+            try:
+                pickle.dump(data, f)
+            except pickle.PickleError() as e:  # pragma: no cover
+                cls._logger.error(e)
+                raise (e)
+            finally:
+                f.close()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         PARQUET                                                  #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ParquetIO(IO):  # pragma: no cover
+    @classmethod
+    def _read(cls, filepath: str, **kwargs) -> Any:
+        """Read the pyarrow table, then convert to pandas."""
+        table = pa.parquet.read_table(filepath, memory_map=True)
+        return table.to_pandas()
+
+    @classmethod
+    def _write(cls, filepath: str, data: pd.DataFrame, **kwargs) -> None:
+        """Converts Pandas DataFrame to a pyarrow table, then persists."""
+        table = pa.Table.from_pandas(data)
+        pq.write_table(table, filepath)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          NUMPY                                                   #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class NumpyIO(IO):  # pragma: no cover
+    @classmethod
+    def _read(cls, filepath: str, mmap_mode: str = None, **kwargs) -> np.ndarray:
+        return np.load(filepath, mmap_mode=mmap_mode, allow_pickle=False)
+
+    @classmethod
+    def _write(cls, filepath: str, data: np.ndarray, **kwargs) -> None:
+        np.save(filepath, data, allow_pickle=False)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   PICKLE PROTOCOL 5                                              #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class Pickle5IO(IO):  # pragma: no cover
+    """Pickle protocol 5 with out-of-band buffers.
+
+    Large contiguous buffers, such as the NumPy blocks of a DataFrame, are taken out of the
+    pickle stream and written to the file directly from the objects' memory, so writing needs
+    no second copy of the data. On read, the file is memory-mapped copy-on-write and the
+    buffers are handed back to pickle as views of the mapping: pages are read from disk as
+    they are touched, and modifying the loaded data never writes to the file.
+
+    Layout: MAGIC, the pickle length and buffer count, an (offset, length) pair per buffer,
+    the pickle stream, then each buffer aligned to ALIGNMENT bytes.
+    """
+
+    MAGIC = b"ATPKL5\x00\x01"
+    ALIGNMENT = 64
+
+    @classmethod
+    def _read(cls, filepath: str, **kwargs) -> Any:
+        with open(filepath, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        view = memoryview(mm)
+        if view[: len(cls.MAGIC)] != cls.MAGIC:
+            msg = f"{filepath} is not a protocol 5 pickle file."
+            cls._logger.error(msg)
+            raise IOError(msg)
+        position = len(cls.MAGIC)
+        length, count = struct.unpack_from("<QQ", view, position)
+        position += 16
+        spans = struct.unpack_from(f"<{2 * count}Q", view, position)
+        position += 16 * count
+        buffers = [view[offset : offset + size] for offset, size in zip(spans[::2], spans[1::2])]
+        return pickle.loads(view[position : position + length], buffers=buffers)
+
+    @classmethod
+    def _write(cls, filepath: str, data: Any, **kwargs) -> None:
+        buffers = []
+        stream = pickle.dumps(data, protocol=5, buffer_callback=cls._out_of_band(buffers))
+        position = len(cls.MAGIC) + 16 + 16 * len(buffers) + len(stream)
+        spans = []
+        for buffer in buffers:
+            position = cls._align(position)
+            spans.extend([position, buffer.nbytes])
+            position += buffer.nbytes
+        with open(filepath, "wb") as f:
+            f.write(cls.MAGIC)
+            f.write(struct.pack("<QQ", len(stream), len(buffers)))
+            f.write(struct.pack(f"<{len(spans)}Q", *spans))
+            f.write(stream)
+            for offset, buffer in zip(spans[::2], buffers):
+                f.write(bytes(offset - f.tell()))
+                f.write(buffer)
+
+    @classmethod
+    def _out_of_band(cls, buffers: list):
+        """Returns a buffer callback taking contiguous buffers out of band. Non-contiguous
+        buffers are left in the pickle stream."""
+
+        def callback(buffer: pickle.PickleBuffer) -> bool:
+            try:
+                buffers.append(buffer.raw())
+            except BufferError:
+                return True
+            return False
+
+        return callback
+
+    @classmethod
+    def _align(cls, position: int) -> int:
+        return -(-position // cls.ALIGNMENT) * cls.ALIGNMENT
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       IO SERVICE                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class IOService:  # pragma: no cover
+
+    __io = {
+        "csv": CSVIO,
+        "yaml": YamlIO,
+        "yml": YamlIO,
+        "pkl": PickleIO,
+        "pickle": PickleIO,
+        "xlsx": ExcelIO,
+        "xls": ExcelIO,
+        "parquet": ParquetIO,
+        "npy": NumpyIO,
+        "pkl5": Pickle5IO,
+    }
+    _logger = logging.getLogger(
+        f"{__module__}.{__name__}",
+    )
+
+    @classmethod
+    def read(cls, filepath: str, **kwargs) -> Any:
+        io = cls._get_io(filepath)
+        return io.read(filepath, **kwargs)
+
+    @classmethod
+    def write(cls, filepath: str, data: Any, **kwargs) -> None:
+        io = cls._get_io(filepath)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        io.write(filepath=filepath, data=data, **kwargs)
+
+    @classmethod
+    def _get_io(cls, filepath: str) -> IO:
+        try:
+            file_format = os.path.splitext(filepath)[1].replace(".", "")
+            return IOService.__io[file_format]
+        except TypeError:
+            if filepath is None:
+                msg = "Filepath is None"
+                cls._logger.error(msg)
+                raise ValueError(msg)
+        except KeyError:
+            msg = "File type {} is not supported.".format(file_format)
+            cls._logger.error(msg)
+            raise ValueError(msg)
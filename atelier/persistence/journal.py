@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/journal.py                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Write-Ahead Journal Module"""
+from __future__ import annotations
+import logging
+import os
+import pickle
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         JOURNAL                                                  #
+# ------------------------------------------------------------------------------------------------ #
+class Journal:
+    """Write-ahead journal of the operations in a transaction.
+
+    The operations are written to a temporary file, flushed to disk, and renamed into place.
+    The rename is the commit point: a journal file holds a complete, committed transaction,
+    while a temporary file left behind holds one that never committed. The journal is cleared
+    once its operations have been applied.
+
+    Args:
+        filepath (str): Path to the journal file.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        self._filepath = filepath
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def committed(self) -> bool:
+        """Returns True if the journal holds a committed transaction not yet cleared."""
+        return os.path.exists(self._filepath)
+
+    @property
+    def incomplete(self) -> bool:
+        """Returns True if a transaction was interrupted before it was committed."""
+        return os.path.exists(self._tempfile)
+
+    def write(self, operations: list) -> None:
+        """Writes the operations and commits them, returning once they are on disk."""
+        os.makedirs(os.path.dirname(self._filepath) or ".", exist_ok=True)
+        with open(self._tempfile, "wb") as file:
+            pickle.dump(operations, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(self._tempfile, self._filepath)
+        self._sync_directory()
+
+    def read(self) -> list:
+        """Returns the operations of the committed transaction."""
+        with open(self._filepath, "rb") as file:
+            return pickle.load(file)
+
+    def clear(self) -> None:
+        """Deletes the journal once its operations have been applied."""
+        if os.path.exists(self._filepath):
+            os.remove(self._filepath)
+
+    def discard(self) -> None:
+        """Deletes the journal of a transaction interrupted before it was committed."""
+        if os.path.exists(self._tempfile):
+            os.remove(self._tempfile)
+
+    @property
+    def _tempfile(self) -> str:
+        return f"{self._filepath}.tmp"
+
+    def _sync_directory(self) -> None:
+        """Flushes the rename to disk. Not supported on all platforms."""
+        try:
+            fd = os.open(os.path.dirname(self._filepath) or ".", os.O_RDONLY)
+        except OSError:  # pragma: no cover
+            return
+        try:
+            os.fsync(fd)
+        except OSError:  # pragma: no cover
+            pass
+        finally:
+            os.close(fd)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/keyindex.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Ordered Key Index Module"""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+import json
+import logging
+import os
+from typing import Callable, Iterable, Iterator
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        KEY INDEX                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class KeyIndex:
+    """Sorted list of a database's keys, persisted to a file next to the database.
+
+    The index is loaded on first use and kept in memory between connections; it is reloaded
+    only if the file has changed since, such as by another process. Changes are written
+    atomically when the database is flushed or closed. Like the Bloom filter's, a '.dirty'
+    marker is created before the database's keys are first changed in a connection, and removed
+    once the index is saved. An index whose marker remains may not match the database, whose
+    keys were changed by a writer still connected or one that died. Such an index, or one
+    missing or whose key count doesn't match the database, is rebuilt from the database's keys.
+
+    Args:
+        filepath (str): Path to the index file.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        self._filepath = filepath
+        self._keys = []
+        self._signature = None
+        self._dirty = False
+        self._marked = False
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getstate__(self) -> dict:
+        """The index is reloaded from its file after unpickling."""
+        return {"_filepath": self._filepath}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(filepath=state["_filepath"])
+
+    def load(self, keys: Callable[[], Iterable[str]], count: int) -> None:
+        """Loads the index, rebuilding it if it doesn't match the database.
+
+        Args:
+            keys (Callable): Returns the database's keys, called only to rebuild the index.
+            count (int): The number of keys in the database.
+        """
+        signature = None if os.path.exists(self._marker) else self._stat()
+        if signature is not None and signature == self._signature and len(self._keys) == count:
+            return
+        self._keys = self._read() if signature is not None else None
+        self._signature = signature
+        self._dirty = False
+        if self._keys is None or len(self._keys) != count:
+            self._logger.debug(f"Rebuilding key index {self._filepath}.")
+            self._keys = sorted(keys())
+            self._dirty = True
+
+    def mark(self) -> None:
+        """Creates the dirty marker, once per connection. Call before changing the database's
+        keys."""
+        if not self._marked:
+            open(self._marker, "w").close()
+            self._marked = True
+
+    def add(self, key: str) -> None:
+        i = bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            self._keys.insert(i, key)
+            self._dirty = True
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Adds many keys."""
+        keys = list(keys)
+        if len(keys) > len(self._keys):
+            self._keys = sorted(set(self._keys).union(keys))
+            self._dirty = True
+            return
+        for key in keys:
+            self.add(key)
+
+    def remove(self, key: str) -> None:
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+            self._dirty = True
+
+    def clear(self) -> None:
+        self._keys = []
+        self._dirty = True
+
+    def range(self, lower: str = "", after: str = None) -> Iterator[str]:
+        """Yields keys in order, from lower inclusive, and strictly after the key given."""
+        i = bisect_left(self._keys, lower)
+        if after is not None:
+            i = max(i, bisect_right(self._keys, after))
+        keys = self._keys
+        while i < len(keys):
+            yield keys[i]
+            i += 1
+
+    def save(self) -> None:
+        """Writes the index if it has changed, replacing the file atomically, and removes the
+        dirty marker."""
+        if self._dirty:
+            temp = f"{self._filepath}.tmp"
+            with open(temp, "w") as f:
+                json.dump({"count": len(self._keys), "keys": self._keys}, f)
+            os.replace(temp, self._filepath)
+            self._signature = self._stat()
+            self._dirty = False
+        if os.path.exists(self._marker):
+            os.remove(self._marker)
+        self._marked = False
+
+    @property
+    def _marker(self) -> str:
+        return f"{self._filepath}.dirty"
+
+    def _read(self) -> list:
+        try:
+            with open(self._filepath, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Unable to read key index {self._filepath}. {e}")
+            return None
+        if data.get("count") != len(data.get("keys", [])):
+            return None
+        return data["keys"]
+
+    def _stat(self) -> tuple:
+        try:
+            stat = os.stat(self._filepath)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
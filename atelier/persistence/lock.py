@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/lock.py                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""File Lock Module"""
+from __future__ import annotations
+import logging
+import os
+import threading
+import time
+
+from atelier.persistence.exceptions import LockTimeoutError
+
+try:  # pragma: no cover
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# ------------------------------------------------------------------------------------------------ #
+# Seconds between attempts to acquire a contended lock. The interval doubles up to the maximum.
+POLL_INTERVAL = 0.001
+MAX_POLL_INTERVAL = 0.05
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        FILE LOCK                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class FileLock:
+    """Advisory reader/writer lock on a file, shared between processes.
+
+    Readers take shared locks, which never block one another; a writer takes an exclusive
+    lock, waiting for readers and other writers to release theirs. Locks are taken with
+    flock(2) on a lock file next to the locked file, and are released if the process dies.
+    Waits are bounded by the timeout, after which LockTimeoutError is raised.
+
+    Locking is advisory: it excludes processes that lock, not those that open the file
+    directly. On platforms without fcntl, locking is disabled and a warning is logged.
+
+    Args:
+        filepath (str): Path to the lock file. Created if it doesn't exist.
+        timeout (float): Seconds to wait for the lock. None waits indefinitely.
+    """
+
+    def __init__(self, filepath: str, timeout: float = 30.0) -> None:
+        self._filepath = filepath
+        self._timeout = timeout
+        self._fd = None
+        self._shared = None
+        self._acquisitions = 0
+        self._contentions = 0
+        self._timeouts = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._mutex = threading.Lock()
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+        if fcntl is None:  # pragma: no cover
+            self._logger.warning("File locking is not supported on this platform.")
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @property
+    def is_locked(self) -> bool:
+        return self._fd is not None
+
+    @property
+    def is_shared(self) -> bool:
+        """Returns True if a shared lock is held, False if an exclusive lock is held."""
+        return self._shared is True
+
+    def __getstate__(self) -> dict:
+        """Locks are held by processes. A pickled lock carries its configuration only."""
+        return {"_filepath": self._filepath, "_timeout": self._timeout}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(filepath=state["_filepath"], timeout=state["_timeout"])
+
+    def acquire(self, shared: bool = False) -> None:
+        """Acquires the lock, waiting up to the timeout.
+
+        Args:
+            shared (bool): Whether to take a shared (reader) lock rather than an exclusive
+                (writer) lock.
+        """
+        if self._fd is not None:
+            msg = f"Lock {self._filepath} is already held."
+            self._logger.error(msg)
+            raise RuntimeError(msg)
+        if fcntl is None:  # pragma: no cover
+            self._fd, self._shared = -1, shared
+            return
+        os.makedirs(os.path.dirname(self._filepath) or ".", exist_ok=True)
+        fd = os.open(self._filepath, os.O_RDWR | os.O_CREAT, 0o644)
+        operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        start = time.perf_counter()
+        interval = POLL_INTERVAL
+        contended = False
+        while True:
+            try:
+                fcntl.flock(fd, operation | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                contended = True
+                waited = time.perf_counter() - start
+                if self._timeout is not None and waited >= self._timeout:
+                    os.close(fd)
+                    self._record(waited, contended, timed_out=True)
+                    msg = (
+                        f"Timed out after {round(waited, 3)} seconds waiting for the "
+                        f"{'shared' if shared else 'exclusive'} lock on {self._filepath}."
+                    )
+                    self._logger.error(msg)
+                    raise LockTimeoutError(msg)
+                time.sleep(interval)
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+        self._record(time.perf_counter() - start, contended)
+        self._fd, self._shared = fd, shared
+
+    def release(self) -> None:
+        """Releases the lock, if held."""
+        if self._fd is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        self._fd, self._shared = None, None
+
+    def stats(self) -> dict:
+        """Returns the lock-wait counters. Waits are in seconds."""
+        with self._mutex:
+            return {
+                "acquisitions": self._acquisitions,
+                "contentions": self._contentions,
+                "timeouts": self._timeouts,
+                "wait_time": self._wait_time,
+                "max_wait_time": self._max_wait_time,
+                "mean_wait_time": self._wait_time / self._acquisitions
+                if self._acquisitions
+                else 0.0,
+            }
+
+    def _record(self, waited: float, contended: bool, timed_out: bool = False) -> None:
+        with self._mutex:
+            if timed_out:
+                self._timeouts += 1
+            else:
+                self._acquisitions += 1
+            self._contentions += int(contended)
+            self._wait_time += waited
+            self._max_wait_time = max(self._max_wait_time, waited)
+        if contended and not timed_out:
+            self._logger.debug(f"Waited {round(waited, 3)} seconds for lock {self._filepath}.")
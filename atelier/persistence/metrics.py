@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/metrics.py                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Persistence Instrumentation Module"""
+from __future__ import annotations
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+# ------------------------------------------------------------------------------------------------ #
+# Upper bounds, in seconds, of the latency histogram buckets: powers of two from one microsecond
+# to about two minutes. Latencies above the last bound are counted in an overflow bucket.
+BUCKETS = [1e-6 * 2**i for i in range(28)]
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        HISTOGRAM                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class Histogram:
+    """Latency histogram with logarithmic buckets.
+
+    Observations are counted in buckets whose bounds double, so memory is fixed however many
+    are recorded, and percentiles are reported as the upper bound of the bucket in which they
+    fall, within a factor of two of the exact value.
+    """
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(BUCKETS) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._min = None
+        self._max = None
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def observe(self, seconds: float) -> None:
+        """Records a latency in seconds."""
+        self._counts[bisect_left(BUCKETS, seconds)] += 1
+        self._count += 1
+        self._total += seconds
+        self._min = seconds if self._min is None else min(self._min, seconds)
+        self._max = seconds if self._max is None else max(self._max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """Returns the upper bound of the bucket holding the q-th quantile, for q in [0, 1]."""
+        if self._count == 0:
+            return 0.0
+        rank = q * self._count
+        cumulative = 0
+        for bound, count in zip(BUCKETS, self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self._max)
+        return self._max
+
+    def stats(self) -> dict:
+        """Returns the count, total, mean, min, max and percentiles, in seconds."""
+        return {
+            "count": self._count,
+            "total": self._total,
+            "mean": self._total / self._count if self._count else 0.0,
+            "min": self._min or 0.0,
+            "max": self._max or 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         METRICS                                                  #
+# ------------------------------------------------------------------------------------------------ #
+class Metrics:
+    """Thread-safe counters and latency histograms, keyed by name.
+
+    Metrics are kept per process: they are not pickled, and a copy of the object that owns
+    them starts with none recorded.
+    """
+
+    def __init__(self) -> None:
+        self._mutex = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def __getstate__(self) -> dict:
+        return {}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Adds n to the named counter."""
+        with self._mutex:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Records a latency in the named histogram."""
+        with self._mutex:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram()
+            self._histograms[name].observe(seconds)
+
+    @contextmanager
+    def time(self, name: str) -> Iterator[None]:
+        """Context manager recording the duration of the block in the named histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def stats(self) -> dict:
+        """Returns the counters and the latency statistics of each histogram."""
+        with self._mutex:
+            return {
+                "counters": dict(self._counters),
+                "latency": {name: hist.stats() for name, hist in self._histograms.items()},
+            }
+
+    def reset(self) -> None:
+        """Clears all counters and histograms."""
+        with self._mutex:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+# ------------------------------------------------------------------------------------------------ #
+def timed(name: str) -> Callable:
+    """Decorator recording the latency of a method in the named histogram of the object's
+    metrics."""
+
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs) -> Any:
+            with self._metrics.time(name):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     METRICS REPORTER                                             #
+# ------------------------------------------------------------------------------------------------ #
+class MetricsReporter:
+    """Reports an object's stats periodically from a background thread.
+
+    Each report is logged at INFO level and, if a filepath is given, written to the file as
+    JSON, replacing the previous report atomically. A final report is made when stopped.
+
+    Args:
+        source (Any): Object whose stats method returns the stats to report, such as a Repo.
+        interval (float): Seconds between reports.
+        filepath (str): Optional path of a JSON file to which each report is written.
+
+    Example:
+        with MetricsReporter(source=repo, interval=60, filepath="stats.json"):
+            run_job(repo)
+    """
+
+    def __init__(self, source: Any, interval: float = 60.0, filepath: str = None) -> None:
+        self._source = source
+        self._interval = interval
+        self._filepath = filepath
+        self._stopped = threading.Event()
+        self._thread = None
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    def __enter__(self) -> MetricsReporter:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Starts reporting in a daemon thread."""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="MetricsReporter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops reporting, after a final report."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.report()
+
+    def report(self) -> dict:
+        """Reports the source's stats now and returns them."""
+        stats = self._source.stats()
+        self._logger.info(f"Stats for {getattr(self._source, 'name', self._source)}: {stats}")
+        if self._filepath is not None:
+            os.makedirs(os.path.dirname(self._filepath) or ".", exist_ok=True)
+            with open(f"{self._filepath}.tmp", "w") as file:
+                json.dump(stats, file, indent=2, default=str)
+            os.replace(f"{self._filepath}.tmp", self._filepath)
+        return stats
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self.report()
+            except Exception as e:  # pragma: no cover
+                self._logger.warning(f"Failed to report stats: {e}")
@@ -1,173 +1,533 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/persistence/odb.py                                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 05:49:40 am                                                 #
-# Modified   : Thursday March 2nd 2023 03:55:14 pm                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-import os
-import shelve
-from typing import Any
-
-from atelier.persistence.database import Database
-from atelier.persistence.exceptions import (
-    ObjectExistsError,
-    ObjectNotFoundError,
-    ObjectDatabaseConnectionError,
-)
-
-
-# ------------------------------------------------------------------------------------------------ #
-#                                       OBJECT DB                                                  #
-# ------------------------------------------------------------------------------------------------ #
-class ObjectDB(Database):
-    """Object Database"""
-
-    def __init__(self, name: str, filepath: str) -> None:
-        super().__init__()
-        self._name = name
-        self._filepath = filepath
-        self._is_connected = False
-        self._connection = None
-        os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def filepath(self) -> str:
-        return self._filepath
-
-    @property
-    def is_connected(self) -> bool:
-        return self._is_connected
-
-    def __enter__(self):
-        self.connect()
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        if self._is_connected:
-            self.close()
-        if exc_type is not None:
-            self._logger.error(f"\nExecution Type: {exc_type}")
-            self._logger.error(f"\nExecution Value: {exc_value}")
-            self._logger.error(f"\nTraceback: {traceback}")
-
-    def connect(self) -> None:
-        """Connects to the database."""
-        self._connection = shelve.open(self._filepath)
-        self._is_connected = True
-
-    def close(self) -> None:
-        """Closes the underlying database connection."""
-        self._connection.close()
-        self._is_connected = False
-
-    def insert(self, key: str, value: Any) -> None:
-        """Inserts a key/value pair into the database."""
-        if self.exists(key):
-            msg = f"Object with key {key} already exists in the database {self._name}."
-            self._logger.error(msg)
-            raise ObjectExistsError(msg)
-
-        self._connection[key] = value
-
-    def select(self, key: str) -> Any:
-        """Retrieves data from the database"""
-        try:
-            return self._connection[key]
-        except KeyError:
-            msg = f"Object with key {key} not found in database {self._name}."
-            self._logger.error(msg)
-            raise ObjectNotFoundError(msg)
-        except ValueError:
-            msg = f"Database connection {self._name} is closed."
-            self._logger.error(msg)
-            raise ObjectDatabaseConnectionError(msg)
-        except TypeError:
-            msg = f"Database connection {self._name} is closed."
-            self._logger.error(msg)
-            raise ObjectDatabaseConnectionError(msg)
-
-    def selectall(self) -> Any:
-        """Retrieves all data from the database"""
-        objects = {}
-        try:
-            keys = self._connection.keys()
-            for key in keys:
-                objects[key] = self._connection[key]
-            return objects
-        except ValueError:
-            msg = f"Database connection {self._name} is closed."
-            self._logger.error(msg)
-            raise ObjectDatabaseConnectionError(msg)
-        except AttributeError:
-            msg = f"Database connection {self._name} is closed."
-            self._logger.error(msg)
-            raise ObjectDatabaseConnectionError(msg)
-
-    def update(self, key: str, value: Any) -> None:
-        """Updates an existing object in the database."""
-        if self.exists(key):
-            self._connection[key] = value
-
-        else:
-            msg = f"Object with key {key} not found in database {self._name}."
-            self._logger.error(msg)
-            raise ObjectNotFoundError(msg)
-
-    def delete(self, key: str) -> None:
-        """Deletes existing data."""
-        try:
-            del self._connection[key]
-        except KeyError:
-            msg = f"Object with key {key} doesn't exist in the database {self._name}."
-            self._logger.error(msg)
-            raise ObjectNotFoundError(msg)
-        except ValueError:
-            msg = f"Database connection {self._name} is closed."
-            self._logger.error(msg)
-            raise ObjectDatabaseConnectionError(msg)
-        except TypeError:
-            msg = f"Database connection {self._name} is closed."
-            self._logger.error(msg)
-            raise ObjectDatabaseConnectionError(msg)
-
-    def exists(self, key: str) -> bool:
-        """Checks existence of an item in the database."""
-        try:
-            return key in self._connection.keys()
-        except ValueError:
-            msg = f"Database connection {self._name} is closed."
-            self._logger.error(msg)
-            raise ObjectDatabaseConnectionError(msg)
-        except AttributeError:
-            msg = f"Database connection {self._name} is closed."
-            self._logger.error(msg)
-            raise ObjectDatabaseConnectionError(msg)
-
-    def clear(self) -> None:
-        """Clears cache of all objects."""
-        try:
-            self._connection.clear()
-        except ValueError:
-            msg = f"Database connection {self._name} is closed."
-            self._logger.error(msg)
-            raise ObjectDatabaseConnectionError(msg)
-        except AttributeError:
-            msg = f"Database connection {self._name} is closed."
-            self._logger.error(msg)
-            raise ObjectDatabaseConnectionError(msg)
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/odb.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 05:49:40 am                                                 #
+# Modified   : Thursday March 2nd 2023 03:55:14 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+from __future__ import annotations
+import dbm
+import importlib
+import json
+import os
+import shelve
+from typing import Any, Callable, Iterable, Iterator
+
+from atelier.persistence.bloom import BloomFilter
+from atelier.persistence.database import BatchResult, Database
+from atelier.persistence.exceptions import (
+    ObjectExistsError,
+    ObjectNotFoundError,
+    ObjectDatabaseConnectionError,
+)
+from atelier.persistence.keyindex import KeyIndex
+from atelier.persistence.lock import FileLock
+from atelier.persistence.metrics import timed
+
+# ------------------------------------------------------------------------------------------------ #
+# Suffixes of the files the dbm modules keep for a database, and the block size to which the
+# dumb dbm module aligns each value in its data file.
+DBM_SUFFIXES = ["", ".db", ".dat", ".dir", ".bak", ".pag"]
+DUMB_BLOCKSIZE = 512
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      CODEC SHELF                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class CodecShelf(shelve.DbfilenameShelf):
+    """Shelf serializing values with the functions given rather than plain pickle."""
+
+    def __init__(
+        self,
+        filename: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[bytes], Any],
+        flag: str = "c",
+    ) -> None:
+        super().__init__(filename, flag=flag)
+        self._dumps = dumps
+        self._loads = loads
+
+    def __getitem__(self, key: str) -> Any:
+        return self._loads(self.dict[key.encode(self.keyencoding)])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.dict[key.encode(self.keyencoding)] = self._dumps(value)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       OBJECT DB                                                  #
+# ------------------------------------------------------------------------------------------------ #
+class ObjectDB(Database):
+    """Object Database backed by a shelve file.
+
+    Shelve files can't be written by more than one process at a time, so connections are
+    guarded by an advisory file lock held until the connection is closed. Read-only
+    connections take a shared lock and never block one another; read-write connections take
+    an exclusive lock. A connection waits up to the timeout for the lock, then raises
+    LockTimeoutError. Lock-wait counters are reported by lock_stats, and in stats.
+
+    Shelve keys are unordered, so an ordered key index is kept in a '.keys' file next to the
+    database, maintained on insert and delete and written when the connection is flushed or
+    closed. It serves ordered scans without reading objects.
+
+    Shelve files grow on every write; space held by updated and deleted objects is only
+    returned by compact, which copies the live objects into fresh files and swaps them in.
+    The swap is recorded in a '.swap' manifest first and completed on the next connection if
+    interrupted, so readers see either the old files or the new ones.
+
+    A Bloom filter of the keys is kept in a '.bloom' file, so might_contain answers most
+    lookups of missing keys without opening the database. The filter is added to on insert,
+    written before the database is, and rebuilt from the live keys on compaction. Its expected
+    and observed false positive rates are reported in stats.
+
+    Args:
+        name (str): The name of the database.
+        filepath (str): Path to the shelve file.
+        codec (str): Compression codec for values written.
+        timeout (float): Seconds to wait for the file lock. None waits indefinitely.
+    """
+
+    def __init__(
+        self, name: str, filepath: str, codec: str = "none", timeout: float = 30.0
+    ) -> None:
+        super().__init__(name=name, filepath=filepath, codec=codec)
+        os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+        self._lock = FileLock(filepath=f"{self._filepath}.lock", timeout=timeout)
+        self._index = KeyIndex(filepath=f"{self._filepath}.keys")
+        self._bloom = BloomFilter(filepath=f"{self._filepath}.bloom")
+        self._index_loaded = False
+        self._readonly = False
+
+    def lock_stats(self) -> dict:
+        """Returns the lock-wait counters for connections made by this database object."""
+        return self._lock.stats()
+
+    def stats(self) -> dict:
+        """Returns the operation counters and latencies, with the lock-wait counters."""
+        stats = super().stats()
+        stats["lock"] = self.lock_stats()
+        negatives = stats["counters"].get("bloom_negatives", 0)
+        false_positives = stats["counters"].get("bloom_false_positives", 0)
+        stats["bloom"] = self._bloom.stats()
+        stats["bloom"]["observed_fpr"] = (
+            false_positives / (false_positives + negatives) if false_positives else 0.0
+        )
+        return stats
+
+    def might_contain(self, key: str) -> bool:
+        """Returns False if the key is certainly not in the database, answered from the Bloom
+        filter without connecting. Returns True if the key may be in the database, or if the
+        filter can't be read."""
+        if not self._is_connected and not self._bloom.load():
+            return dbm.whichdb(self._filepath) is not None
+        if key in self._bloom:
+            return True
+        self._metrics.count("bloom_negatives")
+        return False
+
+    @timed("connect")
+    def connect(self, readonly: bool = False) -> None:
+        """Connects to the database, taking a shared lock if readonly, else an exclusive lock.
+        A read-only connection to a database not yet created connects read-write to create it.
+        """
+        if self._is_connected:
+            self.close()
+        if os.path.exists(self._swapfile):
+            self._lock.acquire()
+            try:
+                self._complete_swap()
+            finally:
+                self._lock.release()
+        readonly = readonly and dbm.whichdb(self._filepath) is not None
+        with self._metrics.time("lock_wait"):
+            self._lock.acquire(shared=readonly)
+        try:
+            self._connection = CodecShelf(
+                self._filepath,
+                dumps=self._dumps,
+                loads=self._loads,
+                flag="r" if readonly else "c",
+            )
+        except Exception:
+            self._lock.release()
+            raise
+        self._index_loaded = False
+        self._readonly = readonly
+        self._is_connected = True
+        if not self._bloom.load() and not readonly:
+            self._bloom.rebuild(keys=self._connection.keys(), count=len(self._connection))
+
+    def close(self) -> None:
+        """Closes the underlying database connection and releases the lock."""
+        try:
+            self._save_index()
+            self._save_bloom()
+            self._connection.close()
+        finally:
+            self._lock.release()
+            self._is_connected = False
+
+    def flush(self) -> None:
+        """Writes pending changes through to the underlying file without closing it."""
+        if not self._is_connected:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        self._save_index()
+        self._save_bloom()
+        self._connection.sync()
+
+    @timed("insert")
+    def insert(self, key: str, value: Any) -> None:
+        """Inserts a key/value pair into the database."""
+        if self.exists(key):
+            msg = f"Object with key {key} already exists in the database {self._name}."
+            self._logger.error(msg)
+            raise ObjectExistsError(msg)
+
+        index = self._keyindex()
+        index.mark()
+        self._bloom.add(key)
+        self._connection[key] = value
+        index.add(key)
+
+    @timed("insert_many")
+    def insert_many(self, items: dict) -> BatchResult:
+        """Inserts many key/value pairs in a single pass.
+
+        Existing keys are determined once for the batch. Keys that already exist are reported
+        in the result's errors rather than aborting the batch.
+
+        Args:
+            items (dict): Mapping of keys to values.
+        """
+        result = BatchResult()
+        existing = self._keys()
+        index = self._keyindex()
+        index.mark()
+        for key, value in items.items():
+            if key in existing:
+                msg = f"Object with key {key} already exists in the database {self._name}."
+                result.errors[key] = ObjectExistsError(msg)
+            else:
+                self._bloom.add(key)
+                self._connection[key] = value
+                existing.add(key)
+                result.items[key] = value
+        index.update(result.items.keys())
+        self._save_bloom()
+        self._connection.sync()
+        self._log_batch("insert", result)
+        return result
+
+    @timed("select")
+    def select(self, key: str) -> Any:
+        """Retrieves data from the database"""
+        try:
+            return self._connection[key]
+        except KeyError:
+            msg = f"Object with key {key} not found in database {self._name}."
+            self._logger.error(msg)
+            raise ObjectNotFoundError(msg)
+        except ValueError:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        except TypeError:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+
+    @timed("selectall")
+    def selectall(self) -> Any:
+        """Retrieves all data from the database"""
+        objects = {}
+        try:
+            keys = self._connection.keys()
+            for key in keys:
+                objects[key] = self._connection[key]
+            return objects
+        except ValueError:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        except AttributeError:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+
+    def iter_keys(self, where: Callable[[str], bool] = None) -> Iterator[str]:
+        """Yields the keys in the database, optionally filtered. Keys are read up front, so
+        the database may be modified while iterating."""
+        for key in list(self._keys()):
+            if where is None or where(key):
+                yield key
+
+    def iter_items(self, where: Callable[[str], bool] = None) -> Iterator[tuple]:
+        """Yields (key, object) pairs one at a time, optionally filtered by key. Objects
+        deleted while iterating are skipped."""
+        for key in self.iter_keys(where=where):
+            try:
+                value = self._connection[key]
+            except KeyError:
+                continue
+            yield key, value
+
+    @timed("select_many")
+    def select_many(self, keys: Iterable[str]) -> BatchResult:
+        """Retrieves many objects, reporting keys not found in the result's errors."""
+        result = BatchResult()
+        existing = self._keys()
+        for key in keys:
+            if key in existing:
+                result.items[key] = self._connection[key]
+            else:
+                msg = f"Object with key {key} not found in database {self._name}."
+                result.errors[key] = ObjectNotFoundError(msg)
+        self._log_batch("select", result)
+        return result
+
+    @timed("update")
+    def update(self, key: str, value: Any) -> None:
+        """Updates an existing object in the database."""
+        if self.exists(key):
+            self._connection[key] = value
+
+        else:
+            msg = f"Object with key {key} not found in database {self._name}."
+            self._logger.error(msg)
+            raise ObjectNotFoundError(msg)
+
+    @timed("delete")
+    def delete(self, key: str) -> None:
+        """Deletes existing data."""
+        try:
+            index = self._keyindex()
+            index.mark()
+            del self._connection[key]
+            index.remove(key)
+        except KeyError:
+            msg = f"Object with key {key} doesn't exist in the database {self._name}."
+            self._logger.error(msg)
+            raise ObjectNotFoundError(msg)
+        except ValueError:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        except TypeError:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+
+    @timed("delete_many")
+    def delete_many(self, keys: Iterable[str]) -> BatchResult:
+        """Deletes many objects, reporting keys not found in the result's errors."""
+        result = BatchResult()
+        existing = self._keys()
+        index = self._keyindex()
+        index.mark()
+        for key in keys:
+            if key in existing:
+                del self._connection[key]
+                index.remove(key)
+                existing.discard(key)
+                result.items[key] = None
+            else:
+                msg = f"Object with key {key} doesn't exist in the database {self._name}."
+                result.errors[key] = ObjectNotFoundError(msg)
+        self._connection.sync()
+        self._log_batch("delete", result)
+        return result
+
+    def exists(self, key: str) -> bool:
+        """Checks existence of an item in the database, answering from the Bloom filter if it
+        rules the key out."""
+        if self._is_connected and key not in self._bloom:
+            self._metrics.count("bloom_negatives")
+            return False
+        try:
+            found = key in self._connection
+        except ValueError:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        except (AttributeError, TypeError):
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        if not found and self._bloom.loaded:
+            self._metrics.count("bloom_false_positives")
+        return found
+
+    def clear(self) -> None:
+        """Clears cache of all objects."""
+        try:
+            self._bloom.clear()
+            self._index.mark()
+            self._connection.clear()
+            self._index.clear()
+            self._index_loaded = True
+        except ValueError:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        except AttributeError:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+
+    def compact(self) -> int:
+        """Copies the live objects into fresh files under the exclusive lock and swaps them in
+        for the current files. Values are copied as stored, without being deserialized.
+        Returns the bytes reclaimed."""
+        if self._is_connected:
+            msg = f"Database {self._name} must be closed before it is compacted."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        engine = dbm.whichdb(self._filepath)
+        if not engine:
+            return 0
+        before = self.disk_usage
+        temp = f"{self._filepath}.compact"
+        self._lock.acquire()
+        try:
+            self._complete_swap()
+            self._remove_files(temp)
+            module = importlib.import_module(engine)
+            source = module.open(self._filepath, "r")
+            target = module.open(temp, "n")
+            try:
+                keys = []
+                for key in source.keys():
+                    target[key] = source[key]
+                    keys.append(key.decode("utf-8"))
+            finally:
+                target.close()
+                source.close()
+            self._bloom.rebuild(keys=keys, count=len(keys))
+            self._bloom.save()
+            self._swap(temp)
+        finally:
+            self._lock.release()
+        reclaimed = max(0, before - self.disk_usage)
+        self._logger.info(f"Compacted database {self._name}, reclaiming {reclaimed} bytes.")
+        return reclaimed
+
+    def garbage(self) -> int:
+        """Returns the bytes in the database files not accounted for by live keys and values.
+        Values are read as stored, without being deserialized."""
+        if not self._is_connected:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        raw = self._connection.dict
+        dumb = dbm.whichdb(self._filepath) == "dbm.dumb"
+        live = 0
+        for key in raw.keys():
+            size = len(raw[key])
+            if dumb:
+                live += -(-size // DUMB_BLOCKSIZE) * DUMB_BLOCKSIZE
+            else:
+                live += len(key) + size
+        suffixes = [".dat"] if dumb else DBM_SUFFIXES
+        stored = sum(os.path.getsize(path) for path in self._files(self._filepath, suffixes))
+        return max(0, stored - live)
+
+    @property
+    def _swapfile(self) -> str:
+        return f"{self._filepath}.swap"
+
+    def _swap(self, temp: str) -> None:
+        """Replaces the database files with those of the compacted copy. The renames are
+        written to the swap manifest before any is made, so the swap can be completed if
+        interrupted."""
+        for path in self._files(temp):
+            with open(path, "rb") as file:
+                os.fsync(file.fileno())
+        replacements = {path[len(temp) :]: path for path in self._files(temp)}
+        manifest = {
+            "replace": [[path, self._filepath + suffix] for suffix, path in replacements.items()],
+            "remove": [
+                path
+                for path in self._files(self._filepath)
+                if path[len(self._filepath) :] not in replacements
+            ],
+        }
+        with open(f"{self._swapfile}.tmp", "w") as file:
+            json.dump(manifest, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f"{self._swapfile}.tmp", self._swapfile)
+        self._complete_swap()
+
+    def _complete_swap(self) -> None:
+        """Completes a swap recorded in the manifest. Renames already made are skipped."""
+        if not os.path.exists(self._swapfile):
+            return
+        with open(self._swapfile) as file:
+            manifest = json.load(file)
+        for source, target in manifest["replace"]:
+            if os.path.exists(source):
+                os.replace(source, target)
+        for path in manifest["remove"]:
+            if os.path.exists(path):
+                os.remove(path)
+        os.remove(self._swapfile)
+        self._logger.debug(f"Swapped compacted files into database {self._name}.")
+
+    def _files(self, filepath: str, suffixes: list = None) -> list:
+        """Returns the paths of the dbm files present for the database path given."""
+        suffixes = suffixes or DBM_SUFFIXES
+        return [filepath + suffix for suffix in suffixes if os.path.isfile(filepath + suffix)]
+
+    def _remove_files(self, filepath: str) -> None:
+        for path in self._files(filepath):
+            os.remove(path)
+
+    def _keys(self) -> set:
+        """Returns the set of keys in the database in a single pass."""
+        try:
+            return set(self._connection.keys())
+        except (AttributeError, ValueError):
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+
+    def _ordered_keys(self, lower: str = "", after: str = None) -> Iterator[str]:
+        return self._keyindex().range(lower=lower, after=after)
+
+    def _keyindex(self) -> KeyIndex:
+        """Returns the key index, loading it on first use in the connection."""
+        if not self._is_connected:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        if not self._index_loaded:
+            self._index.load(keys=self._connection.keys, count=len(self._connection))
+            self._index_loaded = True
+        return self._index
+
+    def _save_index(self) -> None:
+        if self._index_loaded and not self._readonly:
+            self._index.save()
+
+    def _save_bloom(self) -> None:
+        """Writes the Bloom filter, first rebuilding it from the live keys if more keys have
+        been added than it was sized for."""
+        if self._readonly:
+            return
+        if self._bloom.overfull:
+            self._bloom.rebuild(keys=self._connection.keys(), count=len(self._connection))
+        self._bloom.save()
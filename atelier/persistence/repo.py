@@ -1,127 +1,937 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/persistence/repo.py                                                        #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 09:39:53 am                                                 #
-# Modified   : Thursday March 2nd 2023 04:22:33 pm                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-from __future__ import annotations
-import os
-from datetime import datetime
-import pandas as pd
-import shutil
-
-from atelier.persistence.base import RepoABC, Asset
-from atelier.persistence.odb import ObjectDB
-
-
-# ------------------------------------------------------------------------------------------------ #
-class Repo(RepoABC):
-    """Repository object
-
-    Args:
-        name (str): The name of the repository.
-        location (str): The directory in which the repository will be created.
-    """
-
-    def __init__(self, name: str, location: str, safe_mode: bool = True) -> None:
-        super().__init__()
-        self._name = name
-        self._location = location
-        self._safe_mode = safe_mode
-        self._db_filepath = os.path.join(self._location, self._name, "repository.db")
-        self._repo_location = os.path.dirname(self._db_filepath)
-        self._db = ObjectDB(name=name, filepath=self._db_filepath)
-
-    @property
-    def name(self) -> str:
-        """Returns the name of the repository."""
-        return self._name
-
-    @property
-    def location(self) -> str:
-        """Returns the location (directory) in which the repository resides."""
-        return self._repo_location
-
-    @property
-    def size(self) -> int:
-        return self._size()
-
-    def add(self, asset: Asset) -> Asset:
-        """Adds an asset to the repository and returns it."""
-        asset.added = datetime.now()
-        with self._db as db:
-            db.insert(key=asset.name, value=asset)
-        return asset
-
-    def get(self, name: str) -> Asset:
-        """Obtains an item from the repository."""
-        with self._db as db:
-            return db.select(key=name)
-
-    def getall(self) -> dict:
-        """Obtains an item from the repository."""
-        with self._db as db:
-            return db.selectall()
-
-    def update(self, asset: Asset) -> Asset:
-        """Updates an existing item in the repository and returns it."""
-        asset.modified = datetime.now()
-        with self._db as db:
-            db.update(key=asset.name, value=asset)
-        return asset
-
-    def exists(self, name: str) -> bool:
-        """Returns a boolean indicating the existence of the named asset."""
-        with self._db as db:
-            return db.exists(key=name)
-
-    def remove(self, name: str) -> None:
-        """Removes an existing item from the repository."""
-        with self._db as db:
-            db.delete(key=name)
-
-    def print(self) -> None:
-        """Prints the inventory of items."""
-        data = []
-        with self._db as db:
-            assets = db.selectall()
-        for asset in assets.values():
-            d = {}
-            d["name"] = asset.name
-            d["description"] = asset.description
-            d["memory"] = asset.memory
-            d["created"] = asset.created
-            d["added"] = asset.added
-            d["modified"] = asset.modified
-            data.append(d)
-        df = pd.DataFrame(data=data)
-        print(df)
-
-    def drop(self) -> None:
-        """Deletes the workspace"""
-        if self._safe_mode:
-            x = input("This will permanently delete the workspace. Are you sure? [y/n] ")
-            if "y" in x:
-                shutil.rmtree(self._repo_location, ignore_errors=True)
-        else:
-            shutil.rmtree(self._repo_location, ignore_errors=True)
-
-    def _size(self) -> int:
-        """Returns the size of the repository."""
-        size = 0
-        objects = self.getall()
-        for object in objects.values():
-            size += object.memory
-        return size
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/repo.py                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 09:39:53 am                                                 #
+# Modified   : Thursday March 2nd 2023 04:22:33 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+from __future__ import annotations
+from contextlib import contextmanager
+import os
+from datetime import datetime
+from functools import partial
+import pandas as pd
+import shutil
+from typing import Any, Callable, Iterable, Iterator
+import weakref
+
+from atelier.persistence.base import SIZE_KEY, RepoABC, Asset
+from atelier.persistence.blob import BlobRef, BlobStore
+from atelier.persistence.cache import ObjectCache
+from atelier.persistence.database import BatchResult, Database, ScanPage
+from atelier.persistence.exceptions import ObjectExistsError, ObjectNotFoundError
+from atelier.persistence.factory import DatabaseFactory
+from atelier.persistence.journal import Journal
+from atelier.persistence.lock import FileLock
+from atelier.persistence.metrics import timed
+from atelier.utils.memory import estimate_size
+
+# ------------------------------------------------------------------------------------------------ #
+METADATA = ["name", "description", "memory", "created", "added", "modified"]
+BLOB_THRESHOLD = 1048576
+# ------------------------------------------------------------------------------------------------ #
+# With automatic compaction, dead space is measured every COMPACT_INTERVAL updates and removals,
+# and at the end of each session. Databases with less dead space than COMPACT_MIN_BYTES are
+# left alone.
+COMPACT_INTERVAL = 100
+COMPACT_MIN_BYTES = 1048576
+# ------------------------------------------------------------------------------------------------ #
+# Partitions of an asset's payload are stored under the asset's name and the partition's name,
+# joined by PART_SEPARATOR. Asset names may not contain it.
+PART_SEPARATOR = "#"
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Repo(RepoABC):
+    """Repository object
+
+    Alongside the assets, the repository maintains a metadata table holding each asset's name,
+    description, memory, timestamps and column statistics. The table is updated on add, update
+    and remove, along with a running total of the assets' memory, so the inventory and column
+    statistics are served without loading asset payloads and the size without reading the
+    table. recompute_size recounts the total from the table.
+
+    Asset payloads, such as a Dataset's data, are stored apart from the assets themselves.
+    Assets obtained from the repository are lazy: their payloads are loaded on first access.
+    Payloads of assets at or above the blob threshold are written as individual files in the
+    repository's blob store. Blob files are written directly from memory and memory-mapped on
+    read, so large payloads are saved and loaded without a second copy in RAM. Blobs are
+    content-addressed and reference-counted, so identical payloads are written once, and a blob
+    store may be shared, as by all repositories in a studio. The logical size counts every
+    payload in full; the physical size counts each shared blob once.
+
+    Partitioned payloads, such as those of a PartitionedDataset, are stored a partition at a
+    time and loaded a partition at a time. Updating a partitioned asset writes only the
+    partitions added since it was stored, so appending a partition leaves the rest untouched.
+
+    Optionally, assets returned by get are held in an in-process LRU cache bounded by a byte
+    budget, charged by each asset's memory. Updates and removals through the repository
+    invalidate cached entries; changes made by other processes are not seen while an asset
+    remains cached.
+
+    Updates and removals leave dead space in the database files, which compact reclaims by
+    rewriting the live items into fresh files. Given a compact threshold, databases are
+    compacted automatically once the fraction of their files held by dead space reaches it.
+
+    Adds, updates and removals made within a transaction are held until the transaction ends,
+    then written to a journal and applied together in one session. A transaction ending in an
+    exception is discarded. A journal left by a process that died while applying it is
+    replayed when the repository is next opened, so either all of a transaction's changes are
+    made or none are.
+
+    The latency of each operation, and the bytes read and written, are reported by stats.
+
+    Args:
+        name (str): The name of the repository.
+        location (str): The directory in which the repository will be created.
+        safe_mode (bool): Whether to prompt for confirmation before dropping the repository.
+        engine (str): Storage engine for the repository database. One of 'shelve' (default),
+            'sqlite' or 'sharded'.
+        cache_size (int): Byte budget for the asset cache. Defaults to None, no caching.
+        blob_threshold (int): Memory in bytes at or above which an asset's payload is written
+            to the blob store. Defaults to 1 MiB. None stores all payloads in the database.
+        blob_location (str): Directory of the blob store. Defaults to a 'blobs' directory in
+            the repository.
+        codec (str): Compression codec for assets and payloads stored in the database. One of
+            'none' (default), 'zlib', 'lzma', or 'zstd' and 'lz4' when installed. The codec is
+            recorded with each value, so a repository's codec may be changed at any time.
+        frame_format (str): Blob format for DataFrames. Either 'pkl5' (default), a protocol 5
+            pickle with memory-mapped buffers, or 'parquet'.
+        compact_threshold (float): Fraction of a database's files held by dead space at which
+            it is compacted automatically. Defaults to None, compacting only on request.
+        shards (int): Number of shards of each database of a new repository using the
+            'sharded' engine. Defaults to 16. Fixed once the repository is created.
+        compact_dtypes (bool): Whether assets added are compacted first, casting the columns of
+            datasets to smaller dtypes. See Dataset.compact. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        location: str,
+        safe_mode: bool = True,
+        engine: str = "shelve",
+        cache_size: int = None,
+        blob_threshold: int = BLOB_THRESHOLD,
+        blob_location: str = None,
+        codec: str = "none",
+        frame_format: str = "pkl5",
+        compact_threshold: float = None,
+        shards: int = None,
+        compact_dtypes: bool = False,
+    ) -> None:
+        super().__init__()
+        self._name = name
+        self._location = location
+        self._safe_mode = safe_mode
+        self._db_filepath = os.path.join(self._location, self._name, "repository.db")
+        self._repo_location = os.path.dirname(self._db_filepath)
+        self._engine = engine
+        self._codec = codec
+        self._db = DatabaseFactory.database(
+            name=name, filepath=self._db_filepath, engine=engine, codec=codec, shards=shards
+        )
+        self._metadata_filepath = os.path.join(self._repo_location, "metadata.db")
+        self._metadata = DatabaseFactory.database(
+            name=f"{name}_metadata",
+            filepath=self._metadata_filepath,
+            engine=engine,
+            shards=shards,
+        )
+        self._payloads_filepath = os.path.join(self._repo_location, "payloads.db")
+        self._payloads = DatabaseFactory.database(
+            name=f"{name}_payloads",
+            filepath=self._payloads_filepath,
+            engine=engine,
+            codec=codec,
+            shards=shards,
+        )
+        self._blob_location = blob_location or os.path.join(self._repo_location, "blobs")
+        self._blobs = BlobStore(
+            location=self._blob_location, engine=engine, frame_format=frame_format
+        )
+        self._blob_threshold = blob_threshold
+        self._cache = ObjectCache(capacity=cache_size) if cache_size else None
+        self._compact_threshold = compact_threshold
+        self._compact_dtypes = compact_dtypes
+        self._writes = 0
+        self._journal = Journal(filepath=os.path.join(self._repo_location, "journal"))
+        self._journal_lock = FileLock(filepath=os.path.join(self._repo_location, "journal.lock"))
+        self._operations = None
+        self._pending = None
+        self._bound = weakref.WeakKeyDictionary()
+        self._recover()
+        self._migrate()
+
+    def __getstate__(self) -> dict:
+        """Transactions in progress aren't carried over to copies."""
+        state = self.__dict__.copy()
+        state["_operations"] = None
+        state["_pending"] = None
+        del state["_bound"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state.setdefault("_journal", Journal(os.path.join(state["_repo_location"], "journal")))
+        state.setdefault(
+            "_journal_lock", FileLock(os.path.join(state["_repo_location"], "journal.lock"))
+        )
+        state.setdefault("_operations", None)
+        state.setdefault("_pending", None)
+        state.setdefault("_compact_dtypes", False)
+        state["_bound"] = weakref.WeakKeyDictionary()
+        super().__setstate__(state)
+        self._recover()
+        self._migrate()
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the repository."""
+        return self._name
+
+    @property
+    def location(self) -> str:
+        """Returns the location (directory) in which the repository resides."""
+        return self._repo_location
+
+    @property
+    def engine(self) -> str:
+        """Returns the storage engine backing the database."""
+        return self._engine
+
+    @property
+    def codec(self) -> str:
+        """Returns the compression codec for values stored in the database."""
+        return self._codec
+
+    @property
+    def size(self) -> int:
+        return self._size()
+
+    @property
+    def blob_location(self) -> str:
+        """Returns the directory of the blob store."""
+        return self._blob_location
+
+    @property
+    def cache(self) -> ObjectCache:
+        """Returns the asset cache, or None if caching is disabled."""
+        return self._cache
+
+    @timed("add")
+    def add(self, asset: Asset, compact_dtypes: bool = None) -> Asset:
+        """Adds an asset to the repository and returns it.
+
+        Args:
+            asset (Asset): The asset to add.
+            compact_dtypes (bool): Whether the asset is compacted before it's stored. Defaults
+                to the repository's setting.
+        """
+        self._check_name(asset.name)
+        self._compact(asset, compact_dtypes)
+        if self._operations is not None:
+            if self.exists(asset.name):
+                msg = f"Object with key {asset.name} already exists in the repository {self._name}."
+                self._logger.error(msg)
+                raise ObjectExistsError(msg)
+            asset.added = datetime.now()
+            asset.detach()
+            self._stage(asset.name, asset)
+            return asset
+        asset.added = datetime.now()
+        with self._db as db:
+            db.insert(key=asset.name, value=asset.stub())
+        asset.detach()
+        payloads = self._save_payloads([asset])
+        record = self._describe(asset, payloads)
+        with self._metadata as mdb:
+            mdb.insert(key=asset.name, value=record)
+            self._tally(mdb, record["memory"])
+        return asset
+
+    @timed("add_many")
+    def add_many(self, assets: Iterable[Asset], compact_dtypes: bool = None) -> BatchResult:
+        """Adds many assets in one batch. Assets whose names already exist, were already given
+        earlier in the batch, or are reserved are reported in the result's errors; the rest of
+        the batch is added. See add."""
+        if self._operations is not None:
+            return self._stage_many(
+                lambda asset: self.add(asset, compact_dtypes=compact_dtypes),
+                assets,
+                (ObjectExistsError, ValueError),
+            )
+        added = datetime.now()
+        items = {}
+        rejected = {}
+        for asset in assets:
+            if asset.name in items:
+                msg = f"Object with key {asset.name} appears more than once in the batch."
+                self._logger.error(msg)
+                rejected[asset.name] = ObjectExistsError(msg)
+                continue
+            try:
+                self._check_name(asset.name)
+            except ValueError as e:
+                rejected[asset.name] = e
+                continue
+            self._compact(asset, compact_dtypes)
+            asset.added = added
+            items[asset.name] = asset
+        with self._db as db:
+            result = db.insert_many(items={name: asset.stub() for name, asset in items.items()})
+        result.items = {name: items[name] for name in result.items}
+        result.errors.update(rejected)
+        for asset in result.items.values():
+            asset.detach()
+        payloads = self._save_payloads(result.items.values())
+        records = {name: self._describe(asset, payloads) for name, asset in result.items.items()}
+        with self._metadata as mdb:
+            mdb.insert_many(items=records)
+            self._tally(mdb, sum(record["memory"] for record in records.values()))
+        return result
+
+    @timed("get")
+    def get(self, name: str) -> Asset:
+        """Obtains an item from the repository."""
+        if self._pending and name in self._pending:
+            if self._pending[name] is None:
+                msg = f"Object with key {name} not found in repository {self._name}."
+                self._logger.error(msg)
+                raise ObjectNotFoundError(msg)
+            return self._pending[name]
+        if self._cache is not None:
+            asset = self._cache.get(name)
+            if asset is not None:
+                return asset
+        with self._db.reading() as db:
+            asset = self._bind(db.select(key=name))
+        self._cache_put(asset)
+        return asset
+
+    def getall(self) -> dict:
+        """Obtains all items from the repository. Payloads are loaded on first access."""
+        with self._db.reading() as db:
+            assets = db.selectall()
+        return {name: self._bind(asset) for name, asset in assets.items()}
+
+    def iter_keys(self, where: Callable[[str], bool] = None) -> Iterator[str]:
+        """Yields the names of assets in the repository.
+
+        Args:
+            where (Callable): Optional predicate taking an asset name and returning True for
+                names to include.
+        """
+        with self._db.reading() as db:
+            names = list(db.iter_keys(where=where))
+        yield from names
+
+    def scan(
+        self,
+        prefix: str = None,
+        start: str = None,
+        end: str = None,
+        limit: int = None,
+        after: str = None,
+    ) -> ScanPage:
+        """Returns asset names in order, without reading assets or their payloads.
+
+        Example:
+            page = repo.scan(prefix="sales_2023_", limit=100)
+            while page.next is not None:
+                page = repo.scan(prefix="sales_2023_", limit=100, after=page.next)
+
+        Args:
+            prefix (str): Only names starting with the prefix.
+            start (str): Only names at or after start.
+            end (str): Only names before end.
+            limit (int): Maximum names per page. None returns all names in one page.
+            after (str): Only names after this name. Pass the previous page's next to paginate.
+        """
+        with self._db.reading() as db:
+            return db.scan(prefix=prefix, start=start, end=end, limit=limit, after=after)
+
+    def iter_items(self, where: Callable[[str], bool] = None) -> Iterator[tuple]:
+        """Yields (name, asset) pairs one at a time, optionally filtered by name.
+
+        Each asset is read when it is yielded and its payload is loaded on first access, so
+        memory is bounded by the assets the caller holds on to. The database isn't held open
+        between items, so the repository may be modified while iterating; assets removed in
+        the meantime are skipped.
+        """
+        for name in self.iter_keys(where=where):
+            with self._db.reading() as db:
+                if not db.exists(key=name):
+                    continue
+                asset = db.select(key=name)
+            yield name, self._bind(asset)
+
+    def iter_assets(self, where: Callable[[str], bool] = None) -> Iterator[Asset]:
+        """Yields assets one at a time, optionally filtered by name. See iter_items."""
+        for _, asset in self.iter_items(where=where):
+            yield asset
+
+    @timed("get_many")
+    def get_many(self, names: Iterable[str]) -> BatchResult:
+        """Obtains many items from the repository. Names not found are reported in the result's
+        errors."""
+        if self._cache is None:
+            with self._db.reading() as db:
+                result = db.select_many(keys=names)
+            for asset in result.items.values():
+                self._bind(asset)
+            return result
+
+        result = BatchResult()
+        missing = []
+        for name in names:
+            asset = self._cache.get(name)
+            if asset is None:
+                missing.append(name)
+            else:
+                result.items[name] = asset
+        with self._db.reading() as db:
+            selected = db.select_many(keys=missing)
+        for name, asset in selected.items.items():
+            self._cache_put(self._bind(asset))
+            result.items[name] = asset
+        result.errors = selected.errors
+        return result
+
+    @timed("update")
+    def update(self, asset: Asset) -> Asset:
+        """Updates an existing item in the repository and returns it."""
+        self._check_name(asset.name)
+        if self._operations is not None:
+            self._check_exists(asset.name)
+            asset.modified = datetime.now()
+            self._stage(asset.name, asset)
+            return asset
+        asset.modified = datetime.now()
+        self._cache_invalidate(asset.name)
+        with self._db as db:
+            db.update(key=asset.name, value=asset.stub())
+        self._save_record(asset)
+        self._auto_compact(writes=1)
+        return asset
+
+    def exists(self, name: str) -> bool:
+        """Returns a boolean indicating the existence of the named asset."""
+        if self._pending and name in self._pending:
+            return self._pending[name] is not None
+        if not self._db.might_contain(name):
+            return False
+        with self._db.reading() as db:
+            return db.exists(key=name)
+
+    @timed("remove")
+    def remove(self, name: str) -> None:
+        """Removes an existing item from the repository."""
+        if self._operations is not None:
+            self._check_exists(name)
+            self._stage(name, None)
+            return
+        self._cache_invalidate(name)
+        with self._db as db:
+            db.delete(key=name)
+        self._detach([name])
+        self._delete_payloads([name])
+        self._delete_records([name])
+        self._auto_compact(writes=1)
+
+    @timed("remove_many")
+    def remove_many(self, names: Iterable[str]) -> BatchResult:
+        """Removes many items from the repository. Names not found are reported in the result's
+        errors."""
+        if self._operations is not None:
+            return self._stage_many(self.remove, names, ObjectNotFoundError)
+        names = list(names)
+        for name in names:
+            self._cache_invalidate(name)
+        with self._db as db:
+            result = db.delete_many(keys=names)
+        self._detach(result.items.keys())
+        self._delete_payloads(result.items.keys())
+        self._delete_records(result.items.keys())
+        self._auto_compact(writes=len(result.items))
+        return result
+
+    @contextmanager
+    def transaction(self) -> Iterator[Repo]:
+        """Context manager grouping the adds, updates and removals made within the block into
+        one atomic commit.
+
+        Changes are held in memory until the block ends. Within the block, get and exists see
+        the pending changes; other reads see the repository as last committed. The repository's
+        databases are held open for writing for the duration of the block, so no other process
+        changes the repository in the meantime. On exit, the changes are written to the
+        journal, flushed to disk once, and applied. If the block raises, the changes are
+        discarded. Transactions may be nested; inner blocks join the outermost transaction.
+
+        Example:
+            with repo.transaction():
+                for asset in assets:
+                    repo.add(asset)
+                repo.remove("stale")
+        """
+        if self._operations is not None:
+            yield self
+            return
+        self._journal_lock.acquire()
+        try:
+            with self.session():
+                self._operations, self._pending = [], {}
+                try:
+                    yield self
+                    operations = self._operations
+                except Exception:
+                    self._logger.warning(
+                        f"Transaction on repository {self._name} rolled back: "
+                        f"{len(self._operations)} changes discarded."
+                    )
+                    raise
+                finally:
+                    self._operations, self._pending = None, None
+                self._commit(operations)
+        finally:
+            self._journal_lock.release()
+        self._auto_compact(writes=len(operations))
+
+    def column_stats(self, name: str) -> dict:
+        """Returns the statistics of each column of the named asset's payload from the metadata
+        table, without loading the asset or its payload. See atelier.data.stats."""
+        if self._pending and name in self._pending:
+            self._check_exists(name)
+            return self._pending[name].column_stats
+        with self._metadata.reading() as mdb:
+            if not mdb.exists(key=name):
+                msg = f"Object with key {name} not found in repository {self._name}."
+                self._logger.error(msg)
+                raise ObjectNotFoundError(msg)
+            return mdb.select(key=name).get("columns")
+
+    def inventory(self, where: Callable[[dict], bool] = None) -> pd.DataFrame:
+        """Returns the inventory of assets from the metadata table, without loading payloads.
+
+        Args:
+            where (Callable): Optional predicate taking an asset's metadata record and returning
+                True for assets to include.
+        """
+        records = self._records()
+        if where is not None:
+            records = [record for record in records if where(record)]
+        return pd.DataFrame(data=records, columns=METADATA)
+
+    def reindex(self) -> None:
+        """Rebuilds the metadata table from the stored assets. Repositories created before the
+        metadata table existed are reindexed when first opened."""
+        with self._db.reading() as db:
+            assets = db.selectall()
+        with self._payloads.reading() as pdb:
+            payloads = pdb.selectall()
+        with self._metadata as mdb:
+            mdb.clear()
+            mdb.insert_many(
+                items={name: self._describe(asset, payloads) for name, asset in assets.items()}
+            )
+            self._recount(mdb)
+
+    def print(self) -> None:
+        """Prints the inventory of items."""
+        print(self.inventory())
+
+    def drop(self) -> None:
+        """Deletes the workspace"""
+        if self._safe_mode:
+            x = input("This will permanently delete the workspace. Are you sure? [y/n] ")
+            if "y" not in x:
+                return
+        self.release_blobs()
+        shutil.rmtree(self._repo_location, ignore_errors=True)
+        if self._cache is not None:
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        """Returns the repository's stats, counting the bytes of blobs read and written."""
+        stats = super().stats()
+        stats["blobs"] = self._blobs.stats()
+        stats["bytes_read"] += stats["blobs"]["counters"].get("bytes_read", 0)
+        stats["bytes_written"] += stats["blobs"]["counters"].get("bytes_written", 0)
+        return stats
+
+    def compact(self) -> int:
+        """Compacts the repository's databases and the blob store's reference counts,
+        returning the bytes reclaimed."""
+        reclaimed = super().compact() + self._blobs.compact()
+        self._writes = 0
+        return reclaimed
+
+    def close_session(self) -> None:
+        """Ends the session, then compacts if a compact threshold is set and items were
+        updated or removed."""
+        super().close_session()
+        if self._writes:
+            self._auto_compact(writes=COMPACT_INTERVAL)
+
+    def release_blobs(self) -> None:
+        """Releases the repository's references to blobs, deleting blobs no longer referenced.
+        Called when the repository is dropped, so blobs in a shared store aren't leaked."""
+        if not os.path.exists(self._repo_location):
+            return
+        for ref in self._blob_refs():
+            self._blobs.delete(ref)
+
+    def clone(self) -> Repo:
+        """Returns a copy with its own database connections, sharing this repository's cache
+        so invalidations are seen by both."""
+        clone = super().clone()
+        clone._cache = self._cache
+        return clone
+
+    def recompute_size(self) -> int:
+        """Recomputes the size from the memory recorded for each asset, replacing the running
+        total, and returns it."""
+        with self._metadata as mdb:
+            return self._recount(mdb)
+
+    def _size(self) -> int:
+        """Returns the size of the repository from the running total."""
+        return self._total()
+
+    def _total(self) -> int:
+        """Returns the running total of size held in the metadata table, recounting it if
+        missing."""
+        with self._metadata.reading() as mdb:
+            if mdb.exists(key=SIZE_KEY):
+                return mdb.select(key=SIZE_KEY)
+        with self._metadata as mdb:
+            return self._recount(mdb)
+
+    def _tally(self, mdb: Database, delta: int) -> None:
+        """Adds delta to the running total of size, recounting it if missing. Called with the
+        metadata table connected for writing, after the change is recorded."""
+        if mdb.exists(key=SIZE_KEY):
+            mdb.update(key=SIZE_KEY, value=mdb.select(key=SIZE_KEY) + delta)
+        else:
+            self._recount(mdb)
+
+    def _recount(self, mdb: Database) -> int:
+        """Recounts the running total of size from the metadata records and returns it. Called
+        with the metadata table connected for writing."""
+        total = sum(record["memory"] for key, record in mdb.selectall().items() if key != SIZE_KEY)
+        if mdb.exists(key=SIZE_KEY):
+            mdb.update(key=SIZE_KEY, value=total)
+        else:
+            mdb.insert(key=SIZE_KEY, value=total)
+        return total
+
+    def _cache_put(self, asset: Asset) -> None:
+        if self._cache is not None:
+            self._cache.put(key=asset.name, value=asset, size=asset.memory)
+
+    def _cache_invalidate(self, name: str) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(name)
+
+    def _databases(self) -> list:
+        return [self._db, self._metadata, self._payloads]
+
+    def _stage(self, name: str, asset: Asset) -> None:
+        """Adds a change to the transaction. Removals are staged with no asset. Assets whose
+        payloads aren't loaded are journaled without them and their payloads left unchanged,
+        unless they hold partitions not yet stored."""
+        staged = asset if asset is None or asset.is_loaded or asset.parts() else asset.stub()
+        self._operations.append((name, staged))
+        self._pending[name] = asset
+
+    def _stage_many(self, stage: Callable, items: Iterable, error: type | tuple) -> BatchResult:
+        """Stages a batch of changes, reporting items that fail in the result's errors."""
+        result = BatchResult()
+        for item in items:
+            name = item if isinstance(item, str) else item.name
+            try:
+                stage(item)
+            except error as exception:
+                result.errors[name] = exception
+            else:
+                result.items[name] = None if isinstance(item, str) else item
+        return result
+
+    def _compact(self, asset: Asset, compact_dtypes: bool = None) -> None:
+        """Compacts an asset about to be added if asked to, or if the repository compacts
+        assets added. Asset.compact reports the memory saved."""
+        if self._compact_dtypes if compact_dtypes is None else compact_dtypes:
+            asset.compact()
+
+    def _check_name(self, name: str) -> None:
+        """Rejects names that would collide with keys the repository stores: those containing
+        PART_SEPARATOR, which joins an asset's name to its partitions', and SIZE_KEY."""
+        if PART_SEPARATOR in name or name == SIZE_KEY:
+            msg = (
+                f"Asset name {name} is reserved or contains the reserved character "
+                f"'{PART_SEPARATOR}'."
+            )
+            self._logger.error(msg)
+            raise ValueError(msg)
+
+    def _check_exists(self, name: str) -> None:
+        if not self.exists(name):
+            msg = f"Object with key {name} not found in repository {self._name}."
+            self._logger.error(msg)
+            raise ObjectNotFoundError(msg)
+
+    def _commit(self, operations: list) -> None:
+        """Journals the transaction's changes, applies them and clears the journal. If the
+        changes can't all be applied, the journal is kept and replayed on next open."""
+        if not operations:
+            return
+        self._journal.write(operations)
+        self._apply(operations)
+        self._journal.clear()
+        self._logger.debug(f"Committed {len(operations)} changes to repository {self._name}.")
+
+    def _apply(self, operations: list) -> None:
+        """Applies journaled changes in one session. Changes are applied as writes and deletes
+        of the final state, so applying a journal more than once has the same effect."""
+        with self.session():
+            for name, asset in operations:
+                self._cache_invalidate(name)
+                with self._db as db:
+                    exists = db.exists(key=name)
+                    if asset is None and exists:
+                        db.delete(key=name)
+                    elif asset is not None and exists:
+                        db.update(key=name, value=asset.stub())
+                    elif asset is not None:
+                        db.insert(key=name, value=asset.stub())
+                if asset is None:
+                    self._detach([name])
+                    self._delete_payloads([name])
+                    self._delete_records([name])
+                else:
+                    self._save_record(asset)
+
+    def _recover(self) -> None:
+        """Replays a committed journal left by a process that died while applying it, and
+        discards one left by a transaction that never committed."""
+        if not (self._journal.committed or self._journal.incomplete):
+            return
+        self._journal_lock.acquire()
+        try:
+            if self._journal.incomplete:
+                self._logger.warning(
+                    f"Discarding uncommitted transaction journal in repository {self._name}."
+                )
+                self._journal.discard()
+            if self._journal.committed:
+                operations = self._journal.read()
+                self._logger.warning(
+                    f"Replaying {len(operations)} journaled changes in repository {self._name}."
+                )
+                self._apply(operations)
+                self._journal.clear()
+        finally:
+            self._journal_lock.release()
+
+    def _migrate(self) -> None:
+        """Reindexes a repository created before the metadata table existed, whose assets would
+        otherwise be missing from the inventory and size. New repositories start the running
+        total when created, so their metadata table is never empty, even while the first asset
+        is being added."""
+        with self._metadata.reading() as mdb:
+            if next(mdb.iter_keys(), None) is not None:
+                return
+        with self._db.reading() as db:
+            empty = next(db.iter_keys(), None) is None
+        if not empty:
+            self._logger.warning(f"Rebuilding the metadata table of repository {self._name}.")
+            self.reindex()
+            return
+        with self._metadata as mdb:
+            if not mdb.exists(key=SIZE_KEY):
+                mdb.insert(key=SIZE_KEY, value=0)
+
+    def _save_record(self, asset: Asset) -> None:
+        """Writes the asset's payload, if loaded, and its metadata record. The blob reference
+        of a payload not rewritten is kept."""
+        payloads = self._save_payloads([asset])
+        record = self._describe(asset, payloads)
+        dropped = []
+        with self._metadata as mdb:
+            if mdb.exists(key=asset.name):
+                previous = mdb.select(key=asset.name)
+                if asset.name not in payloads:
+                    record["blob"] = previous.get("blob")
+                if record.get("parts") is not None:
+                    stored = previous.get("parts") or {}
+                    for partition in record["parts"]:
+                        if self._part_key(asset.name, partition) not in payloads:
+                            record["parts"][partition] = stored.get(partition)
+                    dropped = [
+                        self._part_key(asset.name, partition)
+                        for partition in stored
+                        if partition not in record["parts"]
+                    ]
+                mdb.update(key=asset.name, value=record)
+                self._tally(mdb, record["memory"] - previous["memory"])
+            else:
+                mdb.insert(key=asset.name, value=record)
+                self._tally(mdb, record["memory"])
+        self._delete_keys(dropped)
+
+    def _delete_records(self, names: Iterable[str]) -> None:
+        """Deletes the metadata records of assets, deducting their memory from the total."""
+        with self._metadata as mdb:
+            records = mdb.select_many(keys=[name for name in names if mdb.exists(key=name)])
+            if records.items:
+                mdb.delete_many(keys=records.items.keys())
+                self._tally(mdb, -sum(record["memory"] for record in records.items.values()))
+
+    def _auto_compact(self, writes: int) -> None:
+        """Counts updates and removals and, every COMPACT_INTERVAL of them outside a session,
+        compacts the databases in which dead space has reached the compact threshold."""
+        if self._compact_threshold is None:
+            return
+        self._writes += writes
+        dbs = self._databases()
+        if self._writes < COMPACT_INTERVAL or any(db.in_session for db in dbs):
+            return
+        self._writes = 0
+        for db in dbs:
+            with db.reading():
+                garbage, usage = db.garbage(), db.disk_usage
+            if garbage >= COMPACT_MIN_BYTES and garbage >= self._compact_threshold * usage:
+                self._logger.info(
+                    f"Dead space of {garbage} bytes in {db.name} reached the compact threshold."
+                )
+                db.compact()
+
+    def _storage(self) -> tuple:
+        db_bytes, _ = super()._storage()
+        return db_bytes, self._blob_refs()
+
+    def _blob_refs(self) -> list:
+        """Returns the blob references held by the repository's assets."""
+        refs = []
+        for record in self._records():
+            if record.get("blob") is not None:
+                refs.append(record["blob"])
+            refs.extend(ref for ref in (record.get("parts") or {}).values() if ref is not None)
+        return refs
+
+    def _bind(self, asset: Asset) -> Asset:
+        """Binds the loader for the asset's payload."""
+        loader = partial(self._load_payload, asset.name)
+        asset.bind(loader)
+        self._bound[asset] = loader
+        return asset
+
+    def _detach(self, names: Iterable[str]) -> None:
+        """Detaches assets obtained from the repository and still in use from payloads about
+        to be deleted, loading the payloads into them, so they can be added again."""
+        names = set(names)
+        for asset, loader in list(self._bound.items()):
+            if asset.name in names:
+                asset.detach(loader)
+
+    def _load_payload(self, name: str, partition: str = None) -> Any:
+        """Loads an asset's payload, or the named partition of a partitioned payload."""
+        key = name if partition is None else self._part_key(name, partition)
+        with self._payloads.reading() as pdb:
+            payload = pdb.select(key=key)
+        if isinstance(payload, BlobRef):
+            payload = self._blobs.get(payload)
+        return payload
+
+    def _save_payloads(self, assets: Iterable[Asset]) -> dict:
+        """Writes the payloads of loaded assets, replacing any existing payloads, and returns
+        the stored payloads by key: an asset's name, or for partitions, the key from _part_key.
+        Assets whose payloads were never loaded are unchanged and aren't rewritten; of
+        partitioned payloads, only the partitions not yet stored are written."""
+        payloads = {}
+        partitioned = []
+        for asset in assets:
+            if asset.partitions is not None:
+                for partition, payload in asset.parts().items():
+                    key = self._part_key(asset.name, partition)
+                    payloads[key] = self._store(payload, estimate_size(payload))
+                partitioned.append(asset)
+            elif asset.is_loaded and asset.payload is not None:
+                payloads[asset.name] = self._store(asset.payload, asset.memory)
+        if not payloads:
+            return payloads
+        self._delete_keys(payloads.keys())
+        with self._payloads as pdb:
+            pdb.insert_many(items=payloads)
+        for asset in partitioned:
+            self._bind(asset)
+        return payloads
+
+    def _store(self, payload: Any, memory: int) -> Any:
+        """Writes large payloads to the blob store, returning the reference or the payload."""
+        if self._blob_threshold is not None and memory >= self._blob_threshold:
+            return self._blobs.put(payload)
+        return payload
+
+    def _delete_payloads(self, names: Iterable[str]) -> None:
+        """Deletes the stored payloads of assets, including every partition of partitioned
+        payloads."""
+        names = list(names)
+        with self._metadata.reading() as mdb:
+            records = mdb.select_many(keys=[name for name in names if mdb.exists(key=name)])
+        partitions = [
+            self._part_key(name, partition)
+            for name, record in records.items.items()
+            for partition in record.get("parts") or {}
+        ]
+        self._delete_keys(names + partitions)
+
+    def _delete_keys(self, keys: Iterable[str]) -> None:
+        """Deletes stored payloads by key, along with their blob files."""
+        with self._payloads as pdb:
+            payloads = pdb.select_many(keys=[key for key in keys if pdb.exists(key=key)])
+            pdb.delete_many(keys=payloads.items.keys())
+        for payload in payloads.items.values():
+            if isinstance(payload, BlobRef):
+                self._blobs.delete(payload)
+
+    def _part_key(self, name: str, partition: str) -> str:
+        """Returns the key under which a partition of an asset's payload is stored."""
+        return f"{name}{PART_SEPARATOR}{partition}"
+
+    def _records(self) -> list:
+        """Returns the metadata records for all assets."""
+        with self._metadata.reading() as mdb:
+            return [record for key, record in mdb.selectall().items() if key != SIZE_KEY]
+
+    def _describe(self, asset: Asset, payloads: dict) -> dict:
+        """Returns the metadata record for an asset, including the reference to its blob if
+        the stored payload is one. Records of partitioned assets map each partition to its
+        blob reference, if stored in one."""
+        payload = payloads.get(asset.name)
+        record = {
+            "name": asset.name,
+            "description": asset.description,
+            "memory": asset.memory,
+            "created": asset.created,
+            "added": asset.added,
+            "modified": asset.modified,
+            "blob": payload if isinstance(payload, BlobRef) else None,
+            "columns": asset.column_stats,
+        }
+        if asset.partitions is not None:
+            record["parts"] = {}
+            for partition in asset.partitions:
+                stored = payloads.get(self._part_key(asset.name, partition))
+                record["parts"][partition] = stored if isinstance(stored, BlobRef) else None
+        return record
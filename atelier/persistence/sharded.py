@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/sharded.py                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Hash-Sharded Object Database Module"""
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import heapq
+from itertools import chain
+import json
+import os
+from typing import Any, Callable, Iterable, Iterator
+
+from atelier.persistence.database import BatchResult, Database
+from atelier.persistence.exceptions import ObjectDatabaseConnectionError
+from atelier.persistence.lock import FileLock
+from atelier.persistence.metrics import timed
+from atelier.persistence.odb import ObjectDB
+
+# ------------------------------------------------------------------------------------------------ #
+# Default number of shards, and the most threads a batch operation runs across shards.
+SHARDS = 16
+MAX_WORKERS = 8
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SHARDED DB                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class ShardedDB(Database):
+    """Object Database spreading its keys across several shelve files by key hash.
+
+    Each key is stored in one of N shards, ObjectDBs in files named '<filepath>.shard-NNN',
+    chosen by a stable hash of the key. Shards are opened on first use within a connection,
+    so an operation on a few keys opens only the shards holding them, each a fraction of the
+    size of a single file. Each shard keeps its own key index and Bloom filter. Batch
+    operations group their keys by shard and run each shard's
+    part in parallel threads.
+
+    The number of shards is fixed when the database is created and recorded in a
+    '<filepath>.shards' manifest; a different count given when opening an existing database
+    is ignored. Connections take a reader/writer lock on the whole database before opening
+    shards, so writers never wait on one another shard by shard.
+
+    Args:
+        name (str): The name of the database.
+        filepath (str): Path from which the shard files are named.
+        codec (str): Compression codec for values written.
+        shards (int): Number of shards for a new database. Defaults to 16. Ignored when the
+            database exists.
+        timeout (float): Seconds to wait for the file lock. None waits indefinitely.
+        max_workers (int): Most threads used by a batch operation. Defaults to 8.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        filepath: str,
+        codec: str = "none",
+        shards: int = None,
+        timeout: float = 30.0,
+        max_workers: int = MAX_WORKERS,
+    ) -> None:
+        super().__init__(name=name, filepath=filepath, codec=codec)
+        os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+        self._count = self._load_manifest(shards)
+        self._shards = [
+            ObjectDB(
+                name=f"{name}_shard_{i:03d}",
+                filepath=f"{self._filepath}.shard-{i:03d}",
+                codec=codec,
+                timeout=timeout,
+            )
+            for i in range(self._count)
+        ]
+        self._lock = FileLock(filepath=f"{self._filepath}.lock", timeout=timeout)
+        self._max_workers = max_workers
+        self._readonly = False
+
+    @property
+    def shards(self) -> int:
+        """Returns the number of shards."""
+        return self._count
+
+    def stats(self) -> dict:
+        """Returns the operation latencies, with the counters summed over the shards, and the
+        stats of each shard."""
+        stats = super().stats()
+        shards = [shard.stats() for shard in self._shards]
+        for shard in shards:
+            for name, value in shard["counters"].items():
+                stats["counters"][name] = stats["counters"].get(name, 0) + value
+        stats["lock"] = self._lock.stats()
+        stats["shards"] = shards
+        return stats
+
+    @timed("connect")
+    def connect(self, readonly: bool = False) -> None:
+        """Connects to the database, taking a shared lock if readonly, else an exclusive lock.
+        Shards are opened as they are first used."""
+        if self._is_connected:
+            self.close()
+        with self._metrics.time("lock_wait"):
+            self._lock.acquire(shared=readonly)
+        self._readonly = readonly
+        self._is_connected = True
+
+    def close(self) -> None:
+        """Closes the open shards and releases the lock."""
+        try:
+            for shard in self._shards:
+                if shard.is_connected:
+                    shard.close()
+        finally:
+            self._lock.release()
+            self._is_connected = False
+
+    def flush(self) -> None:
+        """Writes pending changes to the open shards through to their files."""
+        self._check_connected()
+        for shard in self._shards:
+            if shard.is_connected:
+                shard.flush()
+
+    @timed("insert")
+    def insert(self, key: str, value: Any) -> None:
+        """Inserts a key/value pair into the database."""
+        self._shard(key).insert(key=key, value=value)
+
+    @timed("insert_many")
+    def insert_many(self, items: dict) -> BatchResult:
+        """Inserts many key/value pairs, each shard's in parallel. Keys that already exist
+        are reported in the result's errors."""
+        groups = self._group(items.keys())
+        return self._map(
+            "insert_many",
+            {index: {key: items[key] for key in keys} for index, keys in groups.items()},
+            order=items.keys(),
+        )
+
+    @timed("select")
+    def select(self, key: str) -> Any:
+        """Retrieves data from the database"""
+        return self._shard(key).select(key=key)
+
+    @timed("select_many")
+    def select_many(self, keys: Iterable[str]) -> BatchResult:
+        """Retrieves many objects, each shard's in parallel. Keys not found are reported in
+        the result's errors."""
+        keys = list(keys)
+        return self._map("select_many", self._group(keys), order=keys)
+
+    @timed("selectall")
+    def selectall(self) -> dict:
+        """Retrieves all data from the database"""
+        objects = {}
+        for shard in self._open_shards():
+            objects.update(shard.selectall())
+        return objects
+
+    def iter_keys(self, where: Callable[[str], bool] = None) -> Iterator[str]:
+        """Yields the keys in the database shard by shard, optionally filtered."""
+        return chain.from_iterable(shard.iter_keys(where=where) for shard in self._open_shards())
+
+    def iter_items(self, where: Callable[[str], bool] = None) -> Iterator[tuple]:
+        """Yields (key, object) pairs shard by shard, optionally filtered by key."""
+        return chain.from_iterable(shard.iter_items(where=where) for shard in self._open_shards())
+
+    @timed("update")
+    def update(self, key: str, value: Any) -> None:
+        """Updates an existing object in the database."""
+        self._shard(key).update(key=key, value=value)
+
+    @timed("delete")
+    def delete(self, key: str) -> None:
+        """Deletes existing data."""
+        self._shard(key).delete(key=key)
+
+    @timed("delete_many")
+    def delete_many(self, keys: Iterable[str]) -> BatchResult:
+        """Deletes many objects, each shard's in parallel. Keys not found are reported in the
+        result's errors."""
+        keys = list(keys)
+        return self._map("delete_many", self._group(keys), order=keys)
+
+    def exists(self, key: str) -> bool:
+        """Checks existence of an item in the database."""
+        return self._shard(key).exists(key=key)
+
+    def might_contain(self, key: str) -> bool:
+        """Returns False if the key's shard rules it out with its Bloom filter."""
+        return self._shards[self._index(key)].might_contain(key)
+
+    def clear(self) -> None:
+        """Deletes all objects in the database."""
+        for shard in self._open_shards():
+            shard.clear()
+
+    def compact(self) -> int:
+        """Compacts each shard under the exclusive lock, returning the bytes reclaimed."""
+        if self._is_connected:
+            msg = f"Database {self._name} must be closed before it is compacted."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        self._lock.acquire()
+        try:
+            return sum(shard.compact() for shard in self._shards)
+        finally:
+            self._lock.release()
+
+    def garbage(self) -> int:
+        """Returns the dead space summed over the shards."""
+        return sum(shard.garbage() for shard in self._open_shards())
+
+    def _ordered_keys(self, lower: str = "", after: str = None) -> Iterator[str]:
+        """Merges the ordered keys of every shard."""
+        return heapq.merge(
+            *[shard._ordered_keys(lower=lower, after=after) for shard in self._open_shards()]
+        )
+
+    def _index(self, key: str) -> int:
+        """Returns the shard for the key. The hash is stable across processes."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") % self._count
+
+    def _shard(self, key: str) -> ObjectDB:
+        return self._open(self._index(key))
+
+    def _open(self, index: int) -> ObjectDB:
+        """Returns the shard, opening it if it isn't open in this connection."""
+        self._check_connected()
+        shard = self._shards[index]
+        if not shard.is_connected:
+            shard.connect(readonly=self._readonly)
+        return shard
+
+    def _open_shards(self) -> list:
+        return [self._open(index) for index in range(self._count)]
+
+    def _group(self, keys: Iterable[str]) -> dict:
+        """Groups keys by shard."""
+        groups = {}
+        for key in keys:
+            groups.setdefault(self._index(key), []).append(key)
+        return groups
+
+    def _map(self, method: str, groups: dict, order: Iterable[str]) -> BatchResult:
+        """Calls the batch method on each shard with its part of the batch, in parallel when
+        more than one shard is involved, and merges the results in the order of the keys."""
+
+        def call(index: int) -> BatchResult:
+            return getattr(self._open(index), method)(groups[index])
+
+        if len(groups) > 1 and self._max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(len(groups), self._max_workers)) as pool:
+                results = list(pool.map(call, groups))
+        else:
+            results = [call(index) for index in groups]
+        items, errors = {}, {}
+        for result in results:
+            items.update(result.items)
+            errors.update(result.errors)
+        result = BatchResult()
+        for key in order:
+            if key in items:
+                result.items[key] = items[key]
+            elif key in errors:
+                result.errors[key] = errors[key]
+        return result
+
+    def _check_connected(self) -> None:
+        if not self._is_connected:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+
+    def _load_manifest(self, shards: int) -> int:
+        """Returns the shard count recorded for the database, recording the count given if
+        the database is new."""
+        manifest = f"{self._filepath}.shards"
+        if os.path.exists(manifest):
+            with open(manifest) as file:
+                count = json.load(file)["shards"]
+            if shards is not None and shards != count:
+                self._logger.warning(
+                    f"Database {self._name} was created with {count} shards; the shard count "
+                    f"{shards} is ignored."
+                )
+            return count
+        shards = SHARDS if shards is None else shards
+        if not isinstance(shards, int) or shards < 1:
+            msg = f"Shard count must be a positive integer, not {shards}."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        with open(f"{manifest}.tmp", "w") as file:
+            json.dump({"shards": shards}, file)
+        os.replace(f"{manifest}.tmp", manifest)
+        return shards
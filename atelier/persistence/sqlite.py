@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/sqlite.py                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""SQLite Object Database Module"""
+from __future__ import annotations
+import os
+import sqlite3
+from typing import Any, Callable, Iterable, Iterator
+
+from atelier.persistence.database import BatchResult, Database
+from atelier.persistence.exceptions import (
+    ObjectExistsError,
+    ObjectNotFoundError,
+    ObjectDatabaseConnectionError,
+)
+from atelier.persistence.metrics import timed
+
+# ------------------------------------------------------------------------------------------------ #
+# SQLite limits the number of host parameters in a statement. Batches are queried in chunks.
+MAX_PARAMS = 900
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SQLITE DB                                                  #
+# ------------------------------------------------------------------------------------------------ #
+class SQLiteDB(Database):
+    """Object Database backed by SQLite in write-ahead logging (WAL) mode.
+
+    Objects are serialized into a single key/value table. In WAL mode, readers never block the
+    writer and the writer never blocks readers, so several processes can query a repository
+    while another ingests into it. Each write is committed in its own transaction; batch
+    operations commit once per batch. Pages freed by deletes are reused by later writes, and
+    returned to the file system by compact.
+
+    Args:
+        name (str): The name of the database.
+        filepath (str): Path to the SQLite database file.
+        codec (str): Compression codec for values written.
+        timeout (float): Seconds a writer waits for another writer's lock before failing.
+    """
+
+    def __init__(
+        self, name: str, filepath: str, codec: str = "none", timeout: float = 30.0
+    ) -> None:
+        super().__init__(name=name, filepath=filepath, codec=codec)
+        self._timeout = timeout
+        os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+
+    @timed("connect")
+    def connect(self, readonly: bool = False) -> None:
+        """Connects to the database, creating the object table if necessary. Read-only
+        connections are opened in read-only mode and never write. A read-only connection to a
+        database not yet created connects read-write to create it."""
+        if self._is_connected:
+            self.close()
+        if readonly and os.path.exists(self._filepath):
+            self._connection = sqlite3.connect(
+                f"file:{self._filepath}?mode=ro", uri=True, timeout=self._timeout
+            )
+            self._is_connected = True
+            return
+        self._connection = sqlite3.connect(self._filepath, timeout=self._timeout)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS objects (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._connection.commit()
+        self._is_connected = True
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        self._connection.close()
+        self._is_connected = False
+
+    def flush(self) -> None:
+        """Commits any pending transaction."""
+        self._execute(lambda cursor: None)
+
+    @timed("insert")
+    def insert(self, key: str, value: Any) -> None:
+        """Inserts a key/value pair into the database."""
+        try:
+            self._execute(
+                lambda cursor: cursor.execute(
+                    "INSERT INTO objects (key, value) VALUES (?, ?)", (key, self._dumps(value))
+                )
+            )
+        except sqlite3.IntegrityError:
+            msg = f"Object with key {key} already exists in the database {self._name}."
+            self._logger.error(msg)
+            raise ObjectExistsError(msg)
+
+    @timed("insert_many")
+    def insert_many(self, items: dict) -> BatchResult:
+        """Inserts many key/value pairs in a single transaction.
+
+        Keys that already exist are reported in the result's errors rather than aborting the
+        batch.
+
+        Args:
+            items (dict): Mapping of keys to values.
+        """
+        result = BatchResult()
+        existing = self._existing(items.keys())
+        rows = []
+        for key, value in items.items():
+            if key in existing:
+                msg = f"Object with key {key} already exists in the database {self._name}."
+                result.errors[key] = ObjectExistsError(msg)
+            else:
+                rows.append((key, self._dumps(value)))
+                existing.add(key)
+                result.items[key] = value
+        self._execute(
+            lambda cursor: cursor.executemany(
+                "INSERT INTO objects (key, value) VALUES (?, ?)", rows
+            )
+        )
+        self._log_batch("insert", result)
+        return result
+
+    @timed("select")
+    def select(self, key: str) -> Any:
+        """Retrieves data from the database"""
+        row = self._execute(
+            lambda cursor: cursor.execute(
+                "SELECT value FROM objects WHERE key = ?", (key,)
+            ).fetchone()
+        )
+        if row is None:
+            msg = f"Object with key {key} not found in database {self._name}."
+            self._logger.error(msg)
+            raise ObjectNotFoundError(msg)
+        return self._loads(row[0])
+
+    @timed("select_many")
+    def select_many(self, keys: Iterable[str]) -> BatchResult:
+        """Retrieves many objects, reporting keys not found in the result's errors."""
+        result = BatchResult()
+        keys = list(keys)
+        found = {}
+        for chunk in self._chunks(keys):
+            sql = f"SELECT key, value FROM objects WHERE key IN ({','.join('?' * len(chunk))})"
+            rows = self._execute(lambda cursor: cursor.execute(sql, chunk).fetchall())
+            found.update(rows)
+        for key in keys:
+            if key in found:
+                result.items[key] = self._loads(found[key])
+            else:
+                msg = f"Object with key {key} not found in database {self._name}."
+                result.errors[key] = ObjectNotFoundError(msg)
+        self._log_batch("select", result)
+        return result
+
+    @timed("selectall")
+    def selectall(self) -> dict:
+        """Retrieves all data from the database"""
+        rows = self._execute(
+            lambda cursor: cursor.execute("SELECT key, value FROM objects").fetchall()
+        )
+        return {key: self._loads(value) for key, value in rows}
+
+    def iter_keys(self, where: Callable[[str], bool] = None) -> Iterator[str]:
+        """Yields the keys in the database, optionally filtered."""
+        cursor = self._execute(lambda cursor: cursor.execute("SELECT key FROM objects"))
+        for (key,) in cursor:
+            if where is None or where(key):
+                yield key
+
+    def iter_items(self, where: Callable[[str], bool] = None) -> Iterator[tuple]:
+        """Yields (key, object) pairs one at a time from a cursor, optionally filtered by key.
+        Values of keys filtered out are not deserialized."""
+        cursor = self._execute(lambda cursor: cursor.execute("SELECT key, value FROM objects"))
+        for key, value in cursor:
+            if where is None or where(key):
+                yield key, self._loads(value)
+
+    @timed("update")
+    def update(self, key: str, value: Any) -> None:
+        """Updates an existing object in the database."""
+        count = self._execute(
+            lambda cursor: cursor.execute(
+                "UPDATE objects SET value = ? WHERE key = ?", (self._dumps(value), key)
+            ).rowcount
+        )
+        if count == 0:
+            msg = f"Object with key {key} not found in database {self._name}."
+            self._logger.error(msg)
+            raise ObjectNotFoundError(msg)
+
+    @timed("delete")
+    def delete(self, key: str) -> None:
+        """Deletes existing data."""
+        count = self._execute(
+            lambda cursor: cursor.execute("DELETE FROM objects WHERE key = ?", (key,)).rowcount
+        )
+        if count == 0:
+            msg = f"Object with key {key} doesn't exist in the database {self._name}."
+            self._logger.error(msg)
+            raise ObjectNotFoundError(msg)
+
+    @timed("delete_many")
+    def delete_many(self, keys: Iterable[str]) -> BatchResult:
+        """Deletes many objects in a single transaction, reporting keys not found in the
+        result's errors."""
+        result = BatchResult()
+        keys = list(keys)
+        existing = self._existing(keys)
+        for key in keys:
+            if key in existing:
+                result.items[key] = None
+                existing.discard(key)
+            else:
+                msg = f"Object with key {key} doesn't exist in the database {self._name}."
+                result.errors[key] = ObjectNotFoundError(msg)
+        self._execute(
+            lambda cursor: cursor.executemany(
+                "DELETE FROM objects WHERE key = ?", [(key,) for key in result.items]
+            )
+        )
+        self._log_batch("delete", result)
+        return result
+
+    def exists(self, key: str) -> bool:
+        """Checks existence of an item in the database."""
+        row = self._execute(
+            lambda cursor: cursor.execute("SELECT 1 FROM objects WHERE key = ?", (key,)).fetchone()
+        )
+        return row is not None
+
+    def clear(self) -> None:
+        """Clears the database of all objects."""
+        self._execute(lambda cursor: cursor.execute("DELETE FROM objects"))
+
+    def compact(self) -> int:
+        """Rebuilds the database file with VACUUM, which copies the live rows into a fresh
+        file and swaps it in within a single transaction, then truncates the write-ahead log.
+        Returns the bytes reclaimed."""
+        if self._is_connected:
+            msg = f"Database {self._name} must be closed before it is compacted."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        before = self.disk_usage
+        self.connect()
+        try:
+            self._connection.execute("VACUUM")
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            self.close()
+        reclaimed = max(0, before - self.disk_usage)
+        self._logger.info(f"Compacted database {self._name}, reclaiming {reclaimed} bytes.")
+        return reclaimed
+
+    def garbage(self) -> int:
+        """Returns the bytes held by free pages in the database file."""
+        pages = self._execute(lambda cursor: cursor.execute("PRAGMA freelist_count").fetchone())
+        size = self._execute(lambda cursor: cursor.execute("PRAGMA page_size").fetchone())
+        return pages[0] * size[0]
+
+    def _execute(self, statement) -> Any:
+        """Runs a statement against a cursor within a transaction and returns its result.
+
+        Args:
+            statement (Callable): Function taking a cursor and returning the statement result.
+        """
+        if not self._is_connected:
+            msg = f"Database connection {self._name} is closed."
+            self._logger.error(msg)
+            raise ObjectDatabaseConnectionError(msg)
+        with self._connection:
+            return statement(self._connection.cursor())
+
+    def _ordered_keys(self, lower: str = "", after: str = None) -> Iterator[str]:
+        """Yields keys in order from the primary key index."""
+        if after is not None and after >= lower:
+            sql, bound = "SELECT key FROM objects WHERE key > ? ORDER BY key", after
+        else:
+            sql, bound = "SELECT key FROM objects WHERE key >= ? ORDER BY key", lower
+        cursor = self._execute(lambda cursor: cursor.execute(sql, (bound,)))
+        for (key,) in cursor:
+            yield key
+
+    def _existing(self, keys: Iterable[str]) -> set:
+        """Returns the subset of keys present in the database."""
+        existing = set()
+        for chunk in self._chunks(list(keys)):
+            sql = f"SELECT key FROM objects WHERE key IN ({','.join('?' * len(chunk))})"
+            rows = self._execute(lambda cursor: cursor.execute(sql, chunk).fetchall())
+            existing.update(row[0] for row in rows)
+        return existing
+
+    def _chunks(self, keys: list) -> Iterable[list]:
+        for i in range(0, len(keys), MAX_PARAMS):
+            yield keys[i : i + MAX_PARAMS]
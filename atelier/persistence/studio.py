@@ -1,128 +1,187 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/persistence/studio.py                                                      #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 09:39:53 am                                                 #
-# Modified   : Thursday March 2nd 2023 04:21:47 pm                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-from __future__ import annotations
-
-import os
-import shutil
-
-import pandas as pd
-
-from atelier.persistence.base import RepoABC
-from atelier.persistence.odb import ObjectDB
-from atelier.persistence.workspace import Workspace
-
-
-# ------------------------------------------------------------------------------------------------ #
-class Studio(RepoABC):
-    """Studio object
-
-    Args:
-        name (str): The name of the studio.
-        location (str): The directory containing the studio. This defaults to the root directory.
-    """
-
-    def __init__(self, name: str, location: str = "", safe_mode: bool = True) -> None:
-        super().__init__()
-        self._name = name
-        self._location = location
-        self._safe_mode = safe_mode
-        self._studio_location = os.path.join(self._location, name + "/")
-        self._db_filepath = os.path.join(self._studio_location, "workspaces.db")
-        self._db = ObjectDB(name=name, filepath=self._db_filepath)
-
-    @property
-    def name(self) -> str:
-        """Returns the name of the studio."""
-        return self._name
-
-    @property
-    def location(self) -> str:
-        """Returns the name of the studio."""
-        return self._studio_location
-
-    @property
-    def size(self) -> int:
-        return self._size()
-
-    def create_workspace(self, name: str) -> Workspace:
-        """Creates a Workspace object"""
-        return Workspace(name=name, location=self._name)
-
-    def add(self, workspace: Workspace) -> Workspace:
-        """Adds a Workspace object to the studio."""
-        with self._db as db:
-            db.insert(key=workspace.name, value=workspace)
-        return workspace
-
-    def get(self, name: str) -> Workspace:
-        """Obtains an Workspace object from the studio."""
-        with self._db as db:
-            return db.select(key=name)
-
-    def getall(self) -> dict:
-        """Obtains an workspace from the studio."""
-        with self._db as db:
-            return db.selectall()
-
-    def update(self, workspace: Workspace) -> Workspace:
-        """Updates a workspace object in the studio."""
-        with self._db as db:
-            db.update(key=workspace.name, value=workspace)
-        return workspace
-
-    def exists(self, name: str) -> bool:
-        """Removes an existing item from the Workspace."""
-        with self._db as db:
-            return db.exists(key=name)
-
-    def remove(self, name: str) -> None:
-        """Removes an existing item from the Workspace."""
-        with self._db as db:
-            db.delete(key=name)
-
-    def print(self) -> None:
-        """Prints the inventory of items."""
-        data = []
-        with self._db as db:
-            workspaces = db.selectall()
-        for workspace in workspaces.values():
-            d = {}
-            d["name"] = workspace.name
-            d["location"] = workspace.location
-            d["size"] = workspace.size
-            data.append(d)
-        df = pd.DataFrame(data=data)
-        print(df)
-
-    def drop(self) -> None:
-        """Deletes the workspace"""
-        if self._safe_mode:
-            x = input("This will permanently delete the workspace. Are you sure? [y/n] ")
-            if "y" in x:
-                shutil.rmtree(self._studio_location, ignore_errors=True)
-        else:
-            shutil.rmtree(self._studio_location, ignore_errors=True)
-
-    def _size(self) -> int:
-        """Returns the size of the Workspace."""
-        size = 0
-        workspaces = self.getall()
-        for workspace in workspaces.values():
-            size += workspace.size
-        return size
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/studio.py                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 09:39:53 am                                                 #
+# Modified   : Thursday March 2nd 2023 04:21:47 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+from __future__ import annotations
+
+import os
+import shutil
+
+import pandas as pd
+
+from atelier.persistence.base import RepoABC
+from atelier.persistence.factory import DatabaseFactory
+from atelier.persistence.workspace import Workspace
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Studio(RepoABC):
+    """Studio object
+
+    Args:
+        name (str): The name of the studio.
+        location (str): The directory containing the studio. This defaults to the root directory.
+        safe_mode (bool): Whether to prompt for confirmation before dropping the studio.
+        engine (str): Storage engine for the studio database and the workspaces it creates. One
+            of 'shelve' (default), 'sqlite' or 'sharded'.
+        shards (int): Number of shards of the databases the studio creates with the 'sharded'
+            engine. Defaults to 16.
+
+    Large payloads of all repositories in the studio's workspaces are kept in one blob store,
+    so identical datasets are stored once across the studio.
+
+    The size of the studio is the sum of its workspaces' sizes, each the sum of its
+    repositories' running totals, so changes made to a repository directly are counted at once.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        location: str = "",
+        safe_mode: bool = True,
+        engine: str = "shelve",
+        shards: int = None,
+    ) -> None:
+        super().__init__()
+        self._name = name
+        self._location = location
+        self._safe_mode = safe_mode
+        self._studio_location = os.path.join(self._location, name + "/")
+        self._db_filepath = os.path.join(self._studio_location, "workspaces.db")
+        self._engine = engine
+        self._blob_location = os.path.join(self._studio_location, "blobs")
+        self._shards = shards
+        self._db = DatabaseFactory.database(
+            name=name, filepath=self._db_filepath, engine=engine, shards=shards
+        )
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the studio."""
+        return self._name
+
+    @property
+    def location(self) -> str:
+        """Returns the name of the studio."""
+        return self._studio_location
+
+    @property
+    def engine(self) -> str:
+        """Returns the storage engine backing the database."""
+        return self._engine
+
+    @property
+    def size(self) -> int:
+        return self._size()
+
+    def create_workspace(self, name: str) -> Workspace:
+        """Creates a Workspace object"""
+        return Workspace(
+            name=name,
+            location=self._studio_location,
+            engine=self._engine,
+            blob_location=self._blob_location,
+            shards=self._shards,
+        )
+
+    def add(self, workspace: Workspace) -> Workspace:
+        """Adds a Workspace object to the studio."""
+        with self._db as db:
+            db.insert(key=workspace.name, value=workspace)
+        return workspace
+
+    def get(self, name: str) -> Workspace:
+        """Obtains an Workspace object from the studio."""
+        with self._db.reading() as db:
+            return db.select(key=name)
+
+    def getall(self) -> dict:
+        """Obtains an workspace from the studio."""
+        with self._db.reading() as db:
+            return db.selectall()
+
+    def update(self, workspace: Workspace) -> Workspace:
+        """Updates a workspace object in the studio."""
+        with self._db as db:
+            db.update(key=workspace.name, value=workspace)
+        return workspace
+
+    def exists(self, name: str) -> bool:
+        """Removes an existing item from the Workspace."""
+        if not self._db.might_contain(name):
+            return False
+        with self._db.reading() as db:
+            return db.exists(key=name)
+
+    def remove(self, name: str) -> None:
+        """Removes an existing item from the Workspace."""
+        with self._db as db:
+            db.delete(key=name)
+
+    def print(self) -> None:
+        """Prints the inventory of items."""
+        data = []
+        with self._db.reading() as db:
+            workspaces = db.selectall()
+        for workspace in workspaces.values():
+            d = {}
+            d["name"] = workspace.name
+            d["location"] = workspace.location
+            d["size"] = workspace.size
+            d["logical_size"] = workspace.logical_size
+            d["physical_size"] = workspace.physical_size
+            data.append(d)
+        df = pd.DataFrame(data=data)
+        print(df)
+
+    def drop(self) -> None:
+        """Deletes the workspace"""
+        if self._safe_mode:
+            x = input("This will permanently delete the workspace. Are you sure? [y/n] ")
+            if "y" in x:
+                shutil.rmtree(self._studio_location, ignore_errors=True)
+        else:
+            shutil.rmtree(self._studio_location, ignore_errors=True)
+
+    def compact(self) -> int:
+        """Compacts the studio database and those of each workspace in it, returning the bytes
+        reclaimed."""
+        reclaimed = super().compact()
+        for workspace in self.getall().values():
+            reclaimed += workspace.compact()
+        return reclaimed
+
+    def recompute_size(self) -> int:
+        """Recomputes the size of each repository in the studio's workspaces, replacing their
+        running totals, and returns the total."""
+        return sum(workspace.recompute_size() for workspace in self.getall().values())
+
+    def _size(self) -> int:
+        """Returns the sum of the workspaces' sizes."""
+        size = 0
+        workspaces = self.getall()
+        for workspace in workspaces.values():
+            size += workspace.size
+        return size
+
+    def _storage(self) -> tuple:
+        db_bytes, refs = super()._storage()
+        for workspace in self.getall().values():
+            workspace_bytes, workspace_refs = workspace._storage()
+            db_bytes += workspace_bytes
+            refs.extend(workspace_refs)
+        return db_bytes, refs
@@ -1,126 +1,239 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/persistence/workspace.py                                                   #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 09:39:53 am                                                 #
-# Modified   : Thursday March 2nd 2023 04:26:07 pm                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-from __future__ import annotations
-import os
-import pandas as pd
-import shutil
-
-from atelier.persistence.base import RepoABC
-from atelier.persistence.repo import Repo
-from atelier.persistence.odb import ObjectDB
-
-
-# ------------------------------------------------------------------------------------------------ #
-class Workspace(RepoABC):
-    """Workspace object
-
-    Args:
-        name (str): The name of the workspace.
-        location (str): The directory in which the repository will be created.
-    """
-
-    def __init__(self, name: str, location: str, safe_mode: bool = True) -> None:
-        super().__init__()
-        self._name = name
-        self._location = location
-        self._safe_mode = safe_mode
-        self._db_filepath = os.path.join(self._location, self._name, "repository.db")
-        self._workspace_location = os.path.dirname(self._db_filepath)
-        self._db = ObjectDB(name=name, filepath=self._db_filepath)
-
-    @property
-    def name(self) -> str:
-        """Returns the name of the workspace."""
-        return self._name
-
-    @property
-    def location(self) -> str:
-        """Returns the location (directory) in which the workspace resides."""
-        return self._workspace_location
-
-    @property
-    def size(self) -> int:
-        return self._size()
-
-    def create_repo(self, name: str) -> Repo:
-        """Creates a repository object"""
-        return Repo(name=name, location=self._workspace_location)
-
-    def add(self, repo: Repo) -> Repo:
-        """Adds a Repo object to the workspace."""
-        with self._db as db:
-            db.insert(key=repo.name, value=repo)
-        return repo
-
-    def get(self, name: str) -> Repo:
-        """Obtains an Repo object from the workspace."""
-        with self._db as db:
-            return db.select(key=name)
-
-    def getall(self) -> dict:
-        """Obtains an repo from the workspace."""
-        with self._db as db:
-            return db.selectall()
-
-    def update(self, repo: Repo) -> Repo:
-        """Updates a repo object in the workspace."""
-        with self._db as db:
-            db.update(key=repo.name, value=repo)
-        return repo
-
-    def exists(self, name: str) -> bool:
-        """Removes an existing item from the repository."""
-        with self._db as db:
-            return db.exists(key=name)
-
-    def remove(self, name: str) -> None:
-        """Removes an existing item from the repository."""
-        with self._db as db:
-            db.delete(key=name)
-
-    def drop(self) -> None:
-        """Deletes the workspace"""
-        if self._safe_mode:
-            x = input("This will permanently delete the workspace. Are you sure? [y/n] ")
-            if "y" in x:
-                shutil.rmtree(self._workspace_location, ignore_errors=True)
-        else:
-            shutil.rmtree(self._workspace_location, ignore_errors=True)
-
-    def print(self) -> None:
-        """Prints the inventory of items."""
-        data = []
-        with self._db as db:
-            repos = db.selectall()
-        for repo in repos.values():
-            d = {}
-            d["name"] = repo.name
-            d["location"] = repo.location
-            d["memory"] = repo.size
-            data.append(d)
-        df = pd.DataFrame(data=data)
-        print(df)
-
-    def _size(self) -> int:
-        """Returns the size of the repository."""
-        size = 0
-        repos = self.getall()
-        for repo in repos.values():
-            size += repo.size
-        return size
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/persistence/workspace.py                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 09:39:53 am                                                 #
+# Modified   : Thursday March 2nd 2023 04:26:07 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+from __future__ import annotations
+import os
+import pandas as pd
+import shutil
+
+from atelier.persistence.base import SIZE_KEY, RepoABC
+from atelier.persistence.database import Database
+from atelier.persistence.repo import Repo
+from atelier.persistence.factory import DatabaseFactory
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Workspace(RepoABC):
+    """Workspace object
+
+    The size of the workspace is the sum of its repositories' running totals, so changes made
+    to a repository directly are counted at once. The workspace's metadata database maps each
+    repository to its own metadata database, from which the total is read without loading the
+    repository or any asset.
+
+    Args:
+        name (str): The name of the workspace.
+        location (str): The directory in which the repository will be created.
+        safe_mode (bool): Whether to prompt for confirmation before dropping the workspace.
+        engine (str): Storage engine for the workspace database and the repositories it
+            creates. One of 'shelve' (default), 'sqlite' or 'sharded'.
+        blob_location (str): Directory of a blob store shared by the repositories the workspace
+            creates. Defaults to None, each repository keeping its own.
+        shards (int): Number of shards of the databases the workspace creates with the
+            'sharded' engine. Defaults to 16.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        location: str,
+        safe_mode: bool = True,
+        engine: str = "shelve",
+        blob_location: str = None,
+        shards: int = None,
+    ) -> None:
+        super().__init__()
+        self._name = name
+        self._location = location
+        self._safe_mode = safe_mode
+        self._db_filepath = os.path.join(self._location, self._name, "repository.db")
+        self._workspace_location = os.path.dirname(self._db_filepath)
+        self._engine = engine
+        self._blob_location = blob_location
+        self._shards = shards
+        self._db = DatabaseFactory.database(
+            name=name, filepath=self._db_filepath, engine=engine, shards=shards
+        )
+        self._metadata = self._metadata_database()
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        if "_metadata" not in state:
+            self._shards = state.get("_shards")
+            self._metadata = self._metadata_database()
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the workspace."""
+        return self._name
+
+    @property
+    def location(self) -> str:
+        """Returns the location (directory) in which the workspace resides."""
+        return self._workspace_location
+
+    @property
+    def engine(self) -> str:
+        """Returns the storage engine backing the database."""
+        return self._engine
+
+    @property
+    def size(self) -> int:
+        return self._size()
+
+    def create_repo(self, name: str) -> Repo:
+        """Creates a repository object"""
+        return Repo(
+            name=name,
+            location=self._workspace_location,
+            engine=self._engine,
+            blob_location=self._blob_location,
+            shards=self._shards,
+        )
+
+    def add(self, repo: Repo) -> Repo:
+        """Adds a Repo object to the workspace."""
+        with self._db as db:
+            db.insert(key=repo.name, value=repo)
+        self._register(repo)
+        return repo
+
+    def get(self, name: str) -> Repo:
+        """Obtains an Repo object from the workspace."""
+        with self._db.reading() as db:
+            return db.select(key=name)
+
+    def getall(self) -> dict:
+        """Obtains an repo from the workspace."""
+        with self._db.reading() as db:
+            return db.selectall()
+
+    def update(self, repo: Repo) -> Repo:
+        """Updates a repo object in the workspace."""
+        with self._db as db:
+            db.update(key=repo.name, value=repo)
+        self._register(repo)
+        return repo
+
+    def exists(self, name: str) -> bool:
+        """Removes an existing item from the repository."""
+        if not self._db.might_contain(name):
+            return False
+        with self._db.reading() as db:
+            return db.exists(key=name)
+
+    def remove(self, name: str) -> None:
+        """Removes an existing item from the repository."""
+        with self._db as db:
+            db.delete(key=name)
+        with self._metadata as mdb:
+            if mdb.exists(key=name):
+                mdb.delete(key=name)
+
+    def drop(self) -> None:
+        """Deletes the workspace"""
+        if self._safe_mode:
+            x = input("This will permanently delete the workspace. Are you sure? [y/n] ")
+            if "y" not in x:
+                return
+        if os.path.exists(self._workspace_location):
+            for repo in self.getall().values():
+                repo.release_blobs()
+        shutil.rmtree(self._workspace_location, ignore_errors=True)
+
+    def print(self) -> None:
+        """Prints the inventory of items."""
+        data = []
+        with self._db.reading() as db:
+            repos = db.selectall()
+        for repo in repos.values():
+            d = {}
+            d["name"] = repo.name
+            d["location"] = repo.location
+            d["memory"] = repo.size
+            d["logical_size"] = repo.logical_size
+            d["physical_size"] = repo.physical_size
+            data.append(d)
+        df = pd.DataFrame(data=data)
+        print(df)
+
+    def compact(self) -> int:
+        """Compacts the workspace database and those of each repository in it, returning the
+        bytes reclaimed."""
+        reclaimed = super().compact()
+        for repo in self.getall().values():
+            reclaimed += repo.compact()
+        return reclaimed
+
+    def recompute_size(self) -> int:
+        """Recomputes the size of each repository in the workspace, replacing their running
+        totals, and returns the total."""
+        return sum(repo.recompute_size() for repo in self.getall().values())
+
+    def _size(self) -> int:
+        """Returns the sum of the repositories' running totals. Repositories not yet registered,
+        such as those of workspaces created before the metadata database, or without a running
+        total are loaded once for their size, and registered."""
+        with self._db.reading() as db:
+            names = list(db.iter_keys())
+        with self._metadata.reading() as mdb:
+            members = mdb.selectall()
+        size = 0
+        for name in names:
+            total = self._total(members[name]) if name in members else None
+            if total is None:
+                repo = self.get(name)
+                total = repo.size
+                self._register(repo)
+            size += total
+        return size
+
+    def _total(self, metadata: Database) -> int:
+        """Returns the running total held in a repository's metadata database, or None if it
+        holds none."""
+        with metadata.reading() as mdb:
+            if mdb.exists(key=SIZE_KEY):
+                return mdb.select(key=SIZE_KEY)
+        return None
+
+    def _register(self, repo: Repo) -> None:
+        """Records the repository's metadata database, from which its size is read."""
+        with self._metadata as mdb:
+            if mdb.exists(key=repo.name):
+                mdb.update(key=repo.name, value=repo._metadata)
+            else:
+                mdb.insert(key=repo.name, value=repo._metadata)
+
+    def _databases(self) -> list:
+        return [self._db, self._metadata]
+
+    def _metadata_database(self) -> Database:
+        return DatabaseFactory.database(
+            name=f"{self._name}_metadata",
+            filepath=os.path.join(self._workspace_location, "metadata.db"),
+            engine=self._engine,
+            shards=self._shards,
+        )
+
+    def _storage(self) -> tuple:
+        db_bytes, refs = super()._storage()
+        for repo in self.getall().values():
+            repo_bytes, repo_refs = repo._storage()
+            db_bytes += repo_bytes
+            refs.extend(repo_refs)
+        return db_bytes, refs
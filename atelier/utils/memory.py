@@ -1,61 +1,135 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /atelier/utils/memory.py                                                            #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Saturday February 18th 2023 07:56:02 pm                                             #
-# Modified   : Saturday February 18th 2023 08:14:45 pm                                             #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-import sys
-import inspect
-import logging
-import pandas as pd
-
-logger = logging.getLogger(__name__)
-
-
-def get_size(obj, seen=None):
-    """Recursively finds size of objects in bytes"""
-    size = sys.getsizeof(obj)
-    if seen is None:
-        seen = set()
-    obj_id = id(obj)
-    if obj_id in seen:
-        return 0
-    # Important mark as seen *before* entering recursion to gracefully handle
-    # self-referential objects
-    seen.add(obj_id)
-    if hasattr(obj, "__dict__"):
-        for cls in obj.__class__.__mro__:
-            if "__dict__" in cls.__dict__:
-                d = cls.__dict__["__dict__"]
-                if inspect.isgetsetdescriptor(d) or inspect.ismemberdescriptor(d):
-                    size += get_size(obj.__dict__, seen)
-                break
-    if isinstance(obj, dict):
-        size += sum((get_size(v, seen) for v in obj.values()))
-        size += sum((get_size(k, seen) for k in obj.keys()))
-    elif isinstance(obj, pd.DataFrame):
-        size += obj.memory_usage(deep=True).sum()
-    elif hasattr(obj, "__iter__") and not isinstance(obj, (str, bytes, bytearray)):
-        try:
-            size += sum((get_size(i, seen) for i in obj))
-        except TypeError:
-            logging.error(
-                "Unable to get size of %r. This may lead to incorrect sizes. Please report this error.",
-                obj,
-            )
-    if hasattr(obj, "__slots__"):  # can have __slots__ with __dict__
-        size += sum(get_size(getattr(obj, s), seen) for s in obj.__slots__ if hasattr(obj, s))
-
-    return size
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /atelier/utils/memory.py                                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday February 18th 2023 07:56:02 pm                                             #
+# Modified   : Saturday February 18th 2023 08:14:45 pm                                             #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import sys
+import inspect
+import logging
+import numpy as np
+import pandas as pd
+from pympler.asizeof import asizeof
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+
+def get_size(obj, seen=None):
+    """Recursively finds size of objects in bytes"""
+    size = sys.getsizeof(obj)
+    if seen is None:
+        seen = set()
+    obj_id = id(obj)
+    if obj_id in seen:
+        return 0
+    # Important mark as seen *before* entering recursion to gracefully handle
+    # self-referential objects
+    seen.add(obj_id)
+    if hasattr(obj, "__dict__"):
+        for cls in obj.__class__.__mro__:
+            if "__dict__" in cls.__dict__:
+                d = cls.__dict__["__dict__"]
+                if inspect.isgetsetdescriptor(d) or inspect.ismemberdescriptor(d):
+                    size += get_size(obj.__dict__, seen)
+                break
+    if isinstance(obj, dict):
+        size += sum((get_size(v, seen) for v in obj.values()))
+        size += sum((get_size(k, seen) for k in obj.keys()))
+    elif isinstance(obj, pd.DataFrame):
+        size += obj.memory_usage(deep=True).sum()
+    elif hasattr(obj, "__iter__") and not isinstance(obj, (str, bytes, bytearray)):
+        try:
+            size += sum((get_size(i, seen) for i in obj))
+        except TypeError:
+            logging.error(
+                "Unable to get size of %r. This may lead to incorrect sizes. Please report this error.",
+                obj,
+            )
+    if hasattr(obj, "__slots__"):  # can have __slots__ with __dict__
+        size += sum(get_size(getattr(obj, s), seen) for s in obj.__slots__ if hasattr(obj, s))
+
+    return size
+
+
+def estimate_size(obj, seen=None) -> int:
+    """Estimates the memory consumed by an object in bytes, quickly for data payloads.
+
+    pandas objects are measured with memory_usage(deep=True), NumPy arrays and Arrow tables and
+    arrays by their buffers, and containers by their contents. Other objects are measured with
+    pympler's asizeof, which walks the object graph and is far slower on large data.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    for types, measure in MEASURES:
+        if isinstance(obj, types):
+            return measure(obj, seen)
+    return asizeof(obj)
+
+
+def _frame_size(obj: pd.DataFrame, seen: set) -> int:
+    return sys.getsizeof(object()) + int(obj.memory_usage(index=True, deep=True).sum())
+
+
+def _pandas_size(obj, seen: set) -> int:
+    return sys.getsizeof(object()) + int(obj.memory_usage(deep=True))
+
+
+def _array_size(obj: np.ndarray, seen: set) -> int:
+    """Object arrays are measured by their items. Views don't count their base's buffer in
+    getsizeof, so it's added."""
+    if obj.dtype == object:
+        return sys.getsizeof(obj) + sum(estimate_size(item, seen) for item in obj.flat)
+    return sys.getsizeof(obj) if obj.base is None else sys.getsizeof(obj) + obj.nbytes
+
+
+def _object_size(obj, seen: set) -> int:
+    return sys.getsizeof(obj)
+
+
+def _buffer_size(obj, seen: set) -> int:
+    return sys.getsizeof(obj) + obj.nbytes
+
+
+def _dict_size(obj: dict, seen: set) -> int:
+    return sys.getsizeof(obj) + sum(
+        estimate_size(key, seen) + estimate_size(value, seen) for key, value in obj.items()
+    )
+
+
+def _collection_size(obj, seen: set) -> int:
+    return sys.getsizeof(obj) + sum(estimate_size(item, seen) for item in obj)
+
+
+# ------------------------------------------------------------------------------------------------ #
+# Types estimate_size measures itself, and the function measuring each, in the order tried.
+MEASURES = [
+    (pd.DataFrame, _frame_size),
+    ((pd.Series, pd.Index), _pandas_size),
+    (np.ndarray, _array_size),
+    ((bytes, bytearray, str), _object_size),
+    (memoryview, _buffer_size),
+    (dict, _dict_size),
+    ((list, tuple, set, frozenset), _collection_size),
+]
+if pa is not None:
+    MEASURES.append(((pa.Table, pa.RecordBatch, pa.Array, pa.ChunkedArray), _buffer_size))
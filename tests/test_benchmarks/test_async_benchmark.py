@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_benchmarks/test_async_benchmark.py                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+from atelier.data.dataset import Dataset
+from atelier.persistence.aio import AsyncRepo
+from atelier.persistence.repo import Repo
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+LOCATION = "tests/results/benchmarks/async"
+N = 40
+ROWS = 50000
+CONCURRENCY = [1, 4, 16]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def build_repo() -> Repo:
+    """Returns a repository of N compressed frames, stored inline so gets read and decompress."""
+    repo = Repo(name="async", location=LOCATION, codec="zlib", blob_threshold=None)
+    rng = np.random.default_rng(42)
+    with repo.session():
+        for i in range(N):
+            data = pd.DataFrame({"x": rng.integers(0, 100, ROWS), "text": ["lorem ipsum"] * ROWS})
+            repo.add(Dataset(name=f"dataset_{i}", description="Benchmark dataset", data=data))
+    return repo
+
+
+async def run_gets(arepo: AsyncRepo, concurrency: int) -> float:
+    """Gets every asset with the given number of requests in flight; returns gets per second."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get(name: str) -> None:
+        async with semaphore:
+            await arepo.get(name)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(get(f"dataset_{i}") for i in range(N)))
+    return N / (time.perf_counter() - start)
+
+
+async def max_stall(work) -> float:
+    """Runs the work while a heartbeat ticks every millisecond; returns the longest gap between
+    ticks, which is how long the event loop was blocked."""
+    gaps = []
+    done = asyncio.Event()
+
+    async def heartbeat(last: float) -> None:
+        while True:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+            if done.is_set():
+                return
+
+    beat = asyncio.create_task(heartbeat(time.perf_counter()))
+    await work()
+    done.set()
+    await beat
+    return max(gaps)
+
+
+@pytest.mark.benchmark
+class TestAsyncBenchmark:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_concurrent_gets(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = build_repo()
+
+        async def blocking() -> None:
+            for i in range(N):
+                repo.get(f"dataset_{i}").data
+
+        async def run() -> tuple:
+            async with AsyncRepo(repo) as arepo:
+                throughput = {c: await run_gets(arepo, c) for c in CONCURRENCY}
+                stall = await max_stall(lambda: run_gets(arepo, max(CONCURRENCY)))
+            return throughput, stall, await max_stall(blocking)
+
+        throughput, stall, blocked = asyncio.run(run())
+        logger.info(
+            "".join(
+                f"\n\tGets per second, {c} in flight: {round(t, 1)}" for c, t in throughput.items()
+            )
+            + f"\n\tLongest event loop stall, async: {round(stall * 1000, 1)} ms"
+            + f"\n\tLongest event loop stall, blocking: {round(blocked * 1000, 1)} ms"
+        )
+        # Gets run off the event loop, which keeps serving other coroutines.
+        assert stall < blocked / 2
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_benchmarks/test_codec_benchmark.py                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+from atelier.persistence.codec import CodecFactory
+from atelier.persistence.factory import DatabaseFactory
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+LOCATION = "tests/results/benchmarks/codec"
+ROWS = 100000
+WORDS = ["studio", "atelier", "dataset", "model", "feature", "pipeline", "review", "customer"]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def text_frame() -> pd.DataFrame:
+    """Returns a frame resembling our text-heavy datasets: ids, a category, a score and text."""
+    rng = np.random.default_rng(42)
+    words = rng.choice(WORDS, size=(ROWS, 12))
+    return pd.DataFrame(
+        {
+            "id": np.arange(ROWS),
+            "category": rng.choice(["a", "b", "c", "d"], size=ROWS),
+            "score": rng.random(ROWS),
+            "text": [" ".join(row) for row in words],
+        }
+    )
+
+
+def run_codec(codec: str, df: pd.DataFrame) -> dict:
+    """Writes and reads the frame with the codec, returning throughput and ratio."""
+    db = DatabaseFactory.database(name=codec, filepath=f"{LOCATION}/{codec}.db", codec=codec)
+    start = time.perf_counter()
+    with db:
+        db.insert(key="df", value=df)
+    write = time.perf_counter() - start
+    start = time.perf_counter()
+    with db:
+        db.select(key="df")
+    read = time.perf_counter() - start
+    return {"codec": codec, "bytes": db.disk_usage, "write": write, "read": read}
+
+
+@pytest.mark.benchmark
+class TestCodecBenchmark:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_codecs(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        df = text_frame()
+        results = [run_codec(codec, df) for codec in CodecFactory.available()]
+        # Ratios and throughput are relative to the uncompressed pickle.
+        raw = results[0]["bytes"]
+        mb = raw / 1024**2
+        lines = [f"\n\t{'Codec':<6} {'Ratio':>6} {'Write MB/s':>11} {'Read MB/s':>10}"]
+        for result in results:
+            result["ratio"] = raw / result["bytes"]
+            lines.append(
+                f"\n\t{result['codec']:<6} {result['ratio']:>6.1f} {mb / result['write']:>11.1f} "
+                f"{mb / result['read']:>10.1f}"
+            )
+        logger.info("".join(lines))
+        ratios = {result["codec"]: result["ratio"] for result in results}
+        assert ratios["zlib"] > 2 * ratios["none"]
+        assert ratios["lzma"] > ratios["zlib"]
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_benchmarks/test_session_benchmark.py                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+from contextlib import nullcontext
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import shutil
+import time
+
+from atelier.persistence.repo import Repo
+from atelier.data.dataset import Dataset
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+LOCATION = "tests/results/benchmarks/session"
+N = 500
+
+
+# ------------------------------------------------------------------------------------------------ #
+def run_calls(repo: Repo) -> float:
+    """Performs N add, exists and get calls against the repo and returns calls per second."""
+    start = time.perf_counter()
+    for i in range(N):
+        name = f"dataset_{i}"
+        repo.add(Dataset(name=name, description="Benchmark dataset", data={"i": i}))
+        repo.exists(name)
+        repo.get(name)
+    return 3 * N / (time.perf_counter() - start)
+
+
+def run_adds(repo: Repo, transaction: bool = False) -> float:
+    """Performs N add calls against the repo, optionally in one transaction, and returns adds
+    per second, including the time to commit."""
+    start = time.perf_counter()
+    with repo.transaction() if transaction else nullcontext():
+        for i in range(N):
+            repo.add(Dataset(name=f"dataset_{i}", description="Benchmark dataset", data={"i": i}))
+    return N / (time.perf_counter() - start)
+
+
+def lock_acquisitions(repo: Repo) -> int:
+    """Returns the number of times the repo's databases were locked, once per connection."""
+    return sum(stats["lock"]["acquisitions"] for stats in repo.stats()["databases"].values())
+
+
+@pytest.mark.benchmark
+class TestSessionBenchmark:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_calls_per_second(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        per_call = run_calls(Repo(name="per_call", location=LOCATION))
+
+        repo = Repo(name="session", location=LOCATION)
+        with repo.session():
+            session = run_calls(repo)
+
+        logger.info(
+            f"\n\tCalls per second without session: {round(per_call, 1)}"
+            f"\n\tCalls per second with session:    {round(session, 1)}"
+            f"\n\tSpeedup: {round(session / per_call, 1)}x"
+        )
+        assert session > per_call
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_transaction(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        baseline = Repo(name="per_add", location=LOCATION)
+        per_add = run_adds(baseline)
+
+        repo = Repo(name="transaction", location=LOCATION)
+        transaction = run_adds(repo, transaction=True)
+
+        logger.info(
+            f"\n\tAdds per second without transaction: {round(per_add, 1)}"
+            f"\n\tAdds per second in transaction:      {round(transaction, 1)}"
+            f"\n\tSpeedup: {round(transaction / per_add, 1)}x"
+        )
+        assert len(repo.inventory()) == N
+        # Throughput varies with load; the connections opened don't. A transaction applies its
+        # changes in one session rather than connecting for each add.
+        assert lock_acquisitions(repo) * 10 < lock_acquisitions(baseline)
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
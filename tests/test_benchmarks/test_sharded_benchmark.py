@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_benchmarks/test_sharded_benchmark.py                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import random
+import shutil
+import time
+
+from atelier.persistence.database import Database
+from atelier.persistence.odb import ObjectDB
+from atelier.persistence.sharded import ShardedDB
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+LOCATION = "tests/results/benchmarks/sharded"
+KEYS = 20000
+LOOKUPS = 50
+
+
+# ------------------------------------------------------------------------------------------------ #
+def run_lookups(database: Database) -> float:
+    """Fills the database with KEYS small objects, then looks up LOOKUPS random keys, each in
+    its own connection, and returns lookups per second."""
+    with database as db:
+        db.insert_many(items={f"key_{i:06d}": {"i": i} for i in range(KEYS)})
+    keys = random.Random(0).sample(range(KEYS), LOOKUPS)
+    start = time.perf_counter()
+    for i in keys:
+        with database.reading() as db:
+            assert db.select(key=f"key_{i:06d}") == {"i": i}
+    return LOOKUPS / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+class TestShardedBenchmark:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_lookups_per_second(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        single = run_lookups(ObjectDB(name="single", filepath=f"{LOCATION}/single.db"))
+        sharded = run_lookups(ShardedDB(name="sharded", filepath=f"{LOCATION}/sharded.db"))
+
+        logger.info(
+            f"\n\tLookups per second, single file: {round(single, 1)}"
+            f"\n\tLookups per second, 16 shards:   {round(sharded, 1)}"
+            f"\n\tSpeedup: {round(sharded / single, 1)}x"
+        )
+        assert sharded > single
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_data/test_dtypes.py                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from atelier.data.dtypes import compact_dtypes
+from atelier.data.stats import column_stats
+from atelier.utils.memory import estimate_size
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.dtypes
+class TestCompactDtypes:  # pragma: no cover
+    # ============================================================================================ #
+    def test_compact_dtypes(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rows = 100000
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            {
+                "id": np.arange(rows),
+                "count": np.arange(rows, dtype=np.uint64) % 200,
+                "half": np.arange(rows) / 2,
+                "noise": rng.random(rows),
+                "region": pd.Series(rng.choice(["EU", "US", None], size=rows), dtype=object),
+                "key": pd.Series([f"k{n}" for n in range(rows)], dtype=object),
+                "mixed": pd.Series([1, "a"] * (rows // 2), dtype=object),
+                "flag": np.ones(rows, dtype=bool),
+            }
+        )
+        compacted = compact_dtypes(data)
+        dtypes = compacted.dtypes
+        assert (dtypes["id"], dtypes["count"], dtypes["half"]) == (np.int32, np.uint8, np.float32)
+        # Floats that would lose precision are kept.
+        assert dtypes["noise"] == np.float64
+        assert isinstance(dtypes["region"], pd.CategoricalDtype)
+        assert isinstance(dtypes["key"], pd.StringDtype) and dtypes["key"].storage == "pyarrow"
+        assert (dtypes["mixed"], dtypes["flag"]) == (object, bool)
+        # Values are unchanged and the input isn't modified.
+        for column in data.columns:
+            assert (
+                compacted[column]
+                .astype(object)
+                .fillna(np.nan)
+                .equals(data[column].astype(object).fillna(np.nan))
+            )
+        assert data["id"].dtype == np.int64
+        assert estimate_size(compacted) < estimate_size(data) / 2
+        # Categoricals keep the bounds of their values.
+        stats = column_stats(compacted)
+        assert (stats["region"]["min"], stats["region"]["max"]) == ("EU", "US")
+        assert isinstance(compact_dtypes(data["key"], category_ratio=1).dtype, pd.CategoricalDtype)
+        assert compact_dtypes(data.iloc[:0]).dtypes.equals(data.dtypes)
+        assert compact_dtypes([1, 2]) == [1, 2]
+        with pytest.raises(ValueError):
+            compact_dtypes(data, category_ratio=2)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_data/test_stats.py                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from atelier.data.stats import approx_distinct, can_match, column_stats, merge_stats
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+def frame(rows: int, offset: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(offset)
+    return pd.DataFrame(
+        {
+            "id": np.arange(offset, offset + rows),
+            "region": rng.choice(["EU", "US"], size=rows),
+            "amount": np.where(rng.random(rows) < 0.1, np.nan, rng.random(rows) * 100),
+            "when": pd.date_range("2024-01-01", periods=rows, freq="min")
+            + pd.Timedelta(offset, "min"),
+            "attrs": pd.Series([{"a": 1}] * rows, dtype=object),
+        }
+    )
+
+
+@pytest.mark.stats
+class TestColumnStats:  # pragma: no cover
+    # ============================================================================================ #
+    def test_column_stats(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = frame(200000)
+        stats = column_stats(data)
+        assert list(stats) == list(data.columns)
+        assert stats["id"] == {
+            "dtype": "int64",
+            "rows": 200000,
+            "nulls": 0,
+            "min": 0,
+            "max": 199999,
+            "distinct": stats["id"]["distinct"],
+        }
+        assert abs(stats["id"]["distinct"] - 200000) / 200000 < 0.1
+        assert stats["region"]["distinct"] == 2
+        assert (stats["region"]["min"], stats["region"]["max"]) == ("EU", "US")
+        assert stats["amount"]["nulls"] == data["amount"].isna().sum()
+        assert stats["when"]["max"] == data["when"].max()
+        # Columns without an ordering or hashable values have no extremes or distinct count.
+        assert stats["attrs"]["min"] is None and stats["attrs"]["distinct"] is None
+        assert column_stats(data["id"])["id"]["rows"] == 200000
+        table = column_stats(pa.Table.from_pandas(data[["id", "region"]], preserve_index=False))
+        assert table["region"]["distinct"] == 2 and table["id"]["max"] == 199999
+        assert column_stats({"not": "tabular"}) is None
+        assert approx_distinct(pd.Series([None, None])) == 0
+        # Columns sharing a name are combined; either may satisfy a filter on the name.
+        duplicated = pd.concat([data[["id", "amount"]], data[["id"]] + 1000000], axis=1)
+        stats = column_stats(duplicated)
+        assert list(stats) == ["id", "amount"]
+        assert (stats["id"]["min"], stats["id"]["max"]) == (0, 1199999)
+        assert stats["id"]["rows"] == 200000
+        assert can_match(stats, [("id", "==", 1000000)]) and can_match(stats, [("id", "==", 5)])
+        mixed = pd.concat([data[["id"]], data[["attrs"]].set_axis(["id"], axis=1)], axis=1)
+        assert column_stats(mixed)["id"]["min"] is None
+        assert can_match(column_stats(mixed), [("id", "<", -1)])
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_merge_stats(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        first, second = frame(1000), frame(500, offset=1000)
+        merged = merge_stats([column_stats(first), column_stats(second)])
+        assert merged["id"]["rows"] == 1500
+        assert (merged["id"]["min"], merged["id"]["max"]) == (0, 1499)
+        assert (
+            merged["amount"]["nulls"]
+            == first["amount"].isna().sum() + second["amount"].isna().sum()
+        )
+        # Distinct counts are bounded by the non-null rows.
+        assert merged["region"]["distinct"] == 4
+        assert merged["id"]["distinct"] <= 1500
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_can_match(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        stats = column_stats(frame(1000))
+        assert can_match(stats, [("id", ">=", 999)])
+        assert not can_match(stats, [("id", ">", 999)])
+        assert not can_match(stats, [("region", "==", "APAC")])
+        assert can_match(stats, [("region", "in", ["APAC", "US"])])
+        assert not can_match(stats, [("region", "in", ["APAC"]), ("id", "<", 10)])
+        # Any of a list of groups may match.
+        assert can_match(stats, [[("region", "==", "APAC")], [("id", "<", 10)]])
+        assert not can_match(stats, [("when", "<", pd.Timestamp("2023-12-31"))])
+        # Unknown columns, unorderable columns and incomparable values may match.
+        assert can_match(
+            stats, [("missing", "==", 1), ("attrs", "==", {"a": 1}), ("id", "<", "text")]
+        )
+        assert can_match(None, [("id", ">", 999)])
+        # All-null columns satisfy no condition.
+        assert not can_match(column_stats(pd.DataFrame({"x": [None, None]})), [("x", "!=", 1)])
+        with pytest.raises(ValueError):
+            can_match(stats, [("id", "~", 1)])
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_aio.py                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import shutil
+
+from atelier.data.dataset import Dataset
+from atelier.persistence.aio import AsyncRepo, AsyncStudio
+from atelier.persistence.exceptions import ObjectNotFoundError
+from atelier.persistence.repo import Repo
+from atelier.persistence.studio import Studio
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+NAME = "test_aio"
+LOCATION = "tests/results/persistence/aio"
+
+
+@pytest.mark.aio
+class TestAsync:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_repo(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        async def run() -> None:
+            async with AsyncRepo(Repo(name=NAME, location=LOCATION, cache_size=10**9)) as arepo:
+                # Concurrent writes are serialized by the database locks.
+                datasets = [
+                    Dataset(name=f"dataset_{i}", description="Async", data=dataframe.head(100 * i))
+                    for i in range(1, 21)
+                ]
+                await asyncio.gather(*(arepo.add(dataset) for dataset in datasets))
+                assert all(await asyncio.gather(*(arepo.exists(d.name) for d in datasets)))
+
+                # Concurrent reads return assets with their payloads loaded.
+                assets = await asyncio.gather(*(arepo.get(d.name) for d in datasets))
+                for asset, dataset in zip(assets, datasets):
+                    assert asset.is_loaded
+                    assert asset.data.equals(dataset.data)
+                assert len(await arepo.getall()) == 20
+                result = await arepo.get_many([d.name for d in datasets[:5]])
+                assert result.ok and all(asset.is_loaded for asset in result.items.values())
+
+                await asyncio.gather(*(arepo.remove(d.name) for d in datasets[:10]))
+                with pytest.raises(ObjectNotFoundError):
+                    await arepo.get(datasets[0].name)
+                assert len(arepo.target.inventory()) == 10
+
+        asyncio.run(run())
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_studio(self, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        studio = Studio(name=NAME, location=LOCATION)
+        workspace = studio.create_workspace(name="workspace")
+        repo = workspace.create_repo(name="repo")
+        repo.add(dataset)
+        workspace.add(repo)
+
+        async def run() -> None:
+            async with AsyncStudio(studio) as astudio:
+                await astudio.add(workspace)
+                assert await astudio.exists("workspace")
+                aworkspace = await astudio.get_workspace("workspace")
+                arepo = await aworkspace.get_repo("repo")
+                asset = await arepo.get(dataset.name)
+                assert asset.data.equals(dataset.data)
+                await astudio.remove("workspace")
+                assert not await astudio.exists("workspace")
+
+        asyncio.run(run())
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
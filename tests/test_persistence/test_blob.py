@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_blob.py                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from atelier.persistence.blob import BlobStore
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+LOCATION = "tests/results/persistence/blobs"
+
+
+@pytest.mark.blob
+class TestBlobStore:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_put_get_delete(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        store = BlobStore(location=LOCATION)
+        payloads = [
+            ("pkl5", dataframe),
+            ("npy", np.arange(1000, dtype=np.float64)),
+            ("pkl5", {"some": "dictionary", "array": np.ones((100, 10)).T}),
+        ]
+        for fmt, payload in payloads:
+            ref = store.put(payload)
+            assert ref.format == fmt
+            assert ref.key.endswith(fmt)
+            assert ref.size == os.path.getsize(store.filepath(ref.key))
+            assert store.exists(ref)
+            data = store.get(ref)
+            if isinstance(payload, dict):
+                assert data["some"] == payload["some"]
+                assert np.array_equal(data["array"], payload["array"])
+            elif fmt == "npy":
+                assert isinstance(data, np.memmap)
+                assert np.array_equal(data, payload)
+            else:
+                assert data.equals(dataframe)
+                # Loaded data is a copy-on-write mapping of the file.
+                data.iloc[0, 0] = -1
+                assert store.get(ref).equals(dataframe)
+            store.delete(ref)
+            assert store.exists(ref) is False
+
+        # DataFrames Parquet can't represent fall back to pickle.
+        store = BlobStore(location=LOCATION, frame_format="parquet")
+        ref = store.put(dataframe)
+        assert ref.format == "parquet"
+        assert store.get(ref).equals(dataframe)
+        df = dataframe.head(3).copy()
+        df["mixed"] = [1, "two", 3.0]
+        ref = store.put(df)
+        assert ref.format == "pkl"
+        assert store.get(ref).equals(df)
+        with pytest.raises(ValueError):
+            BlobStore(location=LOCATION, frame_format="csv")
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_dedup(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        store = BlobStore(location=LOCATION)
+        ref = store.put(dataframe)
+        assert store.put(dataframe.copy()) == ref
+        assert store.refcount(ref) == 2
+        # Different content is stored apart.
+        other = store.put(dataframe.head(10))
+        assert other.key != ref.key
+        # Frames differing only in the names of their index or columns, or attrs, are distinct.
+        named = dataframe.copy()
+        named.index.name = "row"
+        assert store.put(named).key != ref.key
+        named.columns.name = "field"
+        labelled = named.copy()
+        labelled.attrs["source"] = "survey"
+        assert store.put(labelled).key != store.put(named).key
+        assert store.get(store.put(named)).columns.name == "field"
+        # Frames differing only in the types of their values, labels or index are distinct.
+        pairs = [
+            (pd.DataFrame({"x": [1, "a"]}), pd.DataFrame({"x": ["1", "a"]})),
+            (pd.DataFrame({1: [1, 2]}), pd.DataFrame({"1": [1, 2]})),
+            (
+                pd.DataFrame({"x": [1, 2]}, index=np.array([0, 1], dtype="int64")),
+                pd.DataFrame({"x": [1, 2]}, index=np.array([0, 1], dtype="int32")),
+            ),
+        ]
+        for first, second in pairs:
+            refs = store.put(first), store.put(second)
+            assert refs[0].key != refs[1].key
+            pd.testing.assert_frame_equal(store.get(refs[0]), first)
+            pd.testing.assert_frame_equal(store.get(refs[1]), second)
+        store.delete(ref)
+        assert store.exists(ref)
+        assert store.refcount(ref) == 1
+        # The file is deleted under the lock, before another put of the payload can reference it.
+        remove = store._remove
+        locked = []
+        store._remove = lambda key: locked.append(store._refcounts._is_connected) or remove(key)
+        store.delete(ref)
+        assert locked == [True]
+        assert store.exists(ref) is False
+        assert store.refcount(ref) == 0
+        assert store.exists(other)
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
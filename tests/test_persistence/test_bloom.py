@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_bloom.py                                               #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import os
+import pytest
+import logging
+import shutil
+
+from atelier.persistence.bloom import BloomFilter
+from atelier.persistence.odb import ObjectDB
+from atelier.persistence.studio import Studio
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+LOCATION = "tests/results/persistence/bloom"
+DB_FILEPATH = f"{LOCATION}/test.db"
+
+
+# ------------------------------------------------------------------------------------------------ #
+def refuse(self, readonly: bool = False) -> None:
+    raise AssertionError("Connected to the database.")
+
+
+@pytest.mark.bloom
+class TestBloomFilter:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_filter(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        os.makedirs(LOCATION, exist_ok=True)
+        bloom = BloomFilter(filepath=f"{LOCATION}/test.bloom")
+        assert "anything" in bloom
+        assert not bloom.load()
+        bloom.rebuild(keys=[], count=5000)
+        keys = [f"key_{i}" for i in range(5000)]
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+        false_positives = sum(f"missing_{i}" in bloom for i in range(10000))
+        assert false_positives / 10000 < 0.03
+        assert bloom.fpr < 0.03
+        # Saved and reloaded, removing the dirty marker.
+        assert os.path.exists(f"{LOCATION}/test.bloom.dirty")
+        bloom.save()
+        assert not os.path.exists(f"{LOCATION}/test.bloom.dirty")
+        other = BloomFilter(filepath=f"{LOCATION}/test.bloom")
+        assert other.load()
+        assert all(key in other for key in keys)
+        assert other.stats() == bloom.stats()
+        # Overfilled, the false positive rate climbs until rebuilt.
+        for i in range(20000):
+            bloom.add(f"more_{i}")
+        assert bloom.overfull
+        assert bloom.fpr > 0.1
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_negative_lookups(self, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        assert not database.might_contain("key_1")
+        with database as db:
+            db.insert_many(items={f"key_{i}": i for i in range(100)})
+            db.insert(key="extra", value=None)
+            assert not db.exists("missing")
+        # Negatives are answered without connecting.
+        with monkeypatch.context() as patch:
+            patch.setattr(ObjectDB, "connect", refuse)
+            assert all(database.might_contain(f"key_{i}") for i in range(100))
+            assert database.might_contain("extra")
+            negatives = sum(not database.might_contain(f"missing_{i}") for i in range(1000))
+            assert negatives > 970
+        stats = database.stats()
+        assert stats["bloom"]["count"] == 101
+        assert stats["bloom"]["fpr"] < 0.01
+        assert stats["counters"]["bloom_negatives"] >= negatives
+        assert 0 <= stats["bloom"]["observed_fpr"] < 0.03
+
+        # Deleted keys remain in the filter until compaction rebuilds it.
+        with database as db:
+            db.delete_many(keys=[f"key_{i}" for i in range(100)])
+        assert database.might_contain("key_5")
+        database.compact()
+        assert not database.might_contain("key_5")
+        assert database.might_contain("extra")
+        assert database.stats()["bloom"]["count"] == 1
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_interrupted_writer(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        with database as db:
+            db.insert(key="saved", value=1)
+        reader = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        assert not reader.might_contain("unsaved")
+        # A writer that dies after writing leaves the filter marked dirty, so it isn't trusted,
+        # and readers that loaded it before discard it.
+        database.connect()
+        database.insert(key="unsaved", value=2)
+        database._connection.sync()
+        database._lock.release()
+        database._is_connected = False
+        with reader.reading() as db:
+            assert db.exists("unsaved")
+        assert reader.might_contain("unsaved")
+        assert reader.might_contain("anything")
+        # The next writer rebuilds it.
+        with reader as db:
+            assert db.exists("unsaved")
+        assert reader.might_contain("unsaved")
+        assert not reader.might_contain("anything")
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_studio_exists(self, dataset, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        studio = Studio(name="studio", location=LOCATION)
+        workspace = studio.create_workspace(name="workspace")
+        repo = workspace.create_repo(name="repo")
+        repo.add(dataset)
+        workspace.add(repo)
+        studio.add(workspace)
+        assert studio.exists("workspace")
+        assert workspace.exists("repo")
+        assert repo.exists(dataset.name)
+        # Checks for names never added are answered without opening any database.
+        with monkeypatch.context() as patch:
+            patch.setattr(ObjectDB, "connect", refuse)
+            assert sum(studio.exists(f"workspace_{i}") for i in range(100)) < 5
+            assert sum(workspace.exists(f"repo_{i}") for i in range(100)) < 5
+            assert sum(repo.exists(f"dataset_{i}") for i in range(100)) < 5
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_cache.py                                               #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pickle
+import pytest
+import logging
+
+from atelier.persistence.cache import ObjectCache
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.cache
+class TestObjectCache:  # pragma: no cover
+    # ============================================================================================ #
+    def test_lru_eviction(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        cache = ObjectCache(capacity=100)
+        cache.put("a", "A", size=40)
+        cache.put("b", "B", size=40)
+        assert cache.get("a") == "A"  # a is now most recently used
+        cache.put("c", "C", size=40)  # evicts b
+        assert "b" not in cache
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+        assert cache.size == 80
+        assert cache.evictions == 1
+        assert cache.hits == 3
+        assert cache.misses == 1
+
+        cache.put("huge", "H", size=101)
+        assert "huge" not in cache
+        assert len(cache) == 2
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_invalidate_clear(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        cache = ObjectCache(capacity=100)
+        cache.put("a", "A", size=40)
+        cache.put("a", "A2", size=50)
+        assert cache.size == 50
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        assert cache.size == 0
+        cache.put("b", "B", size=10)
+        cache.clear()
+        assert len(cache) == 0
+        stats = cache.stats()
+        assert stats["capacity"] == 100
+        assert stats["objects"] == 0
+
+        # Pickling carries the capacity only.
+        cache.put("b", "B", size=10)
+        restored = pickle.loads(pickle.dumps(cache))
+        assert restored.capacity == 100
+        assert len(restored) == 0
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
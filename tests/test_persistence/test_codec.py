@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_codec.py                                               #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import shutil
+
+from atelier.persistence.codec import CodecFactory, MAGIC
+from atelier.persistence.factory import DatabaseFactory
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+LOCATION = "tests/results/persistence/codec"
+
+
+@pytest.mark.codec
+class TestCodec:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_codecs(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for engine in ["shelve", "sqlite"]:
+            for codec in CodecFactory.available():
+                db = DatabaseFactory.database(
+                    name=codec,
+                    filepath=f"{LOCATION}/{engine}/{codec}.db",
+                    engine=engine,
+                    codec=codec,
+                )
+                with db:
+                    db.insert(key="df", value=dataframe)
+                    assert db.select(key="df").equals(dataframe)
+                    db.update(key="df", value=dataframe.head(10))
+                    assert db.select_many(keys=["df"]).items["df"].equals(dataframe.head(10))
+        with pytest.raises(ValueError):
+            CodecFactory.codec("snappy")
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_mixed(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Values written with one codec are read by a database configured with another.
+        for engine in ["shelve", "sqlite"]:
+            filepath = f"{LOCATION}/{engine}/mixed.db"
+            for codec in ["none", "zlib", "lzma"]:
+                db = DatabaseFactory.database(
+                    name="mixed", filepath=filepath, engine=engine, codec=codec
+                )
+                with db:
+                    db.insert(key=codec, value=dataframe.head(100))
+            db = DatabaseFactory.database(name="mixed", filepath=filepath, engine=engine)
+            with db:
+                values = db.selectall()
+            assert len(values) == 3
+            for value in values.values():
+                assert value.equals(dataframe.head(100))
+        # Compressed values carry the codec header; plain values are pickles.
+        db = DatabaseFactory.database(
+            name="mixed", filepath=f"{LOCATION}/sqlite/mixed.db", engine="sqlite"
+        )
+        with db:
+            rows = dict(db._connection.execute("SELECT key, value FROM objects").fetchall())
+        assert rows["zlib"].startswith(MAGIC)
+        assert not rows["none"].startswith(MAGIC)
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
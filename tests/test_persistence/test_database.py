@@ -1,457 +1,786 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /tests/test_persistence/test_database.py                                            #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 05:57:22 am                                                 #
-# Modified   : Thursday March 2nd 2023 12:41:20 pm                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-import os
-import inspect
-from datetime import datetime
-import pytest
-import logging
-import shutil
-
-from atelier.persistence.odb import ObjectDB
-from atelier.persistence.exceptions import (
-    ObjectExistsError,
-    ObjectNotFoundError,
-    ObjectDatabaseConnectionError,
-)
-
-# ------------------------------------------------------------------------------------------------ #
-logger = logging.getLogger(__name__)
-# ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
-
-DB_FILEPATH = "tests/testdata/test_workspace/test.db"
-
-
-@pytest.mark.odb
-class TestDatabase:  # pragma: no cover
-    # ============================================================================================ #
-    def test_setup(self, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        shutil.rmtree(os.path.dirname(DB_FILEPATH), ignore_errors=True)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_connect_context(self, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        db = ObjectDB(name="test_db", filepath=DB_FILEPATH)
-        assert db.is_connected is False
-        db.connect()
-        assert db.is_connected is True
-        db.close()
-        assert db.is_connected is False
-        with db as odb:
-            assert odb.is_connected is True
-        assert odb.is_connected is False
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_insert_exists(self, dataframe, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        key = inspect.stack()[0][3] + "_1"
-        odb = ObjectDB(name="test_db", filepath=DB_FILEPATH)
-        with odb as db:
-            db.insert(key=key, value=dataframe)
-            assert db.exists(key=key)
-            assert db.is_connected is True
-        assert odb.is_connected is False
-
-        # Exceptions
-        odb.connect()
-        with pytest.raises(ObjectExistsError):
-            odb.insert(key=key, value=dataframe)
-        odb.close()
-
-        with pytest.raises(ObjectDatabaseConnectionError):
-            odb.insert(key=key, value=dataframe)
-
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_select(self, dataframe, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        key = inspect.stack()[0][3] + "_1"
-        odb = ObjectDB(name="test_db", filepath=DB_FILEPATH)
-
-        with pytest.raises(ObjectDatabaseConnectionError):
-            odb.select(key=key)
-
-        with odb as db:
-            db.insert(key=key, value=dataframe)
-            df = db.select(key=key)
-            assert dataframe.equals(df)
-        assert odb.is_connected is False
-
-        odb.connect()
-        with pytest.raises(ObjectNotFoundError):
-            df = odb.select(key="test_df_xes")
-        odb.close()
-
-        with pytest.raises(ObjectDatabaseConnectionError):
-            odb.select(key=key)
-
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_selectall(self, dataframe, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
-
-        with pytest.raises(ObjectDatabaseConnectionError):
-            database.selectall()
-
-        with database as db:
-            for i in range(1, 6):
-                key = inspect.stack()[0][3] + "_" + str(i)
-                db.insert(key=key, value=dataframe)
-
-        # Autoconnect True  autoclose is True
-        db = ObjectDB(name="test_db", filepath=DB_FILEPATH)
-        db.connect()
-        result = db.selectall()
-        db.close()
-        assert len(result) == 5
-        assert isinstance(result, dict)
-        assert db.is_connected is False
-
-        key = inspect.stack()[0][3] + "_1"
-        with pytest.raises(ObjectDatabaseConnectionError):
-            db.selectall()
-
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_update(self, dataframe, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        key = inspect.stack()[0][3] + "_1"
-        d = {"some": "dictionary", "for": "update"}
-        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
-
-        with pytest.raises(ObjectDatabaseConnectionError):
-            database.update(key="doesn't matter", value=d)
-
-        with database as db:
-            db.insert(key=key, value=dataframe)
-            db.update(key=key, value=d)
-            d2 = db.select(key=key)
-            assert d == d2
-
-            with pytest.raises(ObjectNotFoundError):
-                with database as db:
-                    db.update(key="xsdsdls", value=d)
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_delete(self, dataframe, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        key = inspect.stack()[0][3] + "_1"
-        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
-
-        with pytest.raises(ObjectDatabaseConnectionError):
-            database.delete(key="doesn't matter")
-
-        with database as db:
-            db.insert(key=key, value=dataframe)
-            db.delete(key=key)
-            assert db.exists(key=key) is False
-
-            with pytest.raises(ObjectNotFoundError):
-                with database as db:
-                    db.delete(key="xsdsdls")
-
-            with pytest.raises(ObjectDatabaseConnectionError):
-                db.delete(key=key)
-
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_clear(self, dataframe, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
-
-        with pytest.raises(ObjectDatabaseConnectionError):
-            database.clear()
-
-        with database as db:
-            for i in range(1, 6):
-                key = inspect.stack()[0][3] + "_" + str(i)
-                db.insert(key=key, value=dataframe)
-            db.clear()
-            result = db.selectall()
-            assert len(result) == 0
-
-        with pytest.raises(ObjectDatabaseConnectionError):
-            database.clear()
-
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_properties(self, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
-        assert database.name == "test_db"
-        assert database.filepath == DB_FILEPATH
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_exists(self, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
-
-        with pytest.raises(ObjectDatabaseConnectionError):
-            database.exists(key="doesn't matter")
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_database.py                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 05:57:22 am                                                 #
+# Modified   : Thursday March 2nd 2023 12:41:20 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import shutil
+
+from atelier.persistence.odb import ObjectDB
+from atelier.persistence.exceptions import (
+    ObjectExistsError,
+    ObjectNotFoundError,
+    ObjectDatabaseConnectionError,
+)
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+DB_FILEPATH = "tests/testdata/test_workspace/test.db"
+
+
+@pytest.mark.odb
+class TestDatabase:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(os.path.dirname(DB_FILEPATH), ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_connect_context(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        assert db.is_connected is False
+        db.connect()
+        assert db.is_connected is True
+        db.close()
+        assert db.is_connected is False
+        with db as odb:
+            assert odb.is_connected is True
+        assert odb.is_connected is False
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_insert_exists(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        key = inspect.stack()[0][3] + "_1"
+        odb = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        with odb as db:
+            db.insert(key=key, value=dataframe)
+            assert db.exists(key=key)
+            assert db.is_connected is True
+        assert odb.is_connected is False
+
+        # Exceptions
+        odb.connect()
+        with pytest.raises(ObjectExistsError):
+            odb.insert(key=key, value=dataframe)
+        odb.close()
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            odb.insert(key=key, value=dataframe)
+
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_select(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        key = inspect.stack()[0][3] + "_1"
+        odb = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            odb.select(key=key)
+
+        with odb as db:
+            db.insert(key=key, value=dataframe)
+            df = db.select(key=key)
+            assert dataframe.equals(df)
+        assert odb.is_connected is False
+
+        odb.connect()
+        with pytest.raises(ObjectNotFoundError):
+            df = odb.select(key="test_df_xes")
+        odb.close()
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            odb.select(key=key)
+
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_selectall(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.selectall()
+
+        with database as db:
+            for i in range(1, 6):
+                key = inspect.stack()[0][3] + "_" + str(i)
+                db.insert(key=key, value=dataframe)
+
+        # Autoconnect True  autoclose is True
+        db = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        db.connect()
+        result = db.selectall()
+        db.close()
+        assert len(result) == 5
+        assert isinstance(result, dict)
+        assert db.is_connected is False
+
+        key = inspect.stack()[0][3] + "_1"
+        with pytest.raises(ObjectDatabaseConnectionError):
+            db.selectall()
+
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_update(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        key = inspect.stack()[0][3] + "_1"
+        d = {"some": "dictionary", "for": "update"}
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.update(key="doesn't matter", value=d)
+
+        with database as db:
+            db.insert(key=key, value=dataframe)
+            db.update(key=key, value=d)
+            d2 = db.select(key=key)
+            assert d == d2
+
+            with pytest.raises(ObjectNotFoundError):
+                with database as db:
+                    db.update(key="xsdsdls", value=d)
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_delete(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        key = inspect.stack()[0][3] + "_1"
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.delete(key="doesn't matter")
+
+        with database as db:
+            db.insert(key=key, value=dataframe)
+            db.delete(key=key)
+            assert db.exists(key=key) is False
+
+            with pytest.raises(ObjectNotFoundError):
+                with database as db:
+                    db.delete(key="xsdsdls")
+
+            with pytest.raises(ObjectDatabaseConnectionError):
+                db.delete(key=key)
+
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_clear(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.clear()
+
+        with database as db:
+            for i in range(1, 6):
+                key = inspect.stack()[0][3] + "_" + str(i)
+                db.insert(key=key, value=dataframe)
+            db.clear()
+            result = db.selectall()
+            assert len(result) == 0
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.clear()
+
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_properties(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        assert database.name == "test_db"
+        assert database.filepath == DB_FILEPATH
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_exists(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.exists(key="doesn't matter")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_session(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        key = inspect.stack()[0][3] + "_1"
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        assert database.in_session is False
+        with database.session() as odb:
+            assert odb.is_connected is True
+            assert odb.in_session is True
+            with odb as db:
+                db.insert(key=key, value=dataframe)
+            # Connection survives the context block while the session is open.
+            assert odb.is_connected is True
+            with odb as db:
+                assert db.exists(key=key)
+            odb.flush()
+            # Sessions nest; the connection is closed by the outermost session.
+            with odb.session():
+                assert odb.select(key=key).equals(dataframe)
+            assert odb.is_connected is True
+        assert database.is_connected is False
+        assert database.in_session is False
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.flush()
+
+        database.open_session()
+        assert database.exists(key=key)
+        database.close_session()
+        assert database.is_connected is False
+
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        keys = [inspect.stack()[0][3] + "_" + str(i) for i in range(1, 6)]
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.insert_many(items={key: dataframe for key in keys})
+
+        with database as db:
+            db.insert(key=keys[0], value=dataframe)
+            result = db.insert_many(items={key: dataframe for key in keys})
+            assert result.ok is False
+            assert list(result.items.keys()) == keys[1:]
+            assert isinstance(result.errors[keys[0]], ObjectExistsError)
+
+            result = db.select_many(keys=keys + ["missing"])
+            assert len(result.items) == 5
+            assert result.items[keys[1]].equals(dataframe)
+            assert isinstance(result.errors["missing"], ObjectNotFoundError)
+
+            result = db.delete_many(keys=keys[:3] + ["missing"])
+            assert list(result.items.keys()) == keys[:3]
+            assert isinstance(result.errors["missing"], ObjectNotFoundError)
+            assert db.exists(key=keys[0]) is False
+            assert db.exists(key=keys[3]) is True
+
+            result = db.delete_many(keys=keys[3:])
+            assert result.ok
+
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_iter(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        keys = [f"iter_{i}" for i in range(1, 6)]
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        with database as db:
+            db.insert_many(items={key: dataframe for key in keys})
+            db.insert(key="other", value=dataframe.head(10))
+            assert sorted(db.iter_keys()) == sorted(keys + ["other"])
+            assert sorted(db.iter_keys(where=lambda key: key.startswith("iter_"))) == keys
+            items = db.iter_items(where=lambda key: key.startswith("iter_"))
+            key, value = next(items)
+            assert key in keys
+            assert value.equals(dataframe)
+            assert len(list(items)) == 4
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_scan(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        keys = [f"sales_{year}_{month:02d}" for year in (2022, 2023) for month in range(1, 13)]
+        with database as db:
+            db.insert_many(items={key: {"key": key} for key in reversed(keys)})
+            db.insert(key="other", value=None)
+            db.delete(key="sales_2022_01")
+        with ObjectDB(name="test_db", filepath=DB_FILEPATH).reading() as db:
+            assert db.scan(prefix="sales_2023_").keys == keys[12:]
+            assert db.scan(start="sales_2022_11", end="sales_2023_02").keys == keys[10:13]
+            assert db.scan(
+                prefix="sales_2022_", start="sales_2022_06", end="sales_2022_08"
+            ).keys == [
+                "sales_2022_06",
+                "sales_2022_07",
+            ]
+            assert db.scan().keys == ["other"] + keys[1:]
+            assert db.scan(prefix="missing").keys == []
+            # Pagination
+            pages = []
+            page = db.scan(prefix="sales_", limit=10)
+            pages.append(page.keys)
+            while page.next is not None:
+                page = db.scan(prefix="sales_", limit=10, after=page.next)
+                pages.append(page.keys)
+            assert [len(keys) for keys in pages] == [10, 10, 3]
+            assert sum(pages, []) == keys[1:]
+
+        # A missing or stale index is rebuilt from the database.
+        assert os.path.exists(DB_FILEPATH + ".keys")
+        os.remove(DB_FILEPATH + ".keys")
+        with ObjectDB(name="test_db", filepath=DB_FILEPATH) as db:
+            assert db.scan(prefix="sales_2023_").keys == keys[12:]
+            db.clear()
+            assert db.scan().keys == []
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_compact(self, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        with database as db:
+            db.insert_many(items={f"key_{i:03d}": os.urandom(4096) for i in range(100)})
+            db.delete_many(keys=[f"key_{i:03d}" for i in range(80)])
+            garbage = db.garbage()
+            assert garbage >= 80 * 4096
+        with pytest.raises(ObjectDatabaseConnectionError):
+            with database as db:
+                db.compact()
+        usage = database.disk_usage
+        reclaimed = database.compact()
+        assert reclaimed >= 80 * 4096
+        assert database.disk_usage == usage - reclaimed
+        with database.reading() as db:
+            assert db.garbage() < garbage
+            assert db.scan().keys == [f"key_{i:03d}" for i in range(80, 100)]
+            assert len(db.select(key="key_099")) == 4096
+
+        # A swap interrupted after its manifest is written is completed on the next connection.
+        with database as db:
+            db.delete(key="key_099")
+        monkeypatch.setattr(ObjectDB, "_complete_swap", lambda self: None)
+        database.compact()
+        assert os.path.exists(DB_FILEPATH + ".swap")
+        monkeypatch.undo()
+        with ObjectDB(name="test_db", filepath=DB_FILEPATH).reading() as db:
+            assert not os.path.exists(DB_FILEPATH + ".swap")
+            assert not db.exists(key="key_099")
+            assert len(list(db.iter_keys())) == 19
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_interrupted_writer(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        with database as db:
+            db.insert_many(items={"a": 1, "b": 2, "c": 3})
+        reader = ObjectDB(name="test_db", filepath=DB_FILEPATH)
+        with reader.reading() as db:
+            assert db.scan().keys == ["a", "b", "c"]
+        # A writer that dies after inserting one key and deleting another leaves the key count, and
+        # the index file, unchanged. The index is marked dirty, so it isn't trusted.
+        database.connect()
+        database.insert(key="d", value=4)
+        database.delete(key="a")
+        database._connection.sync()
+        database._lock.release()
+        database._is_connected = False
+        assert os.path.exists(DB_FILEPATH + ".keys.dirty")
+        with reader.reading() as db:
+            assert db.scan().keys == ["b", "c", "d"]
+        with ObjectDB(name="test_db", filepath=DB_FILEPATH).reading() as db:
+            assert db.scan().keys == ["b", "c", "d"]
+        # The next writer saves the rebuilt index and removes the marker.
+        with ObjectDB(name="test_db", filepath=DB_FILEPATH) as db:
+            assert db.scan().keys == ["b", "c", "d"]
+        assert not os.path.exists(DB_FILEPATH + ".keys.dirty")
+        with reader.reading() as db:
+            assert db.scan().keys == ["b", "c", "d"]
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
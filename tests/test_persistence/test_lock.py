@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_lock.py                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import multiprocessing
+import pytest
+import logging
+import shutil
+import time
+
+from atelier.persistence.exceptions import LockTimeoutError
+from atelier.persistence.lock import FileLock
+from atelier.persistence.odb import ObjectDB
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+LOCATION = "tests/results/persistence/lock"
+DB_FILEPATH = f"{LOCATION}/locked.db"
+WORKERS = 4
+KEYS = 25
+
+
+# ------------------------------------------------------------------------------------------------ #
+def ingest(worker: int) -> None:
+    """Inserts KEYS objects into the shared database, one connection per insert."""
+    database = ObjectDB(name="locked", filepath=DB_FILEPATH)
+    for i in range(KEYS):
+        with database as db:
+            db.insert(key=f"{worker}_{i}", value={"worker": worker, "i": i})
+
+
+@pytest.mark.lock
+class TestFileLock:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_shared_exclusive(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = f"{LOCATION}/test.lock"
+        readers = [FileLock(filepath=filepath, timeout=0.1) for _ in range(3)]
+        # Readers never block one another.
+        for reader in readers:
+            reader.acquire(shared=True)
+            assert reader.is_shared
+        writer = FileLock(filepath=filepath, timeout=0.1)
+        with pytest.raises(LockTimeoutError):
+            writer.acquire()
+        for reader in readers:
+            reader.release()
+        writer.acquire()
+        assert writer.is_locked and not writer.is_shared
+        with pytest.raises(LockTimeoutError):
+            readers[0].acquire(shared=True)
+        writer.release()
+
+        stats = writer.stats()
+        assert stats["acquisitions"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["contentions"] == 1
+        assert stats["max_wait_time"] >= 0.1
+        assert readers[0].stats()["timeouts"] == 1
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_objectdb(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        writer = ObjectDB(name="locked", filepath=DB_FILEPATH, timeout=0.1)
+        reader = ObjectDB(name="locked", filepath=DB_FILEPATH, timeout=0.1)
+        with writer as db:
+            db.insert(key="a", value=1)
+            # A writer excludes readers.
+            with pytest.raises(LockTimeoutError):
+                with reader.reading():
+                    pass
+        # Readers don't block one another.
+        with reader.reading() as r1:
+            with ObjectDB(name="locked", filepath=DB_FILEPATH, timeout=0.1).reading() as r2:
+                assert r1.select(key="a") == r2.select(key="a") == 1
+            with pytest.raises(LockTimeoutError):
+                with writer:
+                    pass
+        assert reader.lock_stats()["timeouts"] == 1
+        assert writer.lock_stats()["timeouts"] == 1
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_parallel_writers(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        context = multiprocessing.get_context("fork")
+        start_time = time.perf_counter()
+        processes = [context.Process(target=ingest, args=(worker,)) for worker in range(WORKERS)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            assert process.exitcode == 0
+        logger.info(
+            f"\n\tParallel ingest took {round(time.perf_counter() - start_time, 2)} seconds."
+        )
+        with ObjectDB(name="locked", filepath=DB_FILEPATH).reading() as db:
+            objects = db.selectall()
+        assert len(objects) == WORKERS * KEYS
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
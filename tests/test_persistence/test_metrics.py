@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_metrics.py                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import json
+import os
+import pytest
+import logging
+import shutil
+import time
+
+from atelier.persistence.metrics import BUCKETS, Histogram, Metrics, MetricsReporter
+from atelier.persistence.repo import Repo
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+LOCATION = "tests/results/persistence/metrics"
+
+
+@pytest.mark.metrics
+class TestMetrics:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_histogram(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        hist = Histogram()
+        assert hist.stats()["p50"] == 0.0
+        for ms in range(1, 101):
+            hist.observe(ms / 1000)
+        stats = hist.stats()
+        assert stats["count"] == 100
+        assert stats["min"] == 0.001 and stats["max"] == 0.1
+        assert abs(stats["mean"] - 0.0505) < 1e-9
+        # Percentiles are bucket bounds, within a factor of two of the exact value.
+        assert 0.05 <= stats["p50"] <= 0.1
+        assert 0.095 <= stats["p99"] <= 0.1
+        hist.observe(10 * BUCKETS[-1])
+        assert hist.stats()["max"] == 10 * BUCKETS[-1]
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_metrics(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        metrics = Metrics()
+        metrics.count("bytes_read", 10)
+        metrics.count("bytes_read", 5)
+        with metrics.time("select"):
+            time.sleep(0.01)
+        stats = metrics.stats()
+        assert stats["counters"] == {"bytes_read": 15}
+        assert stats["latency"]["select"]["count"] == 1
+        assert stats["latency"]["select"]["total"] >= 0.01
+        metrics.reset()
+        assert metrics.stats() == {"counters": {}, "latency": {}}
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_repo_stats(self, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name="stats", location=LOCATION)
+        repo.add(dataset)
+        repo.get(dataset.name).data
+        repo.update(dataset)
+        stats = repo.stats()
+        assert stats["name"] == "stats"
+        assert {"add", "get", "update"} <= set(stats["operations"])
+        assert stats["operations"]["add"]["count"] == 1
+        assert stats["bytes_written"] >= stats["blobs"]["counters"]["bytes_written"] > 0
+        assert stats["bytes_read"] >= stats["blobs"]["counters"]["bytes_read"] > 0
+        database = stats["databases"]["stats"]
+        assert {"connect", "insert", "select", "update", "pickle", "unpickle"} <= set(
+            database["latency"]
+        )
+        assert database["lock"]["acquisitions"] > 0
+        # Metrics are per process: copies start afresh.
+        assert repo.clone().stats()["operations"] == {}
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_reporter(self, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name="stats", location=LOCATION)
+        filepath = os.path.join(LOCATION, "stats.json")
+        with MetricsReporter(source=repo, interval=0.05, filepath=filepath):
+            repo.add(dataset)
+            time.sleep(0.2)
+            with open(filepath) as file:
+                assert json.load(file)["name"] == "stats"
+        # A final report is written on stop.
+        with open(filepath) as file:
+            assert json.load(file)["operations"]["add"]["count"] == 1
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -1,386 +1,1599 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /tests/test_persistence/test_repo.py                                                #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Thursday March 2nd 2023 12:20:26 pm                                                 #
-# Modified   : Thursday March 2nd 2023 04:23:14 pm                                                 #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-import os
-import inspect
-from datetime import datetime
-import pytest
-import logging
-import shutil
-
-from atelier.persistence.repo import Repo
-from atelier.data.dataset import Dataset
-
-# ------------------------------------------------------------------------------------------------ #
-logger = logging.getLogger(__name__)
-# ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
-
-NAME = "test_repo"
-LOCATION = "tests/results/persistence/repo"
-
-
-@pytest.mark.repo
-class TestRepo:  # pragma: no cover
-    # ============================================================================================ #
-    def test_setup(self, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        shutil.rmtree(LOCATION, ignore_errors=True)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_add(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        repo = Repo(name=NAME, location=LOCATION)
-        assert os.path.exists(LOCATION)
-        ds = repo.add(dataset)
-        assert repo.exists(dataset.name)
-        assert isinstance(ds.created, datetime)
-        assert isinstance(ds.added, datetime)
-
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_get(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        repo = Repo(name=NAME, location=LOCATION)
-        repo.add(dataset)
-        ds = repo.get(dataset.name)
-        assert isinstance(ds, Dataset)
-        assert isinstance(ds.created, datetime)
-        assert isinstance(ds.added, datetime)
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_getall(self, datasets, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        repo = Repo(name=NAME, location=LOCATION)
-        for dataset in datasets:
-            repo.add(dataset)
-        objects = repo.getall()
-        assert isinstance(objects, dict)
-        assert len(objects) == 5
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_update(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-
-        repo = Repo(name=NAME, location=LOCATION)
-        repo.add(dataset)
-        ds = repo.update(dataset)
-        assert isinstance(ds.modified, datetime)
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_remove(self, dataset, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        repo = Repo(name=NAME, location=LOCATION)
-        repo.add(dataset)
-        repo.remove(dataset.name)
-        assert not repo.exists(name=dataset.name)
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_print(self, datasets, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        repo = Repo(name=NAME, location=LOCATION)
-        for dataset in datasets:
-            repo.add(dataset)
-
-        repo.print()
-        self.test_setup(caplog)
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_properties(self, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        repo = Repo(name=NAME, location=LOCATION)
-        assert repo.name == NAME
-        assert repo.location == os.path.join(LOCATION, NAME)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_size(self, datasets, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        repo = Repo(name=NAME, location=LOCATION)
-        for dataset in datasets:
-            repo.add(dataset)
-        size = repo.size
-        assert isinstance(size, int)
-        assert size > 4000000 * 5
-        self.test_setup(caplog)
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
-
-    # ============================================================================================ #
-    def test_drop(self, datasets, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        repo = Repo(name=NAME, location=LOCATION, safe_mode=True)
-        for dataset in datasets:
-            repo.add(dataset)
-        repo_location = os.path.join(LOCATION, NAME)
-        assert os.path.exists(repo_location)
-        repo.drop()  # Answer no to prompt
-        repo.drop()  # Answer yes
-        assert not os.path.exists(repo_location)
-
-        repo = Repo(name=NAME, location=LOCATION, safe_mode=False)
-        for dataset in datasets:
-            repo.add(dataset)
-        assert os.path.exists(repo_location)
-        repo.drop()
-        assert not os.path.exists(repo_location)
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_repo.py                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Thursday March 2nd 2023 12:20:26 pm                                                 #
+# Modified   : Thursday March 2nd 2023 04:23:14 pm                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import os
+from contextlib import nullcontext
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import pickle
+import shutil
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from atelier.persistence.repo import Repo
+from atelier.persistence.exceptions import ObjectExistsError, ObjectNotFoundError
+from atelier.data.dataset import Dataset, FileDataset, PartitionedDataset
+from atelier.data.stats import can_match
+from atelier.utils.memory import estimate_size
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+NAME = "test_repo"
+LOCATION = "tests/results/persistence/repo"
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Unread:
+    """Wraps a pyarrow dataset, failing if its data is read."""
+
+    def __init__(self, dataset) -> None:
+        self.schema = dataset.schema
+
+    def to_table(self, *args, **kwargs):
+        pytest.fail("Read the file.")
+
+
+@pytest.mark.repo
+class TestRepo:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(LOCATION, ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_add(self, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        assert os.path.exists(LOCATION)
+        ds = repo.add(dataset)
+        assert repo.exists(dataset.name)
+        assert isinstance(ds.created, datetime)
+        assert isinstance(ds.added, datetime)
+
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_get(self, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        repo.add(dataset)
+        ds = repo.get(dataset.name)
+        assert isinstance(ds, Dataset)
+        assert isinstance(ds.created, datetime)
+        assert isinstance(ds.added, datetime)
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_getall(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        for dataset in datasets:
+            repo.add(dataset)
+        objects = repo.getall()
+        assert isinstance(objects, dict)
+        assert len(objects) == 5
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_update(self, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+
+        repo = Repo(name=NAME, location=LOCATION)
+        repo.add(dataset)
+        ds = repo.update(dataset)
+        assert isinstance(ds.modified, datetime)
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_remove(self, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        repo.add(dataset)
+        repo.remove(dataset.name)
+        assert not repo.exists(name=dataset.name)
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_print(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        for dataset in datasets:
+            repo.add(dataset)
+
+        repo.print()
+        self.test_setup(caplog)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_properties(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        assert repo.name == NAME
+        assert repo.location == os.path.join(LOCATION, NAME)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_size(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        for dataset in datasets:
+            repo.add(dataset)
+        size = repo.size
+        assert isinstance(size, int)
+        assert size > 4000000 * 5
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_drop(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION, safe_mode=True)
+        for dataset in datasets:
+            repo.add(dataset)
+        repo_location = os.path.join(LOCATION, NAME)
+        assert os.path.exists(repo_location)
+        repo.drop()  # Answer no to prompt
+        repo.drop()  # Answer yes
+        assert not os.path.exists(repo_location)
+
+        repo = Repo(name=NAME, location=LOCATION, safe_mode=False)
+        for dataset in datasets:
+            repo.add(dataset)
+        assert os.path.exists(repo_location)
+        repo.drop()
+        assert not os.path.exists(repo_location)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_session(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        with repo.session():
+            for dataset in datasets:
+                repo.add(dataset)
+                assert repo.exists(dataset.name)
+            repo.flush()
+            assert len(repo.getall()) == 5
+            assert repo._db.is_connected is True
+        assert repo._db.is_connected is False
+
+        repo.open_session()
+        assert isinstance(repo.get(datasets[0].name), Dataset)
+        repo.close_session()
+        assert repo._db.is_connected is False
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        repo.add(datasets[0])
+        result = repo.add_many(datasets)
+        assert len(result.items) == 4
+        assert datasets[0].name in result.errors
+        for dataset in datasets:
+            assert repo.exists(dataset.name)
+            assert isinstance(dataset.added, datetime)
+
+        names = [dataset.name for dataset in datasets]
+        result = repo.get_many(names + ["missing"])
+        assert len(result.items) == 5
+        assert isinstance(result.items[names[0]], Dataset)
+        assert "missing" in result.errors
+
+        result = repo.remove_many(names)
+        assert result.ok
+        assert len(repo.getall()) == 0
+        # Names given twice in a batch are reported; the first asset of the name is added.
+        first = Dataset(name="twice", description="First", data={"n": 1})
+        second = Dataset(name="twice", description="Second", data={"n": 2})
+        for transaction in (False, True):
+            with repo.transaction() if transaction else nullcontext():
+                result = repo.add_many([first, second])
+            assert list(result.items) == ["twice"] and "twice" in result.errors
+            assert repo.get("twice").data == {"n": 1}
+            assert repo.size == repo.get("twice").memory
+            repo.remove("twice")
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_sqlite_engine(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION, engine="sqlite")
+        assert repo.engine == "sqlite"
+        for dataset in datasets:
+            repo.add(dataset)
+        assert repo.exists(datasets[0].name)
+        assert isinstance(repo.get(datasets[0].name), Dataset)
+        assert len(repo.getall()) == 5
+        repo.remove(datasets[0].name)
+        assert repo.exists(datasets[0].name) is False
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_inventory(self, datasets, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        for dataset in datasets:
+            repo.add(dataset)
+        repo.update(datasets[0])
+        repo.remove(datasets[1].name)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Inventory must not load asset payloads.")
+
+        # Inventory, size and print are served from the metadata table alone.
+        monkeypatch.setattr(repo._db, "selectall", fail)
+        monkeypatch.setattr(repo._db, "select", fail)
+        inventory = repo.inventory()
+        assert len(inventory) == 4
+        assert datasets[1].name not in inventory["name"].values
+        assert inventory.loc[inventory["name"] == datasets[0].name, "modified"].notna().all()
+        assert repo.size == inventory["memory"].sum()
+        repo.print()
+
+        selected = repo.inventory(where=lambda record: record["name"].endswith("_5"))
+        assert list(selected["name"]) == [datasets[4].name]
+        monkeypatch.undo()
+
+        # Reindex rebuilds the metadata table from the stored assets.
+        with repo._metadata as mdb:
+            mdb.clear()
+        assert len(repo.inventory()) == 0
+        repo.reindex()
+        assert len(repo.inventory()) == 4
+
+        # Repositories created before the metadata table are reindexed when first opened.
+        with repo._metadata as mdb:
+            mdb.clear()
+        reopened = Repo(name=NAME, location=LOCATION)
+        assert len(reopened.inventory()) == 4
+        assert reopened.size == reopened.inventory()["memory"].sum()
+        with repo._metadata as mdb:
+            mdb.clear()
+        assert len(pickle.loads(pickle.dumps(repo)).inventory()) == 4
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_cache(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        for dataset in datasets:
+            repo.add(dataset)
+        memory = repo.get(datasets[0].name).memory
+        repo = Repo(name=NAME, location=LOCATION, cache_size=int(memory * 2.5))
+        first = repo.get(datasets[0].name)
+        assert repo.get(datasets[0].name) is first
+        assert repo.cache.hits == 1
+        assert repo.cache.misses == 1
+
+        repo.get(datasets[1].name)
+        repo.get(datasets[2].name)  # evicts datasets[0]
+        assert repo.cache.evictions == 1
+        assert datasets[0].name not in repo.cache
+
+        result = repo.get_many([datasets[1].name, datasets[2].name, "missing"])
+        assert len(result.items) == 2
+        assert "missing" in result.errors
+
+        repo.update(datasets[1])
+        assert datasets[1].name not in repo.cache
+        repo.remove(datasets[2].name)
+        assert datasets[2].name not in repo.cache
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_lazy_payloads(self, datasets, dataframe, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        for dataset in datasets:
+            repo.add(dataset)
+
+        # Obtaining assets loads metadata only.
+        assets = repo.getall()
+        assert len(assets) == 5
+        for asset in assets.values():
+            assert asset.is_loaded is False
+            assert asset.memory > 0
+
+        ds = repo.get(datasets[0].name)
+        assert ds.is_loaded is False
+        assert ds.description == datasets[0].description
+        assert ds.data.equals(dataframe)
+        assert ds.is_loaded is True
+        ds.release()
+        assert ds.is_loaded is False
+        assert ds.data.equals(dataframe)
+
+        # Updating metadata without loading the payload leaves the stored payload untouched.
+        ds = repo.get(datasets[1].name)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Unloaded payloads must not be rewritten.")
+
+        monkeypatch.setattr(repo._payloads, "insert_many", fail)
+        repo.update(ds)
+        monkeypatch.undo()
+        assert repo.get(datasets[1].name).data.equals(dataframe)
+
+        # Replacing the data rewrites the payload.
+        ds.data = dataframe.head(10)
+        repo.update(ds)
+        assert len(repo.get(datasets[1].name).data) == 10
+
+        repo.remove(datasets[0].name)
+        with repo._payloads as pdb:
+            assert pdb.exists(key=datasets[0].name) is False
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_blob_payloads(self, datasets, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION, blob_threshold=100000)
+        small = Dataset(name="small", description="Below the blob threshold", data={"a": 1})
+        repo.add(small)
+        for dataset in datasets:
+            repo.add(dataset)
+
+        def blob_files():
+            return [f for f in os.listdir(repo.blob_location) if not f.startswith("refcounts")]
+
+        # The datasets share one DataFrame, which is stored once.
+        assert len(blob_files()) == 1
+        assert repo.get("small").data == {"a": 1}
+        assert repo.get(datasets[0].name).data.equals(dataframe)
+        assert repo.physical_size < repo.logical_size
+
+        # Replacing and removing payloads release their references to the blob.
+        ds = repo.get(datasets[0].name)
+        ds.data = dataframe.head(100)
+        repo.update(ds)
+        # The smaller payload is stored inline.
+        assert len(repo.get(datasets[0].name).data) == 100
+        repo.remove(datasets[0].name)
+        repo.remove_many([dataset.name for dataset in datasets[1:3]])
+        assert len(blob_files()) == 1
+        # The blob is deleted with its last reference.
+        repo.remove_many([dataset.name for dataset in datasets[3:]])
+        assert len(blob_files()) == 0
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_codec(self, dataset, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        plain = Repo(name="plain", location=LOCATION, blob_threshold=None)
+        compressed = Repo(name="compressed", location=LOCATION, blob_threshold=None, codec="zlib")
+        for repo in [plain, compressed]:
+            repo.add(dataset)
+            assert repo.get(dataset.name).data.equals(dataset.data)
+        assert compressed.codec == "zlib"
+        assert compressed.physical_size < plain.physical_size
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_zero_copy_payloads(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = pd.DataFrame(np.random.default_rng(0).random((1000000, 5)), columns=list("abcde"))
+        nbytes = data.memory_usage(index=True).sum()
+        repo = Repo(name=NAME, location=LOCATION)
+        dataset = Dataset(name="large", description="Saved and loaded without a copy", data=data)
+        # Neither saving nor loading the payload allocates a second copy of the data.
+        tracemalloc.start()
+        repo.add(dataset)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert peak < nbytes / 2
+        tracemalloc.start()
+        loaded = repo.get("large").data
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert peak < nbytes / 2
+        assert loaded.equals(data)
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_iter_assets(self, datasets, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION, blob_threshold=None)
+        for dataset in datasets:
+            repo.add(dataset)
+        repo.add(Dataset(name="other", description="Filtered out", data={"a": 1}))
+        assert sorted(repo.iter_keys(where=lambda name: name.startswith("test_dataset"))) == sorted(
+            dataset.name for dataset in datasets
+        )
+        # Only one dataset's payload is held at a time. Loading one briefly holds both its
+        # serialized and unpickled copies; holding a second would add another unpickled copy.
+        memory = repo.get(datasets[0].name).memory
+        serialized = len(pickle.dumps(dataframe, protocol=pickle.HIGHEST_PROTOCOL))
+        tracemalloc.start()
+        count = 0
+        for asset in repo.iter_assets(where=lambda name: name.startswith("test_dataset")):
+            assert asset.data.equals(dataframe)
+            count += 1
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert count == len(datasets)
+        assert peak < memory + serialized + memory / 2
+        # The repository may be modified while iterating.
+        for name, asset in repo.iter_items():
+            repo.remove(name)
+            if repo.exists("other"):
+                repo.remove("other")
+        assert list(repo.iter_keys()) == []
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_scan(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name=NAME, location=LOCATION)
+        repo.add_many(datasets)
+        names = sorted(dataset.name for dataset in datasets)
+        # Payloads are not read.
+        repo._load_payload = None
+        assert repo.scan(prefix="test_dataset_").keys == names
+        page = repo.scan(start="test_dataset_2", limit=2)
+        assert page.keys == names[1:3]
+        assert repo.scan(start="test_dataset_2", limit=2, after=page.next).keys == names[3:5]
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_compact(self, dataset, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name="compact", location=LOCATION, blob_threshold=None)
+        repo.add(dataset)
+        for _ in range(3):
+            repo.update(dataset)
+        usage = repo.physical_size
+        reclaimed = repo.compact()
+        assert reclaimed > 0
+        assert repo.physical_size == usage - reclaimed
+        assert repo.get(dataset.name).data.equals(dataset.data)
+
+        # Automatic compaction once dead space crosses the threshold.
+        monkeypatch.setattr("atelier.persistence.repo.COMPACT_INTERVAL", 3)
+        repo = Repo(name="auto", location=LOCATION, blob_threshold=None, compact_threshold=0.5)
+        repo.add(dataset)
+        repo.update(dataset)
+        repo.update(dataset)
+        with repo._payloads.reading() as db:
+            assert db.garbage() > 0
+        usage = repo.physical_size
+        repo.update(dataset)
+        assert repo.physical_size < usage
+        with repo._payloads.reading() as db:
+            assert db.garbage() < db.disk_usage * 0.5
+        assert repo.get(dataset.name).data.equals(dataset.data)
+        # Repositories without a threshold aren't compacted.
+        repo = Repo(name="manual", location=LOCATION, blob_threshold=None)
+        repo.add(dataset)
+        for _ in range(3):
+            repo.update(dataset)
+        with repo._payloads.reading() as db:
+            assert db.garbage() > db.disk_usage * 0.5
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_transaction(self, datasets, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(name="transaction", location=LOCATION)
+        repo.add(datasets[0])
+        with repo.transaction():
+            repo.add(datasets[1])
+            repo.add_many(datasets[2:4])
+            repo.update(datasets[0])
+            repo.remove(datasets[3].name)
+            # Pending changes are seen by get and exists, but not committed.
+            assert repo.exists(datasets[1].name)
+            assert not repo.exists(datasets[3].name)
+            assert repo.get(datasets[2].name) is datasets[2]
+            assert len(repo.inventory()) == 1
+            with pytest.raises(ObjectExistsError):
+                repo.add(datasets[0])
+            with pytest.raises(ObjectNotFoundError):
+                repo.remove(datasets[3].name)
+        assert sorted(repo.inventory()["name"]) == [dataset.name for dataset in datasets[:3]]
+        assert repo.get(datasets[1].name).data.equals(datasets[1].data)
+        assert not os.path.exists(os.path.join(repo.location, "journal"))
+
+        # A block that raises discards its changes.
+        with pytest.raises(ValueError):
+            with repo.transaction():
+                repo.remove(datasets[0].name)
+                repo.add(datasets[4])
+                raise ValueError("Abort")
+        assert repo.exists(datasets[0].name)
+        assert not repo.exists(datasets[4].name)
+
+        # A journal committed by a process that died while applying it is replayed on next open.
+        def crash(self, operations):
+            raise OSError("Crashed")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(Repo, "_apply", crash)
+            with pytest.raises(OSError):
+                with repo.transaction():
+                    repo.remove(datasets[0].name)
+                    repo.add(datasets[4])
+        assert os.path.exists(os.path.join(repo.location, "journal"))
+        assert repo.exists(datasets[0].name)
+        repo = Repo(name="transaction", location=LOCATION)
+        assert not os.path.exists(os.path.join(repo.location, "journal"))
+        assert not repo.exists(datasets[0].name)
+        assert repo.get(datasets[4].name).data.equals(datasets[4].data)
+
+        # A journal left by a transaction that never committed is discarded.
+        with open(os.path.join(repo.location, "journal.tmp"), "wb") as file:
+            file.write(b"partial")
+        repo = Repo(name="transaction", location=LOCATION)
+        assert not os.path.exists(os.path.join(repo.location, "journal.tmp"))
+        assert sorted(repo.inventory()["name"]) == [dataset.name for dataset in datasets[1:3]] + [
+            datasets[4].name
+        ]
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_running_size(self, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        def frame(rows: int) -> pd.DataFrame:
+            return pd.DataFrame({"x": np.arange(rows), "y": np.arange(rows) * 0.5})
+
+        repo = Repo(name=NAME, location=LOCATION)
+        assert repo.size == 0
+        repo.add(Dataset(name="a", description="A", data=frame(1000)))
+        repo.add_many([Dataset(name=n, description=n, data=frame(2000)) for n in ("b", "c", "d")])
+        b = repo.get("b")
+        b.data = frame(50000)
+        repo.update(b)
+        repo.remove("c")
+        repo.remove_many(["d", "missing"])
+        with repo.transaction():
+            repo.add(Dataset(name="e", description="E", data=frame(3000)))
+            repo.remove("a")
+        # Size is kept as a running total, without reading the metadata table.
+        with monkeypatch.context() as patch:
+            patch.setattr(Repo, "_records", lambda self: pytest.fail("Read the metadata table."))
+            size = repo.size
+        assert size == repo.inventory()["memory"].sum()
+        assert size == repo.recompute_size()
+        assert repo.size == size
+        # Repositories without a running total count it once.
+        with repo._metadata as mdb:
+            mdb.delete(key="__size__")
+        assert repo.size == size
+        assert "__size__" not in repo.inventory()["name"].values
+        repo.reindex()
+        assert repo.size == repo.inventory()["memory"].sum()
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_memory_estimate(self, dataframe, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        calls = []
+
+        def count(obj, seen=None):
+            calls.append(obj)
+            return estimate_size(obj, seen)
+
+        monkeypatch.setattr("atelier.data.dataset.estimate_size", count)
+        dataset = Dataset(name="estimated", description="Estimated", data=dataframe)
+        memory = dataset.memory
+        assert memory >= dataframe.memory_usage(deep=True).sum()
+        # Estimated once and cached.
+        for _ in range(100):
+            assert dataset.memory == memory
+        assert len(calls) == 1
+        # Stored with the dataset, so known without loading the data or measuring again.
+        repo = Repo(name=NAME, location=LOCATION)
+        repo.add(dataset)
+        assert len(calls) == 1
+        stored = repo.get("estimated")
+        assert stored.memory == memory
+        assert not stored.is_loaded
+        assert len(stored.data) == len(dataframe)
+        assert stored.memory == memory
+        assert len(calls) == 1
+        # Replacing the data clears the estimate.
+        stored.data = dataframe.head(1000)
+        assert stored.memory < memory
+        assert len(calls) == 2
+        repo.update(stored)
+        assert repo.size == stored.memory
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_partitioned_dataset(self, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        def day(n: int, rows: int) -> pd.DataFrame:
+            return pd.DataFrame({"day": [n] * rows, "value": np.arange(rows)})
+
+        repo = Repo(name=NAME, location=LOCATION, blob_threshold=100000)
+        events = PartitionedDataset(name="events", description="Events", partitions=[day(0, 10)])
+        events.append(day(1, 20000), partition="day_1")
+        assert events.partitions == ["000000", "day_1"]
+        assert len(events.data) == 20010
+        with pytest.raises(ValueError):
+            events.append(day(1, 5), partition="day_1")
+        repo.add(events)
+        assert repo.size == events.memory
+
+        # Partitions are loaded on demand, one at a time.
+        loads = []
+        stored = repo.get("events")
+        assert stored.partitions == ["000000", "day_1"]
+        assert not stored.is_loaded
+        monkeypatch.setattr(
+            stored, "_loader", lambda partition: loads.append(partition) or day(0, 1)
+        )
+        assert len(stored.read(partitions=["000000"])) == 1
+        assert loads == ["000000"]
+        with pytest.raises(ValueError):
+            stored.read(partitions=["day_9"])
+        monkeypatch.undo()
+
+        # Appending writes the new partition alone.
+        writes = []
+        store = Repo._store
+
+        def counted(self, payload, memory):
+            writes.append(len(payload))
+            return store(self, payload, memory)
+
+        monkeypatch.setattr(Repo, "_store", counted)
+        stored = repo.get("events")
+        stored.append(day(2, 5), partition="day_2")
+        repo.update(stored)
+        assert writes == [5]
+        with repo.transaction():
+            stored = repo.get("events")
+            stored.append(day(3, 7), partition="day_3")
+            repo.update(stored)
+        assert writes == [5, 7]
+        stored = repo.get("events")
+        assert [len(chunk) for chunk in stored.iter_chunks()] == [10, 20000, 5, 7]
+        assert stored.read(partitions=["day_3", "day_2"])["day"].tolist() == [3] * 7 + [2] * 5
+        assert repo.size == repo.recompute_size()
+        # The large partition is in the blob store.
+        assert len(repo._blob_refs()) == 1
+
+        # Replacing the data drops the stored partitions.
+        stored.data = day(4, 3)
+        repo.update(stored)
+        assert repo.get("events").partitions == ["000000"]
+        assert repo._blob_refs() == []
+        assert repo.get("events").read()["day"].tolist() == [4] * 3
+
+        # Names that would collide with a partition's key, or the running total's, are rejected.
+        colliding = [
+            Dataset(name="events#000000", description="Collides", data=day(5, 2)),
+            Dataset(name="__size__", description="Collides", data=day(5, 2)),
+        ]
+        for dataset in colliding:
+            with pytest.raises(ValueError):
+                repo.add(dataset)
+            with pytest.raises(ValueError):
+                repo.update(dataset)
+            with pytest.raises(ValueError):
+                with repo.transaction():
+                    repo.add(dataset)
+        result = repo.add_many(colliding)
+        assert set(result.errors) == {"events#000000", "__size__"}
+        with repo.transaction():
+            result = repo.add_many(colliding)
+        assert set(result.errors) == {"events#000000", "__size__"}
+        assert not repo.exists("events#000000")
+        assert repo.get("events").read()["day"].tolist() == [4] * 3
+        assert repo.size == repo.recompute_size()
+        repo.remove("events")
+        with repo._payloads.reading() as pdb:
+            assert list(pdb.iter_keys()) == []
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_column_stats(self, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        def day(n: int, rows: int) -> pd.DataFrame:
+            return pd.DataFrame({"day": [n] * rows, "value": np.arange(rows) + n * 1000})
+
+        repo = Repo(name=NAME, location=LOCATION)
+        repo.add(Dataset(name="sales", description="Sales", data=day(0, 100)))
+        repo.add(PartitionedDataset(name="events", description="Events", partitions=[day(0, 10)]))
+        with repo.transaction():
+            events = repo.get("events")
+            for n in range(1, 4):
+                events.append(day(n, 10), partition=f"day_{n}")
+            repo.update(events)
+            assert repo.column_stats("events")["day"]["max"] == 3
+        # Statistics are served from the metadata table without reading assets or payloads.
+        monkeypatch.setattr(Repo, "_load_payload", lambda *args: pytest.fail("Loaded a payload."))
+        with monkeypatch.context() as patch:
+            patch.setattr(Repo, "get", lambda *args: pytest.fail("Read an asset."))
+            sales = repo.column_stats("sales")
+            events = repo.column_stats("events")
+        assert sales["value"]["rows"] == 100 and sales["value"]["max"] == 99
+        assert events["day"]["rows"] == 40
+        assert (events["value"]["min"], events["value"]["max"]) == (0, 3009)
+        assert not can_match(sales, [("day", ">", 0)])
+        with pytest.raises(ObjectNotFoundError):
+            repo.column_stats("missing")
+        # Datasets with duplicate column names are stored with their statistics combined.
+        twice = pd.concat([day(0, 10), day(5, 10)], axis=1)
+        repo.add(Dataset(name="twice", description="Duplicate columns", data=twice))
+        assert repo.column_stats("twice")["day"]["max"] == 5
+        # Partitions that can't match a filter are skipped without loading them.
+        events = repo.get("events")
+        assert events.prune([("day", ">=", 2)]) == ["day_2", "day_3"]
+        assert events.prune([("value", "==", 1005)]) == ["day_1"]
+        assert events.partition_stats["day_3"]["value"]["min"] == 3000
+        monkeypatch.undo()
+        events = repo.get("events")
+        recent = events.read(partitions=events.prune([("day", ">=", 2)]))
+        assert recent["day"].unique().tolist() == [2, 3]
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_file_dataset(self, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rows = 10000
+        data = pd.DataFrame({f"feature_{i}": np.arange(rows) * i for i in range(50)})
+        data["year"] = np.repeat(np.arange(2015, 2025), rows // 10)
+        repo = Repo(name=NAME, location=LOCATION)
+        for format in ("parquet", "feather"):
+            filepath = os.path.join(LOCATION, "files", f"wide.{format}")
+            dataset = FileDataset(name=format, description="Wide", filepath=filepath, data=data)
+            assert dataset.format == format
+            assert dataset.columns == list(data.columns)
+            assert dataset.column_stats["year"]["min"] == 2015
+            assert dataset.memory >= data.memory_usage(index=False).sum()
+            repo.add(dataset)
+            # The repository stores the path; the data is read from the file on demand.
+            stored = repo.get(format)
+            assert stored.filepath == filepath
+            features = stored.read(columns=["feature_1", "year"], filters=[("year", ">=", 2023)])
+            assert list(features.columns) == ["feature_1", "year"]
+            assert features["year"].min() == 2023 and len(features) == rows // 5
+            assert stored.read().equals(data)
+            assert stored.data.equals(data)
+            assert repo.column_stats(format)["feature_2"]["max"] == (rows - 1) * 2
+            with pytest.raises(ValueError):
+                stored.read(columns=["missing"])
+            # Files that can't match the filters aren't read.
+            open_dataset = FileDataset._dataset
+            monkeypatch.setattr(FileDataset, "_dataset", lambda self: Unread(open_dataset(self)))
+            empty = stored.read(columns=["year"], filters=[("year", ">", 2030)])
+            assert empty.empty and list(empty.columns) == ["year"]
+            monkeypatch.undo()
+            # Replacing the data rewrites the file.
+            stored.data = data.head(10)
+            assert stored.column_stats["year"]["max"] == 2015
+            assert len(FileDataset(name="copy", description="Copy", filepath=filepath).read()) == 10
+        with pytest.raises(ValueError):
+            FileDataset(name="csv", description="CSV", filepath="data.csv", format="csv")
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_compact_dtypes(self, monkeypatch, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        def frame(rows: int) -> pd.DataFrame:
+            return pd.DataFrame(
+                {
+                    "id": np.arange(rows),
+                    "region": pd.Series(np.resize(["EU", "US"], rows), dtype=object),
+                    "key": pd.Series([f"k{n}" for n in range(rows)], dtype=object),
+                }
+            )
+
+        plain = Repo(name=NAME, location=LOCATION)
+        plain.add(Dataset(name="sales", description="Sales", data=frame(50000)))
+        repo = Repo(name=f"{NAME}_compact", location=LOCATION, compact_dtypes=True)
+        with caplog.at_level(logging.INFO):
+            sales = repo.add(Dataset(name="sales", description="Sales", data=frame(50000)))
+        assert "Compacted dataset sales" in caplog.text
+        assert isinstance(sales.data["region"].dtype, pd.CategoricalDtype)
+        assert sales.memory < plain.get("sales").memory / 2
+        # The compacted data is what's stored, and the recorded memory and statistics describe it.
+        stored = repo.get("sales")
+        assert stored.data["id"].dtype == np.int32
+        assert stored.data["region"].astype(object).equals(frame(50000)["region"])
+        assert repo.size == sales.memory < plain.size
+        assert repo.column_stats("sales")["region"]["dtype"] == "category"
+        # Compaction is opt-in per call, and partitions not yet stored are compacted.
+        repo.add(Dataset(name="raw", description="Raw", data=frame(10)), compact_dtypes=False)
+        assert repo.get("raw").data["id"].dtype == np.int64
+        events = PartitionedDataset(name="events", description="Events", partitions=[frame(10)])
+        with repo.transaction():
+            repo.add_many([events])
+        assert repo.get("events").read()["id"].dtype == np.int8
+        report = Dataset(name="report", description="Report", data=frame(1000)).compact()
+        assert report["after"] < report["before"]
+        # File datasets are left as they are: the file isn't read or rewritten.
+        filepath = os.path.join(LOCATION, "files", "sales.parquet")
+        FileDataset(name="file", description="File", filepath=filepath, data=frame(1000))
+        with open(filepath, "rb") as f:
+            written = f.read()
+        open_dataset = FileDataset._dataset
+        monkeypatch.setattr(FileDataset, "_dataset", lambda self: Unread(open_dataset(self)))
+        monkeypatch.setattr(FileDataset, "_write", lambda *args: pytest.fail("Wrote the file."))
+        stored = repo.add(FileDataset(name="file", description="File", filepath=filepath))
+        assert stored.compact() is None
+        monkeypatch.undo()
+        with open(filepath, "rb") as f:
+            assert f.read() == written
+        assert repo.get("file").read()["id"].dtype == np.int64
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_add_lazy(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        source = Repo(name=NAME, location=LOCATION)
+        target = Repo(name=f"{NAME}_target", location=LOCATION)
+        data = pd.DataFrame({"x": np.arange(1000)})
+        source.add(Dataset(name="sales", description="Sales", data=data))
+        source.add(PartitionedDataset(name="events", description="Events", partitions=[data, data]))
+        # Assets obtained from a repository are lazy; adding one elsewhere copies its payload.
+        for name in ("sales", "events"):
+            asset = source.get(name)
+            assert not asset.is_loaded
+            target.add(asset)
+            assert target.get(name).data.equals(source.get(name).data)
+        target.remove_many(["sales", "events"])
+        target.add_many([source.get("sales"), source.get("events")])
+        assert target.get("events").read().equals(source.get("events").read())
+        # Assets still in use keep their payloads when removed, so they can be added again.
+        for name in ("sales", "events"):
+            asset = source.get(name)
+            source.remove(name)
+            source.add(asset)
+            assert source.get(name).data.equals(target.get(name).data)
+        with source.transaction():
+            asset = source.get("sales")
+            source.remove("sales")
+        with source.transaction():
+            source.add(asset)
+        assert source.get("sales").data.equals(data)
+        assert source.size == sum(asset.memory for asset in source.getall().values())
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
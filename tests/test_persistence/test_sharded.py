@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_sharded.py                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pickle
+import pytest
+import logging
+import shutil
+
+from atelier.persistence.factory import DatabaseFactory
+from atelier.persistence.sharded import ShardedDB
+from atelier.persistence.repo import Repo
+from atelier.persistence.exceptions import (
+    ObjectExistsError,
+    ObjectNotFoundError,
+    ObjectDatabaseConnectionError,
+)
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+DB_FILEPATH = "tests/testdata/test_sharded/test.db"
+
+
+@pytest.mark.sharded
+class TestShardedDB:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(os.path.dirname(DB_FILEPATH), ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_crud(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = DatabaseFactory.database("test_db", DB_FILEPATH, engine="sharded", shards=4)
+        assert isinstance(database, ShardedDB)
+        assert database.shards == 4
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.select(key="missing")
+        with database as db:
+            db.insert(key="frame", value=dataframe)
+            db.insert(key="other", value=1)
+            assert db.exists(key="frame")
+            assert db.select(key="frame").equals(dataframe)
+            with pytest.raises(ObjectExistsError):
+                db.insert(key="frame", value=dataframe)
+            db.update(key="other", value=2)
+            assert db.select(key="other") == 2
+            db.delete(key="other")
+            with pytest.raises(ObjectNotFoundError):
+                db.select(key="other")
+            # Only the shards used were opened.
+            assert sum(shard.is_connected for shard in db._shards) <= 2
+        assert not any(shard.is_connected for shard in database._shards)
+        assert len([f for f in os.listdir(os.path.dirname(DB_FILEPATH)) if ".shard-" in f]) > 0
+        with database.reading() as db:
+            assert list(db.iter_keys()) == ["frame"]
+            assert db.select(key="frame").equals(dataframe)
+        with database as db:
+            db.clear()
+            assert db.selectall() == {}
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        keys = [f"key_{i:03d}" for i in range(100)]
+        with ShardedDB(name="test_db", filepath=DB_FILEPATH, shards=8) as db:
+            db.insert(key=keys[0], value=0)
+            result = db.insert_many(items={key: i for i, key in enumerate(keys)})
+            assert list(result.items.keys()) == keys[1:]
+            assert isinstance(result.errors[keys[0]], ObjectExistsError)
+            assert len({db._index(key) for key in keys}) == 8
+
+            result = db.select_many(keys=list(reversed(keys)) + ["missing"])
+            assert list(result.items.keys()) == list(reversed(keys))
+            assert result.items[keys[10]] == 10
+            assert isinstance(result.errors["missing"], ObjectNotFoundError)
+
+            assert db.scan(prefix="key_01").keys == keys[10:20]
+            assert sorted(db.iter_keys()) == keys
+            assert dict(db.iter_items(where=lambda key: key < "key_002")) == {
+                "key_000": 0,
+                "key_001": 1,
+            }
+            result = db.delete_many(keys=keys + ["missing"])
+            assert list(result.items.keys()) == keys
+            assert isinstance(result.errors["missing"], ObjectNotFoundError)
+            assert len(db.selectall()) == 0
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_shard_count(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        with ShardedDB(name="test_db", filepath=DB_FILEPATH, shards=4) as db:
+            db.insert_many(items={f"key_{i}": i for i in range(20)})
+        # The shard count is fixed at creation.
+        database = ShardedDB(name="test_db", filepath=DB_FILEPATH, shards=16)
+        assert database.shards == 4
+        with database.reading() as db:
+            assert len(list(db.iter_keys())) == 20
+        with pytest.raises(ValueError):
+            ShardedDB(name="test_db", filepath=DB_FILEPATH + "_new", shards=0)
+        # Copies reconnect to the same shards.
+        clone = pickle.loads(pickle.dumps(database))
+        with clone.reading() as db:
+            assert db.select(key="key_7") == 7
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_compact_stats(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = ShardedDB(name="test_db", filepath=DB_FILEPATH, shards=4)
+        with database as db:
+            db.insert_many(items={f"key_{i:03d}": os.urandom(4096) for i in range(100)})
+            db.delete_many(keys=[f"key_{i:03d}" for i in range(80)])
+            assert db.garbage() >= 80 * 4096
+        assert database.compact() >= 80 * 4096
+        with database.reading() as db:
+            assert len(list(db.iter_keys())) == 20
+        stats = database.stats()
+        assert stats["latency"]["insert_many"]["count"] == 1
+        assert stats["counters"]["bytes_written"] >= 100 * 4096
+        assert len(stats["shards"]) == 4
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_repo(self, datasets, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        repo = Repo(
+            name="sharded", location=os.path.dirname(DB_FILEPATH), engine="sharded", shards=4
+        )
+        repo.add_many(datasets)
+        assert sorted(repo.inventory()["name"]) == sorted(dataset.name for dataset in datasets)
+        assert repo.get(datasets[0].name).data.equals(datasets[0].data)
+        repo.remove(datasets[0].name)
+        assert not repo.exists(datasets[0].name)
+        assert repo._db.shards == 4
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
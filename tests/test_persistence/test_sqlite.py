@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_persistence/test_sqlite.py                                              #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Sunday October 18th 2026 09:00:00 am                                                #
+# Modified   : Sunday October 18th 2026 09:00:00 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import shutil
+import sqlite3
+import threading
+
+from atelier.persistence.sqlite import SQLiteDB
+from atelier.persistence.factory import DatabaseFactory
+from atelier.persistence.exceptions import (
+    ObjectExistsError,
+    ObjectNotFoundError,
+    ObjectDatabaseConnectionError,
+)
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+DB_FILEPATH = "tests/testdata/test_sqlite/test.db"
+
+
+@pytest.mark.sqlite
+class TestSQLiteDB:  # pragma: no cover
+    # ============================================================================================ #
+    def test_setup(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shutil.rmtree(os.path.dirname(DB_FILEPATH), ignore_errors=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_connect_context(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = SQLiteDB(name="test_db", filepath=DB_FILEPATH)
+        assert db.is_connected is False
+        with db as odb:
+            assert odb.is_connected is True
+            mode = odb._connection.execute("PRAGMA journal_mode").fetchone()[0]
+            assert mode == "wal"
+        assert odb.is_connected is False
+        assert isinstance(
+            DatabaseFactory.database("test_db", DB_FILEPATH, engine="sqlite"), SQLiteDB
+        )
+        with pytest.raises(ValueError):
+            DatabaseFactory.database("test_db", DB_FILEPATH, engine="oracle")
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_insert_select_exists(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        key = inspect.stack()[0][3] + "_1"
+        database = SQLiteDB(name="test_db", filepath=DB_FILEPATH)
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.insert(key=key, value=dataframe)
+
+        with database as db:
+            db.insert(key=key, value=dataframe)
+            assert db.exists(key=key)
+            assert db.exists(key="missing") is False
+            assert db.select(key=key).equals(dataframe)
+            with pytest.raises(ObjectExistsError):
+                db.insert(key=key, value=dataframe)
+            with pytest.raises(ObjectNotFoundError):
+                db.select(key="missing")
+
+        with pytest.raises(ObjectDatabaseConnectionError):
+            database.select(key=key)
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_update_delete_clear(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        key = inspect.stack()[0][3] + "_1"
+        d = {"some": "dictionary", "for": "update"}
+        with SQLiteDB(name="test_db", filepath=DB_FILEPATH) as db:
+            db.insert(key=key, value=dataframe)
+            db.update(key=key, value=d)
+            assert db.select(key=key) == d
+            with pytest.raises(ObjectNotFoundError):
+                db.update(key="missing", value=d)
+            db.delete(key=key)
+            assert db.exists(key=key) is False
+            with pytest.raises(ObjectNotFoundError):
+                db.delete(key=key)
+            for i in range(5):
+                db.insert(key=f"{key}_{i}", value=d)
+            assert len(db.selectall()) == 5
+            db.clear()
+            assert len(db.selectall()) == 0
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        keys = [inspect.stack()[0][3] + "_" + str(i) for i in range(1, 6)]
+        with SQLiteDB(name="test_db", filepath=DB_FILEPATH) as db:
+            db.insert(key=keys[0], value=dataframe)
+            result = db.insert_many(items={key: dataframe for key in keys})
+            assert list(result.items.keys()) == keys[1:]
+            assert isinstance(result.errors[keys[0]], ObjectExistsError)
+
+            result = db.select_many(keys=keys + ["missing"])
+            assert len(result.items) == 5
+            assert isinstance(result.errors["missing"], ObjectNotFoundError)
+
+            result = db.delete_many(keys=keys + ["missing"])
+            assert list(result.items.keys()) == keys
+            assert isinstance(result.errors["missing"], ObjectNotFoundError)
+            assert len(db.selectall()) == 0
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_concurrent_readers(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        n = 50
+        writer = SQLiteDB(name="test_db", filepath=DB_FILEPATH)
+        with writer as db:
+            db.insert(key="seed", value=dataframe)
+        errors = []
+
+        def read():
+            try:
+                with SQLiteDB(name="test_db", filepath=DB_FILEPATH) as reader:
+                    for _ in range(n):
+                        assert reader.select(key="seed").equals(dataframe)
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        with writer.session():
+            for reader in readers:
+                reader.start()
+            for i in range(n):
+                writer.insert(key=f"key_{i}", value={"i": i})
+            for reader in readers:
+                reader.join()
+        assert errors == []
+        with writer as db:
+            assert len(db.selectall()) == n + 1
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_iter(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        keys = [f"iter_{i}" for i in range(1, 6)]
+        database = SQLiteDB(name="test_db", filepath=DB_FILEPATH)
+        with database as db:
+            db.insert_many(items={key: dataframe for key in keys})
+            db.insert(key="other", value=dataframe.head(10))
+            assert sorted(db.iter_keys()) == sorted(keys + ["other"])
+            assert sorted(db.iter_keys(where=lambda key: key.startswith("iter_"))) == keys
+            items = db.iter_items(where=lambda key: key.startswith("iter_"))
+            key, value = next(items)
+            assert key in keys
+            assert value.equals(dataframe)
+            assert len(list(items)) == 4
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_scan(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = SQLiteDB(name="test_db", filepath=DB_FILEPATH)
+        keys = [f"sales_{year}_{month:02d}" for year in (2022, 2023) for month in range(1, 13)]
+        with database as db:
+            db.insert_many(items={key: {"key": key} for key in reversed(keys)})
+            db.insert(key="other", value=None)
+            db.delete(key="sales_2022_01")
+        with SQLiteDB(name="test_db", filepath=DB_FILEPATH).reading() as db:
+            assert db.scan(prefix="sales_2023_").keys == keys[12:]
+            assert db.scan(start="sales_2022_11", end="sales_2023_02").keys == keys[10:13]
+            assert db.scan(
+                prefix="sales_2022_", start="sales_2022_06", end="sales_2022_08"
+            ).keys == [
+                "sales_2022_06",
+                "sales_2022_07",
+            ]
+            assert db.scan().keys == ["other"] + keys[1:]
+            assert db.scan(prefix="missing").keys == []
+            # Pagination
+            pages = []
+            page = db.scan(prefix="sales_", limit=10)
+            pages.append(page.keys)
+            while page.next is not None:
+                page = db.scan(prefix="sales_", limit=10, after=page.next)
+                pages.append(page.keys)
+            assert [len(keys) for keys in pages] == [10, 10, 3]
+            assert sum(pages, []) == keys[1:]
+
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_compact(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        database = SQLiteDB(name="test_db", filepath=DB_FILEPATH)
+        with database as db:
+            db.insert_many(items={f"key_{i:03d}": os.urandom(4096) for i in range(100)})
+            db.delete_many(keys=[f"key_{i:03d}" for i in range(80)])
+            assert db.garbage() >= 80 * 4096
+        reclaimed = database.compact()
+        assert reclaimed >= 80 * 4096
+        with database as db:
+            assert db.garbage() == 0
+            assert len(list(db.iter_keys())) == 20
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_readonly(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        db = SQLiteDB(name="test_db", filepath=DB_FILEPATH)
+        with db.reading() as reader:
+            assert reader.is_connected is True
+            assert reader.exists(key="seed") is False
+        assert os.path.exists(DB_FILEPATH)
+        with db as odb:
+            odb.insert(key="seed", value=dataframe)
+        with db.reading() as reader:
+            assert reader.select(key="seed").equals(dataframe)
+            with pytest.raises(sqlite3.OperationalError):
+                reader.insert(key="other", value=dataframe)
+        # Reconnecting closes the existing connection rather than leaking it.
+        db.connect()
+        connection = db._connection
+        db.connect(readonly=True)
+        assert db._connection is not connection
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+        db.close()
+        with db as odb:
+            assert odb.exists(key="other") is False
+        self.test_setup(caplog)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -1,68 +1,118 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-# ================================================================================================ #
-# Project    : Atelier AI: Studio for AI Designers                                                 #
-# Version    : 0.1.4                                                                               #
-# Python     : 3.10.4                                                                              #
-# Filename   : /tests/test_utils/test_memory.py                                                    #
-# ------------------------------------------------------------------------------------------------ #
-# Author     : John James                                                                          #
-# Email      : john.james.ai.studio@gmail.com                                                      #
-# URL        : https://github.com/john-james-ai/atelier-ai                                         #
-# ------------------------------------------------------------------------------------------------ #
-# Created    : Saturday February 18th 2023 08:04:10 pm                                             #
-# Modified   : Saturday February 18th 2023 08:18:08 pm                                             #
-# ------------------------------------------------------------------------------------------------ #
-# License    : MIT License                                                                         #
-# Copyright  : (c) 2023 John James                                                                 #
-# ================================================================================================ #
-import inspect
-from datetime import datetime
-import pytest
-import logging
-
-from tests.testdata.mock_class import MockClass
-from atelier.utils.memory import get_size
-
-# ------------------------------------------------------------------------------------------------ #
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-# ------------------------------------------------------------------------------------------------ #
-double_line = f"\n{100 * '='}"
-single_line = f"\n{100 * '-'}"
-
-
-@pytest.mark.get_size
-class TestGetSize:  # pragma: no cover
-    # ============================================================================================ #
-    def test_get_size(self, caplog):
-        start = datetime.now()
-        logger.info(
-            "\n\nStarted {} {} at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                start.strftime("%I:%M:%S %p"),
-                start.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(double_line)
-        # ---------------------------------------------------------------------------------------- #
-        c = MockClass()
-        s = get_size(c)
-        assert s > 0
-        logger.info(f"Size of mock class is {s}.")
-
-        # ---------------------------------------------------------------------------------------- #
-        end = datetime.now()
-        duration = round((end - start).total_seconds(), 1)
-
-        logger.info(
-            "\nCompleted {} {} in {} seconds at {} on {}".format(
-                self.__class__.__name__,
-                inspect.stack()[0][3],
-                duration,
-                end.strftime("%I:%M:%S %p"),
-                end.strftime("%m/%d/%Y"),
-            )
-        )
-        logger.info(single_line)
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Atelier AI: Studio for AI Designers                                                 #
+# Version    : 0.1.4                                                                               #
+# Python     : 3.10.4                                                                              #
+# Filename   : /tests/test_utils/test_memory.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/atelier-ai                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Saturday February 18th 2023 08:04:10 pm                                             #
+# Modified   : Saturday February 18th 2023 08:18:08 pm                                             #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pympler.asizeof import asizeof
+
+from tests.testdata.mock_class import MockClass
+from atelier.utils.memory import estimate_size, get_size
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.get_size
+class TestGetSize:  # pragma: no cover
+    # ============================================================================================ #
+    def test_get_size(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        c = MockClass()
+        s = get_size(c)
+        assert s > 0
+        logger.info(f"Size of mock class is {s}.")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_estimate_size(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rows = 100000
+        df = pd.DataFrame(
+            {
+                "id": np.arange(rows),
+                "x": np.linspace(0, 1, rows),
+                "text": pd.Series([f"row {i}" for i in range(rows)], dtype=object),
+            }
+        )
+        estimate = estimate_size(df)
+        assert abs(estimate - asizeof(df)) / asizeof(df) < 0.05
+        assert estimate_size({"frame": df, "other": df}) < estimate * 1.01
+        assert estimate_size(df["x"].values) >= 8 * rows
+        assert estimate_size(df["x"].values[:10]) < 1000
+        assert estimate_size(pa.Table.from_pandas(df[["id", "x"]])) >= 16 * rows
+        assert estimate_size([1, "a", b"b"]) > 0
+        c = MockClass()
+        assert estimate_size(c) == asizeof(c)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)